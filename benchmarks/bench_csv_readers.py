@@ -0,0 +1,116 @@
+"""
+Compare the CSV readers of ParseSpiFileThread on a synthetic SPI export.
+
+    python -m benchmarks.bench_csv_readers --rows 1500000      # ~180 MB
+    python -m benchmarks.bench_csv_readers --file path/to/export.csv
+"""
+# Built-in Imports
+import argparse
+import os
+import tempfile
+import time
+
+# Data Science and Third Party Imports
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# User Imports
+from src.Models.Components.SpiComponentManager import SpiComponentManager
+from src.Models.Readers.SpiFileReader import SpiFileReader
+
+
+def make_spi_csv(file_path: str, rows: int, seed: int = 0):
+    """Write a CSV with the raw (CamelCase) headers of an SPI export."""
+    rng = np.random.default_rng(seed)
+    component_types = np.array(list("CDLQRUY"))
+    n_components = max(rows // 8, 1)
+    types = component_types[rng.integers(0, len(component_types), n_components)]
+    component_ids = np.char.add(types, np.arange(n_components).astype(str))
+    sizes = np.array([[0.4, 0.2], [0.6, 0.3], [1.0, 0.5], [1.6, 0.8], [2.0, 1.25]])
+
+    with open(file_path, "w", newline="") as f:
+        for start in range(0, rows, 500_000):
+            n = min(500_000, rows - start)
+            component = rng.integers(0, n_components, n)
+            size = sizes[component % len(sizes)]
+            pd.DataFrame({
+                "PadID": np.arange(start, start + n),
+                "ComponentID": component_ids[component],
+                "ComponentType": types[component],
+                "SizeMin": size[:, 0],
+                "SizeMax": size[:, 1],
+                "Volume": rng.random(n) * 150,
+                "RealVol": rng.integers(0, 5000, n),
+                "Area": rng.random(n) * 120,
+                "RealArea": rng.integers(0, 5000, n),
+                "PosX": rng.random(n) * 400,
+                "PosY": rng.random(n) * 300,
+                "Lineid": rng.choice(["SMT1", "SMT2"], n),
+                "PanelID": rng.choice(["1", "2", "3", "4"], n),
+                "IDNO": 1234567,
+                "ProductGroup": "NB",
+                "Result": rng.choice(["GOOD", "NG"], n),
+                "Height": rng.random(n) * 200,
+            }).to_csv(f, index=False, header=start == 0)
+
+
+def bench_pandas_full(file_path: str) -> SpiComponentManager:
+    # Previous behaviour: whole-file read_csv, then normalize and project
+    df = pd.read_csv(file_path)
+    df.columns = [SpiFileReader.to_snake_case(col) for col in df.columns]
+    manager = SpiComponentManager()
+    manager.extend(df[SpiFileReader.SPI_COMPONENT_COLS])
+    return manager
+
+
+def bench_engine(file_path: str, engine: str) -> SpiComponentManager:
+    manager = SpiComponentManager()
+    for batch in SpiFileReader.iter_csv_batches(file_path, engine):
+        manager.extend_arrow(batch)
+    len(manager.get_codes("pad_id"))  # Consolidate the appended blocks
+    return manager
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--file", help="Existing SPI csv export; a synthetic one is generated when omitted")
+    parser.add_argument("--rows", type=int, default=1_500_000, help="Rows of the synthetic export")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--threads", type=int, help="Size of the Arrow CPU thread pool (default: one per core)")
+    args = parser.parse_args()
+    if args.threads:
+        pa.set_cpu_count(args.threads)
+    print(f"Arrow CPU threads: {pa.cpu_count()}")
+
+    tmp_dir = None
+    file_path = args.file
+    if file_path is None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        file_path = os.path.join(tmp_dir.name, "spi.csv")
+        print(f"Generating {args.rows:,} rows ...")
+        make_spi_csv(file_path, args.rows)
+    size_mb = os.path.getsize(file_path) / 2 ** 20
+    print(f"{file_path}: {size_mb:.1f} MB")
+
+    cases = {
+        "pandas read_csv (full file)": lambda: bench_pandas_full(file_path),
+        "pandas chunked": lambda: bench_engine(file_path, "pandas"),
+        "pyarrow open_csv (streaming)": lambda: bench_engine(file_path, "pyarrow"),
+        "pyarrow read_csv (parallel)": lambda: bench_engine(file_path, "pyarrow-parallel"),
+    }
+    for name, func in cases.items():
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            manager = func()
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        print(f"{name:<30} best {best:7.2f} s   {size_mb / best:7.1f} MB/s   rows {len(manager):,}")
+
+    if tmp_dir is not None:
+        tmp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
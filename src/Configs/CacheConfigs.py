@@ -0,0 +1,4 @@
+# Proxy cache (normalized copies of SPI source files)
+PROXY_CACHE_SIZE_BUDGET = 4 * 1024 ** 3  # Bytes; least recently used proxies are evicted above this
+PROXY_CACHE_CONTENT_HASH = False  # Also key proxies by a hash of the file content (slower, survives mtime-preserving copies)
+PROXY_SCHEMA_VERSION = 1  # Bump whenever the normalized proxy layout changes
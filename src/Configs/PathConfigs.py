@@ -17,6 +17,8 @@ else:
 
 # Directory Paths
 LOGGER_PATH = os.path.join(APPDATA_DIR, "log")
+PROXY_CACHE_DIR = os.path.join(APPDATA_DIR, "proxy_cache")
+SESSION_SNAPSHOT_DIR = os.path.join(APPDATA_DIR, "session_snapshot")
 
 # File Paths
 QT_SETTINGS_PATH = os.path.join(APPDATA_DIR, "settings.ini")
@@ -0,0 +1,19 @@
+# Level of detail (zoomed-out board views)
+LOD_SCALE_THRESHOLD = 0.5  # View scales below this draw the component layers from a raster instead of vector circles
+LOD_MAX_RASTER_SIDE = 4096  # Pixels; caps the raster resolution (and memory) on very large canvases
+
+# Tile cache (panning and zooming above the LOD threshold)
+TILE_CACHE_ENABLED = True
+TILE_SIZE = 256  # Device pixels per tile side
+TILE_CACHE_BUDGET = 256 * 1024 ** 2  # Bytes; least recently used tiles are evicted above this
+
+# Virtualized items (zoomed-in inspection)
+VIRTUAL_ITEMS_ENABLED = True
+VIRTUAL_SCALE_THRESHOLD = 2.0  # View scales from this one up show one item per pad, only around the viewport
+VIRTUAL_MARGIN = 0.25  # Extra area materialized around the viewport, as a fraction of its size
+VIRTUAL_MAX_ITEMS = 20_000  # Above this many pads in range the tiles are used instead
+
+# Hover inspection
+HOVER_INTERVAL_MS = 16  # Pad lookups under the mouse run at most this often (about 60 Hz)
+HOVER_TOLERANCE_PX = 4  # Screen pixels beyond a pad's edge that still count as hovering it
+PAD_REINDEX_DELAY_MS = 500  # Without a pad index, the shown circles are re-indexed once layers stop arriving this long
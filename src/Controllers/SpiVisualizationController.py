@@ -1,18 +1,24 @@
 # Built-in Imports
+import copy
+import functools
 import os.path
 from typing import TYPE_CHECKING
-import numpy as np
+from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import QPushButton
 
+from src.Models.Components.SessionSnapshot import SessionSnapshot
 from src.Models.Components.SpiComponentManager import SpiComponentManager
 from src.Models.DataClasses.CanvasConfig import CanvasConfig
 from src.Models.Threads.ParseSpiFileThread import ParseSpiFileThread
+from src.Models.Threads.SaveSessionSnapshotThread import SaveSessionSnapshotThread
 from src.Models.Threads.UpdateComponentThread import UpdateComponentThread
 from src.Configs import COMPONENT_COLORS
+from src.Utils.QtUtils import CallTimerManager, TimeSlicedRunner, show_info_message
 from src.Utils.SystemVariable import SystemVariable
 from src.Views.SettingDialog import SettingDialog
 
 # Data Science and Third Party Imports
+import numpy as np
 
 # Machine Learning Imports
 
@@ -26,6 +32,8 @@ logger = logging.getLogger(__name__)
 
 # Type Checking
 if TYPE_CHECKING:
+    from src.Models.Components.SpiComponentView import SpiComponentView
+    from src.Models.Threads.ParseSpiFileThread import SpiChunk
     from src.Views.SubViews.SpiVisualizationSubView import SpiVisualizationSubView
     from src.Controllers.MainController import MainController
 
@@ -44,28 +52,67 @@ class SpiVisualizationController:
         # Spi Component Manager
         self._spi_component_manager = SpiComponentManager()
 
+        # Session snapshot of the last board, and the (file path, requested canvas config) of the pending parse
+        self._session_snapshot = SessionSnapshot()
+        self._snapshot_request: tuple[str, CanvasConfig] | None = None
+
         # thread
         self._parse_spi_file_thread = ParseSpiFileThread()
         self._update_component_thread = UpdateComponentThread()
+        self._save_session_snapshot_thread = SaveSessionSnapshotThread()
+        self._task_states: dict[str, tuple[str, int]] = {}
+
+        # Debounce file path typing, so only the settled path gets parsed
+        self._file_path_timer_manager = CallTimerManager(interval=500)
+
+        # Component layers are added to the scene in time slices, so the view stays interactive;
+        # visibility changes made meanwhile are re-applied once every layer exists
+        self._render_runner = TimeSlicedRunner()
+        self._visibility_changed_while_rendering = False
 
     def connect_signals(self):
         # Parse SPI file thread
         self._parse_spi_file_thread.update_progress_desc_signal.connect(self._ui.statusBar.showMessage)
+        self._parse_spi_file_thread.update_progress_signal.connect(self._on_progress_changed)
+        self._parse_spi_file_thread.chunk_loaded_signal.connect(self._on_spi_chunk_loaded)
         self._parse_spi_file_thread.next_step_signal.connect(
             lambda: self._update_component_thread.add_task(self._spi_component_manager, self.canvas_config)
         )
         self._parse_spi_file_thread.started.connect(lambda: self._ui.frameWorkspace.setEnabled(False))
         self._parse_spi_file_thread.finished.connect(lambda: self._ui.statusBar.showMessage("Done !"))
+        self._parse_spi_file_thread.task_failed_signal.connect(
+            lambda message: self._on_task_failed("Failed to load file", message)
+        )
+        self._parse_spi_file_thread.state_changed_signal.connect(
+            lambda state, depth: self._on_task_state_changed("Parse", state, depth)
+        )
 
         # Update Component thread
         self._update_component_thread.update_progress_desc_signal.connect(self._ui.statusBar.showMessage)
+        self._update_component_thread.update_progress_signal.connect(self._on_progress_changed)
+        self._update_component_thread.finished.connect(lambda: self._ui.progressBar.setVisible(False))
         self._update_component_thread.started.connect(lambda: self._ui.frameWorkspace.setEnabled(False))
         self._update_component_thread.finished.connect(lambda: self._ui.statusBar.showMessage("Done !"))
-        self._update_component_thread.finished.connect(self._on_parse_spi_file_finished)
+        self._update_component_thread.layout_finished_signal.connect(self._on_layout_finished)
         self._update_component_thread.finished.connect(lambda: self._ui.frameWorkspace.setEnabled(True))
+        self._update_component_thread.task_failed_signal.connect(
+            lambda message: self._on_task_failed("Failed to update components", message)
+        )
+        self._update_component_thread.state_changed_signal.connect(
+            lambda state, depth: self._on_task_state_changed("Layout", state, depth)
+        )
+
+        # Save session snapshot thread; a snapshot is only a cache, so a failed write is just logged
+        self._save_session_snapshot_thread.task_failed_signal.connect(
+            lambda message: logger.warning(f"Failed to save session snapshot: {message}")
+        )
 
         # Signal
-        self._ui.lineEditFilePath.textChanged.connect(self.parse_spi_file)
+        self._ui.lineEditFilePath.textChanged.connect(
+            lambda: self._file_path_timer_manager.start_timer(
+                "parse_spi_file", lambda: self.parse_spi_file(self._ui.lineEditFilePath.text())
+            )
+        )
         self._ui.treeWidgetSelectSize.toggle_changed_signal.connect(self._on_size_tree_widget_toggle_changed)
         self._ui.treeWidgetSelectSize.select_changed_signal.connect(self._on_size_tree_widget_select_changed)
         self._ui.treeWidgetSelectId.toggle_changed_signal.connect(self._on_id_tree_widget_toggle_changed)
@@ -76,6 +123,54 @@ class SpiVisualizationController:
         self._ui.comboBoxLineId.currentTextChanged.connect(self._on_combobox_changed)
         self._ui.comboboxPanelId.currentTextChanged.connect(self._on_combobox_changed)
 
+        # Progressive rendering
+        self._render_runner.progress_signal.connect(self._on_render_progress)
+        self._render_runner.finished_signal.connect(self._on_render_finished)
+
+        self._ui.graphicsView.pad_hovered_signal.connect(self._on_pad_hovered)
+        self._ui.graphicsView.region_selected_signal.connect(self._on_region_selected)
+
+    def _on_progress_changed(self, percent: int):
+        # -1 means the total is unknown; show a busy indicator
+        if percent < 0:
+            self._ui.progressBar.setRange(0, 0)
+        else:
+            self._ui.progressBar.setRange(0, 100)
+            self._ui.progressBar.setValue(percent)
+        self._ui.progressBar.setVisible(True)
+
+    def _on_task_failed(self, title: str, message: str):
+        # The follow-up task that normally re-enables the workspace will not run
+        self._ui.progressBar.setVisible(False)
+        self._ui.frameWorkspace.setEnabled(True)
+        show_info_message(message, title=title)
+
+    def _on_task_state_changed(self, name: str, state: str, queue_depth: int):
+        self._task_states[name] = (state, queue_depth)
+        self._ui.labelTaskState.setText("   ".join(
+            f"{task_name}: {task_state}" + (f" ({depth} queued)" if depth else "")
+            for task_name, (task_state, depth) in self._task_states.items()
+        ))
+
+    def _on_spi_chunk_loaded(self, chunk: "SpiChunk"):
+        # Preview the pads of a streamed chunk before the full pipeline finishes
+        if chunk.start == 0:
+            self._ui.graphicsView.clear_all()
+            self._show_canvas()
+
+        for code, component_type in enumerate(chunk.component_type.categories):
+            mask = chunk.component_type.codes == code
+            self._ui.graphicsView.add_preview_points(
+                chunk.pos_x[mask], chunk.pos_y[mask], COMPONENT_COLORS.get(component_type, "#000000")
+            )
+
+        if self.canvas_config.has_bounds:
+            self._ui.graphicsView.set_board_transform(*self.canvas_config.board_to_canvas)
+
+    def _on_layout_finished(self):
+        self._on_parse_spi_file_finished()
+        self._save_session_snapshot()
+
     def _on_parse_spi_file_finished(self):
         # Render Tree UI (Component Size)
         component_size_structure = self._spi_component_manager.get_component_size_structure()
@@ -90,12 +185,28 @@ class SpiVisualizationController:
         # Render All Components
         self._render_all_components()
 
+    def _board_circle_size(self) -> tuple[float, float]:
+        # Component radius and outline width are set in canvas pixels; items live in board units
+        scaling_ratio = self.canvas_config.scaling_ratio
+        return self.canvas_config.component_radius / scaling_ratio, 2 / scaling_ratio
+
+    def _show_canvas(self):
+        canvas_h, canvas_w = self.canvas_config.canvas_size[:2]
+        self._ui.graphicsView.set_canvas(canvas_w, canvas_h, QColor(*self.canvas_config.background_color))
+
+    def _apply_canvas_geometry(self):
+        """Re-map the rendered board onto a new canvas without rebuilding its items."""
+        self._show_canvas()
+        self._ui.graphicsView.set_board_transform(*self.canvas_config.board_to_canvas)
+        self._ui.graphicsView.set_circle_radius(*self._board_circle_size())
+
     def _render_all_components(self):
         logger.info("Rendering all components...")
         self._ui.graphicsView.clear_all()
-        self._ui.graphicsView.imshow(np.full(
-            self.canvas_config.canvas_size, self.canvas_config.background_color[::-1], dtype=np.uint8
-        ))
+        self._show_canvas()
+        self._ui.graphicsView.set_board_transform(*self.canvas_config.board_to_canvas)
+        # Circle obj_ids are manager rows, so hover and region selection query the manager's index
+        self._ui.graphicsView.set_pad_index(self._spi_component_manager.get_spatial_index())
 
         # Render project related params
         self._ui.labelIdno.setText(f"{self._spi_component_manager.get_idno()}")
@@ -105,163 +216,130 @@ class SpiVisualizationController:
         self._ui.comboBoxLineId.addItems(self._spi_component_manager.get_line_id_list() + ["All"])
         self._ui.comboboxPanelId.addItems(self._spi_component_manager.get_panel_id_list() + ["All"])
 
-        # Render All Components by Type and Id
-        type_visibility = self._ui.pushButtonSelectSize.isChecked()
-        id_visibility = self._ui.pushButtonSelectId.isChecked()
+        # The geometry is drawn once per (type, size, id, line, panel) layer. The size and
+        # id views address these layers through their layer info, so switching the
+        # selection mode only changes which condition drives the visibility.
+        # Layers shown with the current line / panel and tree checks are added first.
+        by_size = self._ui.pushButtonSelectSize.isChecked()
+        tree_widget = self._ui.treeWidgetSelectSize if by_size else self._ui.treeWidgetSelectId
+        checked = {name for name, status in tree_widget.get_all_item_check_status() if status}
+
+        def priority(layer: tuple) -> tuple[bool, bool]:
+            (component_type, size, component_id, line_id, panel_id), _ = layer
+            tree_name = f"{component_type}_{size if by_size else component_id}"
+            return not self._is_layer_in_filter(line_id, panel_id), tree_name not in checked
+
+        layers = sorted(self._spi_component_manager.iter_groups("layer"), key=priority)
+        self._visibility_changed_while_rendering = False
+        self._render_runner.start(functools.partial(self._add_component_layer, *layer) for layer in layers)
+
+    def _is_layer_in_filter(self, line_id: str, panel_id: str) -> bool:
         cur_line_id = self._ui.comboBoxLineId.currentText()
         cur_panel_id = self._ui.comboboxPanelId.currentText()
+        return (cur_line_id == line_id or cur_line_id == "All") and (cur_panel_id == panel_id or cur_panel_id == "All")
+
+    def _add_component_layer(self, group: tuple[str, str, str, str, str], components: "SpiComponentView"):
+        component_type, size, component_id, line_id, panel_id = group
+        radius, width = self._board_circle_size()
+        layer_name = f"{component_type}_{size}_{component_id}_{line_id}_{panel_id}"
+        self._ui.graphicsView.add_circles_to_layer(
+            layer_name,
+            layer_info={
+                "layer_name": layer_name,
+                "component_type": component_type,
+                "component_id": component_id,
+                "component_size": size,
+                "line_id": line_id,
+                "panel_id": panel_id,
+            },
+            centers=np.column_stack([components.pos_x, components.pos_y]),
+            radius=radius,
+            # obj_id is the manager row, so a hovered circle maps straight back to its component
+            obj_ids=components.indices,
+            color=COMPONENT_COLORS.get(component_type, "#000000"),
+            width=width,
+        )
+        self._ui.graphicsView.set_layer_visibility(layer_name, self._is_layer_in_filter(line_id, panel_id))
+
+    def _on_render_progress(self, done: int, total: int):
+        self._ui.progressBar.setRange(0, 100)
+        self._ui.progressBar.setValue(int(done * 100 / total) if total else 100)
+        self._ui.progressBar.setVisible(True)
+        self._ui.statusBar.showMessage(f"Rendering components ({done:,} / {total:,} layers)")
+
+    def _on_render_finished(self):
+        self._ui.progressBar.setVisible(False)
+        self._ui.statusBar.showMessage("Done !")
+        if self._visibility_changed_while_rendering:
+            self._visibility_changed_while_rendering = False
+            self._on_combobox_changed()
+
+    def _on_pad_hovered(self, row):
+        if row is None or row >= len(self._spi_component_manager):
+            return
+        component = self._spi_component_manager.get_component(int(row))
+        self._ui.graphicsView.show_hover_info(
+            f"{component.component_id} ({component.component_type} {component.size})\n"
+            f"Pad ID: {component.pad_id}\n"
+            f"Volume: {component.volume:.2f}\n"
+            f"Area: {component.area:.2f}"
+        )
 
-        # Render All Components by Type
-        layer_info = {}
-        for component_type, size, components in self._spi_component_manager.iter_components_by_size():
-            for component in components:
-                layer_name = f"{component_type}_{size}_{component.lineid}_{component.panel_id}"
-                if layer_name not in layer_info:
-                    layer_info[layer_name] = {
-                        "layer_info": {
-                            "layer_name": layer_name,
-                            "component_type": component_type,
-                            "component_id": None,
-                            "component_size": size,
-                            "line_id": component.lineid,
-                            "panel_id": component.panel_id,
-                        },
-                        "shapes": {"circle": []},
-                        "color": COMPONENT_COLORS.get(component_type, "#000000"),
-                        "visible": (
-                            type_visibility
-                            and (cur_line_id == component.lineid or cur_line_id == "All")
-                            and (cur_panel_id == component.panel_id or cur_panel_id == "All")
-                        ),
-                    }
-
-                layer_info[layer_name]["shapes"]["circle"].append(
-                    ((component.canvas_pos_x, component.canvas_pos_y, self.canvas_config.component_radius), component.pad_id)
-                )
-
-        for layer_name, kwargs in layer_info.items():
-            visibility = kwargs.pop("visible", True)
-            self._ui.graphicsView.add_items_to_layer(layer_name, **kwargs)
-            self._ui.graphicsView.set_layer_visibility(layer_name, visibility)
-
-        # Render All Components by Id
-        layer_info = {}
-        for component_type, component_id, components in self._spi_component_manager.iter_components_by_id():
-            for component in components:
-                layer_name = f"{component_type}_{component_id}_{component.lineid}_{component.panel_id}"
-                if layer_name not in layer_info:
-                    layer_info[layer_name] = {
-                        "layer_info": {
-                            "layer_name": layer_name,
-                            "component_type": component_type,
-                            "component_id": component_id,
-                            "component_size": None,
-                            "line_id": component.lineid,
-                            "panel_id": component.panel_id,
-                        },
-                        "shapes": {"circle": []},
-                        "color": COMPONENT_COLORS.get(component_type, "#000000"),
-                        "visible": (
-                            id_visibility
-                            and (cur_line_id == component.lineid or cur_line_id == "All")
-                            and (cur_panel_id == component.panel_id or cur_panel_id == "All")
-                        ),
-                    }
-
-                layer_info[layer_name]["shapes"]["circle"].append(
-                    ((component.canvas_pos_x, component.canvas_pos_y, self.canvas_config.component_radius), component.pad_id)
-                )
-
-        for layer_name, kwargs in layer_info.items():
-            visibility = kwargs.pop("visible", True)
-            self._ui.graphicsView.add_items_to_layer(layer_name, **kwargs)
-            self._ui.graphicsView.set_layer_visibility(layer_name, visibility)
-
-        self._ui.graphicsView.layer_info_flush()
+    def _on_region_selected(self, rows: np.ndarray, finished: bool):
+        rows = np.asarray(rows, dtype=np.int64)
+        if not finished:
+            self._ui.statusBar.showMessage(f"Selecting {len(rows):,} pads")
+            return
+        self._ui.statusBar.showMessage(f"Selected {len(rows):,} pads")
+        self._ui.regionStatisticsDialog.show_statistics(
+            self._spi_component_manager.get_statistics(rows), self._spi_component_manager.get_components(rows)
+        )
 
     def _on_size_tree_widget_toggle_changed(self, turned_on: list[str], turned_off: list[str]):
-        for type_size in turned_on:
-            component_type, component_size = type_size.split("_")
-            self._ui.graphicsView.set_layer_visibility_with_condition({
-                "component_type": component_type,
-                "component_size": component_size,
-                **self._get_combobox_conditions(),
-            }, True)
-
-        for type_size in turned_off:
-            component_type, component_size = type_size.split("_")
-            self._ui.graphicsView.set_layer_visibility_with_condition({
-                "component_type": component_type,
-                "component_size": component_size,
-                **self._get_combobox_conditions(),
-            }, False)
+        self._visibility_changed_while_rendering |= self._render_runner.is_running
+        self._ui.graphicsView.set_layer_visibility_with_conditions(
+            [(self._get_size_conditions(type_size), True) for type_size in turned_on]
+            + [(self._get_size_conditions(type_size), False) for type_size in turned_off]
+        )
 
     def _on_size_tree_widget_select_changed(self, added: list[str], removed: list[str]):
-        for type_size in added:
-            component_type, component_size = type_size.split("_")
-            self._ui.graphicsView.set_layer_highlight_with_condition({
-                "component_type": component_type,
-                "component_size": component_size,
-                **self._get_combobox_conditions(),
-            }, True)
-        for type_size in removed:
-            component_type, component_size = type_size.split("_")
-            self._ui.graphicsView.set_layer_highlight_with_condition({
-                "component_type": component_type,
-                "component_size": component_size,
-                **self._get_combobox_conditions(),
-            }, False)
+        self._ui.graphicsView.set_layer_highlight_with_conditions(
+            [(self._get_size_conditions(type_size), True) for type_size in added]
+            + [(self._get_size_conditions(type_size), False) for type_size in removed]
+        )
 
     def _on_id_tree_widget_toggle_changed(self, turned_on: list[str], turned_off: list[str]):
-        for type_id in turned_on:
-            component_type, component_id = type_id.split("_")
-            self._ui.graphicsView.set_layer_visibility_with_condition({
-                "component_type": component_type,
-                "component_id": component_id,
-                **self._get_combobox_conditions(),
-            }, True)
-
-        for type_id in turned_off:
-            component_type, component_id = type_id.split("_")
-            self._ui.graphicsView.set_layer_visibility_with_condition({
-                "component_type": component_type,
-                "component_id": component_id,
-                **self._get_combobox_conditions(),
-            }, False)
+        self._visibility_changed_while_rendering |= self._render_runner.is_running
+        self._ui.graphicsView.set_layer_visibility_with_conditions(
+            [(self._get_id_conditions(type_id), True) for type_id in turned_on]
+            + [(self._get_id_conditions(type_id), False) for type_id in turned_off]
+        )
 
     def _on_id_tree_widget_select_changed(self, added: list[str], removed: list[str]):
-        for type_id in added:
-            component_type, component_id = type_id.split("_")
-            self._ui.graphicsView.set_layer_highlight_with_condition({
-                "component_type": component_type,
-                "component_id": component_id,
-                **self._get_combobox_conditions(),
-            }, True)
-        for type_id in removed:
-            component_type, component_id = type_id.split("_")
-            self._ui.graphicsView.set_layer_highlight_with_condition({
-                "component_type": component_type,
-                "component_id": component_id,
-                **self._get_combobox_conditions(),
-            }, False)
+        self._ui.graphicsView.set_layer_highlight_with_conditions(
+            [(self._get_id_conditions(type_id), True) for type_id in added]
+            + [(self._get_id_conditions(type_id), False) for type_id in removed]
+        )
 
     def _re_render_graphics_view_by_size(self):
-        for type_size, status in self._ui.treeWidgetSelectSize.get_all_item_check_status():
-            component_type, component_size = type_size.split("_")
-            self._ui.graphicsView.set_layer_visibility_with_condition({
-                "component_type": component_type,
-                "component_size": component_size,
-                **self._get_combobox_conditions(),
-            }, status)
+        self._ui.graphicsView.set_layer_visibility_with_conditions([
+            (self._get_size_conditions(type_size), status)
+            for type_size, status in self._ui.treeWidgetSelectSize.get_all_item_check_status()
+        ])
 
     def _re_render_graphics_view_by_id(self):
-        for type_id, status in self._ui.treeWidgetSelectId.get_all_item_check_status():
-            component_type, component_id = type_id.split("_")
-            self._ui.graphicsView.set_layer_visibility_with_condition({
-                "component_type": component_type,
-                "component_id": component_id,
-                **self._get_combobox_conditions(),
-            }, status)
+        self._ui.graphicsView.set_layer_visibility_with_conditions([
+            (self._get_id_conditions(type_id), status)
+            for type_id, status in self._ui.treeWidgetSelectId.get_all_item_check_status()
+        ])
+
+    def _get_size_conditions(self, type_size: str) -> dict:
+        component_type, component_size = type_size.split("_")
+        return {"component_type": component_type, "component_size": component_size, **self._get_combobox_conditions()}
+
+    def _get_id_conditions(self, type_id: str) -> dict:
+        component_type, component_id = type_id.split("_")
+        return {"component_type": component_type, "component_id": component_id, **self._get_combobox_conditions()}
 
     def _get_combobox_conditions(self):
         line_id = self._ui.comboBoxLineId.currentText()
@@ -279,56 +357,118 @@ class SpiVisualizationController:
         """
         if not checked:
              return
-
-        if button == self._ui.pushButtonSelectId:
-            self._ui.stackedWidgetSelectionMode.setCurrentWidget(self._ui.pageSelectId)
-            self._ui.graphicsView.close_layer("component_size")
-            self._ui.treeWidgetSelectId.clearSelection()
-            self._re_render_graphics_view_by_id()
-        elif button == self._ui.pushButtonSelectSize:
-            self._ui.stackedWidgetSelectionMode.setCurrentWidget(self._ui.pageSelectSize)
-            self._ui.graphicsView.close_layer("component_id")
-            self._ui.treeWidgetSelectSize.clearSelection()
-            self._re_render_graphics_view_by_size()
-        else:
-            raise ValueError("Invalid button clicked.")
+        self._visibility_changed_while_rendering |= self._render_runner.is_running
+
+        # Hiding every layer and showing the selected ones again is applied as the net change
+        with self._ui.graphicsView.batch_update():
+            if button == self._ui.pushButtonSelectId:
+                self._ui.stackedWidgetSelectionMode.setCurrentWidget(self._ui.pageSelectId)
+                self._ui.graphicsView.close_layer("component_size")
+                # Layers are shared by both modes, so drop the highlight of the other mode
+                self._ui.graphicsView.set_layer_highlight_with_condition({}, False)
+                self._ui.treeWidgetSelectId.clearSelection()
+                self._re_render_graphics_view_by_id()
+            elif button == self._ui.pushButtonSelectSize:
+                self._ui.stackedWidgetSelectionMode.setCurrentWidget(self._ui.pageSelectSize)
+                self._ui.graphicsView.close_layer("component_id")
+                self._ui.graphicsView.set_layer_highlight_with_condition({}, False)
+                self._ui.treeWidgetSelectSize.clearSelection()
+                self._re_render_graphics_view_by_size()
+            else:
+                raise ValueError("Invalid button clicked.")
 
     def _on_combobox_changed(self):
-        if self._ui.pushButtonSelectSize.isChecked():
-            self._ui.graphicsView.close_layer("component_size")
-            self._re_render_graphics_view_by_size()
-        elif self._ui.pushButtonSelectId.isChecked():
-            self._ui.graphicsView.close_layer("component_id")
-            self._re_render_graphics_view_by_id()
-        else:
-            raise ValueError("Invalid button clicked.")
+        self._visibility_changed_while_rendering |= self._render_runner.is_running
+        with self._ui.graphicsView.batch_update():
+            if self._ui.pushButtonSelectSize.isChecked():
+                self._ui.graphicsView.close_layer("component_size")
+                self._re_render_graphics_view_by_size()
+            elif self._ui.pushButtonSelectId.isChecked():
+                self._ui.graphicsView.close_layer("component_id")
+                self._re_render_graphics_view_by_id()
+            else:
+                raise ValueError("Invalid button clicked.")
 
     def parse_spi_file(self, path: str):
         if os.path.exists(path):
             self.canvas_config = self._setting_dialog.export_canvas_config()
-            self._parse_spi_file_thread.add_task(path, self._spi_component_manager, self.canvas_config)
+            if self._restore_session_snapshot(path):
+                return
+            self._queue_parse_spi_file(path)
+
+    def _queue_parse_spi_file(self, path: str):
+        # The layout and rendering of the superseded file must not run against the reloading manager
+        self._update_component_thread.cancel(self._spi_component_manager)
+        self._render_runner.cancel()
+        # Hover and region selection read the manager, which the parse worker is about to clear and refill
+        self._ui.graphicsView.clear_all()
+        self._ui.regionStatisticsDialog.hide()
+        self._snapshot_request = (path, copy.deepcopy(self.canvas_config))
+        self._parse_spi_file_thread.add_task(path, self._spi_component_manager, self.canvas_config)
+
+    def _relayout_components(self, requested_canvas_config: CanvasConfig):
+        # Geometry changed: move the rendered board with one transform, no parse and no item rebuild
+        path = self._ui.lineEditFilePath.text()
+        if self._parse_spi_file_thread.is_running or len(self._spi_component_manager) == 0:
+            self.canvas_config = requested_canvas_config
+            self._queue_parse_spi_file(path)
+            return
+
+        self._apply_canvas_geometry()
+        # Canvas positions are derived from this transform, so no per-pad work either
+        self._spi_component_manager.set_canvas_transform(*self.canvas_config.board_to_canvas)
+        self._snapshot_request = (path, requested_canvas_config)
+        self._save_session_snapshot()
+
+    def _restore_session_snapshot(self, path: str) -> bool:
+        # Never swap the manager's data under a running pipeline, nor read a snapshot being written
+        if (
+            self._parse_spi_file_thread.is_running
+            or self._update_component_thread.is_running
+            or self._save_session_snapshot_thread.is_running
+        ):
+            return False
+        if not self._session_snapshot.restore(path, self._spi_component_manager, self.canvas_config):
+            return False
+
+        self._ui.statusBar.showMessage(f"Restored session snapshot: {path}")
+        self._on_parse_spi_file_finished()
+        return True
+
+    def _save_session_snapshot(self):
+        if self._snapshot_request is None:
+            return
+
+        path, requested_canvas_config = self._snapshot_request
+        self._snapshot_request = None
+        # Only the capture runs here; the files are written on the worker
+        data = self._session_snapshot.capture(
+            path, self._spi_component_manager, self.canvas_config, requested_canvas_config
+        )
+        self._save_session_snapshot_thread.add_task(self._session_snapshot, data)
 
     def on_set_canvas_clicked(self):
         new_canvas_config = self._setting_dialog.exec_with_params(self.canvas_config)
         if new_canvas_config is None:
             return
 
+        # Bounds only depend on the data; fit the requested canvas to them before comparing
+        requested_canvas_config = copy.deepcopy(new_canvas_config)
+        new_canvas_config.copy_bounds_from(self.canvas_config)
+        if new_canvas_config.has_bounds:
+            new_canvas_config.fit_canvas_to_components()
+
         self._ui.graphicsView.setEnabled(False)
         run_mode = self.canvas_config.compare(new_canvas_config)
         self.canvas_config = new_canvas_config
         if run_mode == 1:
-            self._parse_spi_file_thread.add_task(
-                self._ui.lineEditFilePath.text(), self._spi_component_manager, self.canvas_config
-            )
+            self._relayout_components(requested_canvas_config)
         elif run_mode == 2:
-            self._render_all_components()
+            self._ui.graphicsView.set_circle_radius(*self._board_circle_size())
         elif run_mode == 3:
-            self._ui.graphicsView.imshow(np.full(
-                self.canvas_config.canvas_size, self.canvas_config.background_color[::-1], dtype=np.uint8
-            ))
+            self._ui.graphicsView.set_canvas_color(QColor(*self.canvas_config.background_color))
         self._ui.graphicsView.setEnabled(True)
 
 
-
 if __name__ == '__main__':
     ...
\ No newline at end of file
@@ -0,0 +1,202 @@
+# Built-in Imports
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Iterable, Iterator
+
+# Data Science and Third Party Imports
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# User Imports
+from src.Configs import PROXY_CACHE_DIR, CacheConfigs
+
+# Logger
+import logging
+logger = logging.getLogger(__name__)
+
+
+class ProxyCache:
+    """
+    Normalized parquet copies of SPI source files, stored under PROXY_CACHE_DIR.
+
+    A proxy is keyed by the source path, size, mtime, the proxy schema version and
+    optionally a content hash, so an edited source never serves stale data. A JSON
+    manifest records every proxy and its last access time; proxies are evicted in
+    LRU order once the cache exceeds its size budget. Lookups only update the
+    access times in memory; the manifest is rewritten when a proxy is committed,
+    evicted or cleared.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(
+        self,
+        cache_dir: str = PROXY_CACHE_DIR,
+        size_budget: int = CacheConfigs.PROXY_CACHE_SIZE_BUDGET,
+        use_content_hash: bool = CacheConfigs.PROXY_CACHE_CONTENT_HASH,
+        schema_version: int = CacheConfigs.PROXY_SCHEMA_VERSION,
+    ):
+        self.cache_dir = cache_dir
+        self.size_budget = size_budget
+        self.use_content_hash = use_content_hash
+        self.schema_version = schema_version
+        self._lock = threading.RLock()
+        self._manifest_path = os.path.join(cache_dir, self.MANIFEST_NAME)
+        os.makedirs(cache_dir, exist_ok=True)
+        self._entries: dict[str, dict] = self._load_manifest()
+
+    def make_key(self, source_path: str) -> str:
+        stat = os.stat(source_path)
+        parts = [os.path.normcase(os.path.abspath(source_path)), stat.st_size, stat.st_mtime_ns, self.schema_version]
+        if self.use_content_hash:
+            parts.append(self._content_hash(source_path))
+        return hashlib.sha1("|".join(map(str, parts)).encode("utf-8")).hexdigest()
+
+    def lookup(self, source_path: str, key: str | None = None) -> str | None:
+        """Return the proxy path for the current version of `source_path`, or None."""
+        key = key or self.make_key(source_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            proxy_path = os.path.join(self.cache_dir, entry["file"])
+            if not os.path.exists(proxy_path):
+                del self._entries[key]
+                return None
+
+            entry["last_access"] = time.time()
+            return proxy_path
+
+    def reserve(self) -> str:
+        """Return a temporary path to write a proxy to before commit()."""
+        return os.path.join(self.cache_dir, f"{uuid.uuid4().hex}.tmp")
+
+    def commit(self, source_path: str, written_path: str, key: str | None = None) -> str:
+        """
+        Move a proxy written to a reserve() path into the cache and record it.
+        Pass the `key` computed before reading the source so a file edited during
+        the conversion is not recorded under its new version.
+        """
+        key = key or self.make_key(source_path)
+        file_name = f"{key}.parquet"
+        proxy_path = os.path.join(self.cache_dir, file_name)
+        os.replace(written_path, proxy_path)
+
+        source = os.path.normcase(os.path.abspath(source_path))
+        with self._lock:
+            # Older versions of the same source are never served again
+            for stale_key in [k for k, e in self._entries.items() if e["source"] == source and k != key]:
+                self._remove(stale_key)
+
+            self._entries[key] = {
+                "source": source,
+                "file": file_name,
+                "bytes": os.path.getsize(proxy_path),
+                "last_access": time.time(),
+            }
+            self._evict()
+            self._save_manifest()
+        return proxy_path
+
+    def store_table(self, source_path: str, table: pa.Table, key: str | None = None) -> str:
+        written_path = self.reserve()
+        pq.write_table(table, written_path)
+        return self.commit(source_path, written_path, key)
+
+    def write_through(
+        self, source_path: str, batches: Iterable[pa.RecordBatch], schema: pa.Schema, key: str | None = None
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Yield `batches` unchanged while appending them to a new proxy, which is
+        committed once the source is fully consumed. An interrupted read leaves no
+        proxy behind; a failing write only stops the caching, never the read.
+        """
+        key = key or self.make_key(source_path)
+        written_path = self.reserve()
+        try:
+            writer = pq.ParquetWriter(written_path, schema)
+        except OSError as e:
+            logger.warning(f"Failed to create proxy file for {source_path}: {e}")
+            writer = None
+
+        try:
+            for batch in batches:
+                if writer is not None:
+                    try:
+                        writer.write_batch(batch)
+                    except OSError as e:
+                        logger.warning(f"Failed to write proxy file for {source_path}: {e}")
+                        writer.close()
+                        writer = None
+                        self._discard(written_path)
+                yield batch
+
+            if writer is not None:
+                writer.close()
+                writer = None
+                self.commit(source_path, written_path, key)
+        finally:
+            if writer is not None:
+                writer.close()
+                self._discard(written_path)
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(entry["bytes"] for entry in self._entries.values())
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+            self._save_manifest()
+
+    def _evict(self):
+        total = sum(entry["bytes"] for entry in self._entries.values())
+        for key in sorted(self._entries, key=lambda k: self._entries[k]["last_access"]):
+            if total <= self.size_budget:
+                break
+            total -= self._entries[key]["bytes"]
+            self._remove(key)
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        try:
+            os.remove(os.path.join(self.cache_dir, entry["file"]))
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _discard(written_path: str):
+        try:
+            os.remove(written_path)
+        except OSError:
+            pass
+
+    def _load_manifest(self) -> dict[str, dict]:
+        try:
+            with open(self._manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)["entries"]
+        except FileNotFoundError:
+            return {}
+        except (ValueError, KeyError):
+            logger.warning(f"Proxy cache manifest is corrupted, starting empty: {self._manifest_path}")
+            return {}
+
+    def _save_manifest(self):
+        tmp_path = f"{self._manifest_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"entries": self._entries}, f)
+        os.replace(tmp_path, self._manifest_path)
+
+    @staticmethod
+    def _content_hash(file_path: str, block_size: int = 1 << 20) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, "rb") as f:
+            while block := f.read(block_size):
+                digest.update(block)
+        return digest.hexdigest()
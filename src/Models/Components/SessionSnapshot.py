@@ -0,0 +1,215 @@
+# Built-in Imports
+import json
+import os
+import uuid
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Callable
+
+# Data Science and Third Party Imports
+import numpy as np
+import pyarrow as pa
+
+# User Imports
+from src.Configs import SESSION_SNAPSHOT_DIR
+
+if TYPE_CHECKING:
+    from src.Models.Components.SpiComponentManager import SpiComponentManager
+    from src.Models.DataClasses.CanvasConfig import CanvasConfig
+
+# Logger
+import logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SessionSnapshotData:
+    """A snapshot captured from the manager, ready to be written on a worker thread."""
+    files: dict[str, str]                           # Role -> file name
+    tables: dict[str, dict[str, np.ndarray]]        # File name -> read-only columns
+    meta: dict
+
+
+class SessionSnapshot:
+    """
+    Snapshot of the last loaded board, so reopening it skips parse, layout and grouping.
+
+    The encoded component columns and the CSR group indexes are written as Arrow
+    IPC files and memory-mapped on restore: the manager works on read-only views of
+    the mapped files instead of copies in the Python heap. Canvas positions are not
+    stored; they follow from the restored canvas config.
+    meta.json holds the categories, board metadata and the signature of the source
+    file and canvas settings the snapshot was built for.
+    """
+
+    META_NAME = "meta.json"
+    VERSION = 3
+
+    def __init__(self, snapshot_dir: str = SESSION_SNAPSHOT_DIR):
+        self.snapshot_dir = snapshot_dir
+        self._meta_path = os.path.join(snapshot_dir, self.META_NAME)
+        os.makedirs(snapshot_dir, exist_ok=True)
+
+    @staticmethod
+    def source_signature(source_path: str) -> dict:
+        stat = os.stat(source_path)
+        return {
+            "path": os.path.normcase(os.path.abspath(source_path)),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+    @staticmethod
+    def canvas_signature(canvas_config: "CanvasConfig") -> dict:
+        # Settings the canvas positions depend on, as requested before auto sizing
+        return {
+            "canvas_mode": canvas_config.canvas_mode,
+            "canvas_size": list(canvas_config.canvas_size),
+            "margin": canvas_config.margin,
+        }
+
+    def capture(
+        self,
+        source_path: str,
+        spi_component_manager: "SpiComponentManager",
+        canvas_config: "CanvasConfig",
+        requested_canvas_config: "CanvasConfig",
+    ) -> SessionSnapshotData:
+        """
+        Take what write() needs from the manager. The manager replaces its arrays instead
+        of modifying them, so read-only views stay a consistent copy while it reloads.
+        """
+        tag = uuid.uuid4().hex
+        files = {"components": f"{tag}_components.arrow"}
+
+        columns = {name: self._frozen(spi_component_manager.get_codes(name)) for name in spi_component_manager.column_names}
+        tables = {}
+        for grouping in spi_component_manager.GROUPINGS:
+            keys, order, offsets = spi_component_manager.get_group_index(grouping)
+            columns[f"{grouping}_order"] = self._frozen(order)
+            files[grouping] = f"{tag}_{grouping}.arrow"
+            tables[files[grouping]] = {"key": self._frozen(keys), "start": self._frozen(offsets[:-1])}
+        tables[files["components"]] = columns
+
+        meta = {
+            "version": self.VERSION,
+            "source": self.source_signature(source_path),
+            "canvas_request": self.canvas_signature(requested_canvas_config),
+            "canvas_config": asdict(canvas_config),
+            "files": files,
+            "idno": spi_component_manager.get_idno(),
+            "product_name": spi_component_manager.get_product_name(),
+            "line_id_list": list(spi_component_manager.get_line_id_list()),
+            "panel_id_list": list(spi_component_manager.get_panel_id_list()),
+            "categories": {
+                name: list(spi_component_manager.get_categories(name))
+                for name in spi_component_manager.CATEGORICAL_FIELDS + ("size",)
+            },
+        }
+        return SessionSnapshotData(files, tables, meta)
+
+    def write(self, data: SessionSnapshotData, check_cancelled: Callable[[], None] = lambda: None):
+        """
+        Write a captured snapshot; runs on a worker. meta.json is replaced last, so an
+        interrupted write leaves the previous snapshot in place. check_cancelled() is
+        called between files.
+        """
+        for file_name, columns in data.tables.items():
+            check_cancelled()
+            self._write(file_name, columns)
+
+        check_cancelled()
+        tmp_path = f"{self._meta_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data.meta, f)
+        os.replace(tmp_path, self._meta_path)
+
+        # Files of older snapshots may still be mapped (and locked on Windows); retry them next time
+        for file_name in os.listdir(self.snapshot_dir):
+            if file_name.endswith(".arrow") and file_name not in data.files.values():
+                try:
+                    os.remove(os.path.join(self.snapshot_dir, file_name))
+                except OSError:
+                    pass
+
+    def restore(
+        self, source_path: str, spi_component_manager: "SpiComponentManager", canvas_config: "CanvasConfig"
+    ) -> bool:
+        """
+        Load the snapshot into the manager if it was built from the current version of
+        `source_path` with the same canvas layout settings. The canvas size and bounds
+        of `canvas_config` are updated; colors and radius are kept. Returns False on a miss.
+        """
+        meta = self._load_meta()
+        if (
+            meta is None
+            or meta.get("version") != self.VERSION
+            or meta.get("source") != self.source_signature(source_path)
+            or meta.get("canvas_request") != self.canvas_signature(canvas_config)
+        ):
+            return False
+
+        try:
+            components = self._read(meta["files"]["components"])
+            group_indexes = {grouping: self._read(meta["files"][grouping]) for grouping in spi_component_manager.GROUPINGS}
+        except (OSError, KeyError, pa.ArrowInvalid) as e:
+            logger.warning(f"Failed to read session snapshot: {e}")
+            return False
+
+        spi_component_manager.clear()
+        spi_component_manager.load_columns(
+            {name: self._to_numpy(components.column(name)) for name in spi_component_manager.column_names},
+            meta["categories"],
+        )
+        for grouping, group_index in group_indexes.items():
+            spi_component_manager.set_group_index(
+                grouping,
+                self._to_numpy(group_index.column("key")),
+                self._to_numpy(components.column(f"{grouping}_order")),
+                np.append(self._to_numpy(group_index.column("start")), components.num_rows),
+            )
+        spi_component_manager.set_idno(meta["idno"])
+        spi_component_manager.set_product_name(meta["product_name"])
+        spi_component_manager.set_line_id_list(*meta["line_id_list"])
+        spi_component_manager.set_panel_id_list(*meta["panel_id_list"])
+
+        saved_config = meta["canvas_config"]
+        canvas_config.canvas_size = tuple(saved_config["canvas_size"])
+        canvas_config.component_x_min = saved_config["component_x_min"]
+        canvas_config.component_x_max = saved_config["component_x_max"]
+        canvas_config.component_y_min = saved_config["component_y_min"]
+        canvas_config.component_y_max = saved_config["component_y_max"]
+        spi_component_manager.set_canvas_transform(*canvas_config.board_to_canvas)
+        return True
+
+    def _write(self, file_name: str, columns: dict[str, np.ndarray]):
+        table = pa.table({name: pa.array(values) for name, values in columns.items()})
+        with pa.OSFile(os.path.join(self.snapshot_dir, file_name), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    def _read(self, file_name: str) -> pa.Table:
+        source = pa.memory_map(os.path.join(self.snapshot_dir, file_name), "r")
+        return pa.ipc.open_file(source).read_all()
+
+    @staticmethod
+    def _frozen(values: np.ndarray) -> np.ndarray:
+        view = values.view()
+        view.flags.writeable = False
+        return view
+
+    @staticmethod
+    def _to_numpy(column: pa.ChunkedArray) -> np.ndarray:
+        # A single null-free chunk maps straight onto the file buffer
+        if column.num_chunks == 1:
+            return column.chunk(0).to_numpy(zero_copy_only=True)
+        return column.to_numpy()
+
+    def _load_meta(self) -> dict | None:
+        try:
+            with open(self._meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            logger.warning(f"Session snapshot meta is corrupted: {self._meta_path}")
+            return None
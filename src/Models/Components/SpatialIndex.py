@@ -0,0 +1,179 @@
+# Built-in Imports
+import math
+
+# Data Science and Third Party Imports
+import numpy as np
+
+
+class SpatialIndex:
+    """
+    Uniform grid over 2-D points.
+
+    Points are bucketed into square cells and stored cell by cell in CSR form: the
+    rows of cell c are order[offsets[c]:offsets[c + 1]]. Cells of one grid row are
+    adjacent in that order, so a rectangle query reads one contiguous slice per row
+    before the exact bounds check.
+    """
+
+    POINTS_PER_CELL = 4     # Target average occupancy when the cell size is derived from the data
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray, cell_size: float | None = None):
+        self._requested_cell_size = cell_size
+        self._build(xs, ys)
+
+    def _build(self, xs: np.ndarray, ys: np.ndarray):
+        self.xs = np.asarray(xs, dtype=np.float64)
+        self.ys = np.asarray(ys, dtype=np.float64)
+        self._grid_points = len(self.xs)  # Points the grid was sized for
+        cell_size = self._requested_cell_size
+
+        if len(self.xs):
+            self.x_min, self.y_min = float(self.xs.min()), float(self.ys.min())
+            width = float(self.xs.max()) - self.x_min
+            height = float(self.ys.max()) - self.y_min
+        else:
+            self.x_min = self.y_min = width = height = 0.0
+
+        if cell_size is None:
+            cell_size = math.sqrt(max(width * height, 1e-12) * self.POINTS_PER_CELL / max(len(self.xs), 1))
+        # Degenerate extents (a single row of pads) must not explode the cell count
+        cell_size = max(cell_size, width / 4096, height / 4096, 1e-9)
+        self.cell_size = cell_size
+        self.nx = int(width // cell_size) + 1
+        self.ny = int(height // cell_size) + 1
+
+        cells = self._cell_y(self.ys) * self.nx + self._cell_x(self.xs)
+        self.order = np.argsort(cells, kind="stable")
+        self.offsets = np.zeros(self.nx * self.ny + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cells, minlength=self.nx * self.ny), out=self.offsets[1:])
+
+    def __len__(self):
+        return len(self.xs)
+
+    def add_rows(self, xs: np.ndarray, ys: np.ndarray):
+        """
+        Index the points appended since the index was built. xs / ys are the full
+        coordinate arrays, whose first len(self) points are unchanged. The new points
+        are merged into the end of their cells without re-sorting the existing ones;
+        the grid keeps its cells (points beyond its extent go to the border cells) until
+        it holds twice the points it was sized for, then it is rebuilt.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        start = len(self.xs)
+        if not self._grid_points or len(xs) > 2 * self._grid_points:
+            self._build(xs, ys)
+            return
+
+        new_cells = self._cell_y(ys[start:]) * self.nx + self._cell_x(xs[start:])
+        new_order = np.argsort(new_cells, kind="stable")
+        # Inserting at the old end of each cell keeps the rows of every cell in ascending order
+        self.order = np.insert(self.order, self.offsets[new_cells[new_order] + 1], new_order + start)
+        self.offsets[1:] += np.cumsum(np.bincount(new_cells, minlength=self.nx * self.ny))
+        self.xs, self.ys = xs, ys
+
+    def query_rect(self, x1: float, y1: float, x2: float, y2: float) -> np.ndarray:
+        """Indices of the points inside [x1, x2] x [y1, y2], in ascending order."""
+        candidates = self._candidates(x1, y1, x2, y2)
+        xs, ys = self.xs[candidates], self.ys[candidates]
+        inside = (xs >= x1) & (xs <= x2) & (ys >= y1) & (ys <= y2)
+        return np.sort(candidates[inside])
+
+    def query_polygon(self, polygon: np.ndarray) -> np.ndarray:
+        """
+        Indices of the points inside a polygon ((M, 2) vertices, even-odd rule), in
+        ascending order. An edge can only cross the horizontal rays of points in the
+        grid rows it spans, so each edge is tested against those rows alone.
+        """
+        polygon = np.asarray(polygon, dtype=np.float64).reshape(-1, 2)
+        if len(polygon) < 3 or not len(self.xs):
+            return np.empty(0, dtype=np.int64)
+
+        (x1, y1), (x2, y2) = polygon.min(axis=0), polygon.max(axis=0)
+        cx1, cx2 = (int(c) for c in self._cell_x(np.array([x1, x2])))
+        cy1, cy2 = (int(c) for c in self._cell_y(np.array([y1, y2])))
+        rows = [
+            self.order[self.offsets[cy * self.nx + cx1]:self.offsets[cy * self.nx + cx2 + 1]]
+            for cy in range(cy1, cy2 + 1)
+        ]
+        row_bounds = np.cumsum([0] + [len(row) for row in rows])
+        candidates = np.concatenate(rows)
+        xs, ys = self.xs[candidates], self.ys[candidates]
+
+        inside = np.zeros(len(candidates), dtype=bool)
+        edge_rows = self._cell_y(polygon[:, 1]) - cy1
+        x1, y1 = polygon[-1]
+        row1 = edge_rows[-1]
+        for (x2, y2), row2 in zip(polygon.tolist(), edge_rows.tolist()):
+            if y1 != y2:
+                lo, hi = row_bounds[min(row1, row2)], row_bounds[max(row1, row2) + 1]
+                crosses = (y1 > ys[lo:hi]) != (y2 > ys[lo:hi])
+                if crosses.any():
+                    hits = np.flatnonzero(crosses) + lo
+                    inside[hits] ^= xs[hits] < x1 + (ys[hits] - y1) * (x2 - x1) / (y2 - y1)
+            x1, y1, row1 = x2, y2, row2
+        return np.sort(candidates[inside])
+
+    def query_radius(self, x: float, y: float, radius: float) -> np.ndarray:
+        """Indices of the points within `radius` of (x, y), in ascending order."""
+        candidates = self._candidates(x - radius, y - radius, x + radius, y + radius)
+        inside = (self.xs[candidates] - x) ** 2 + (self.ys[candidates] - y) ** 2 <= radius * radius
+        return np.sort(candidates[inside])
+
+    def query_knn(self, x: float, y: float, k: int) -> np.ndarray:
+        """Indices of the `k` points nearest to (x, y), nearest first."""
+        k = min(k, len(self.xs))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+
+        # Grow a window of cells around the point until it holds k candidates ...
+        cx, cy = int(self._cell_x(np.array([x]))[0]), int(self._cell_y(np.array([y]))[0])
+        reach = 0
+        while True:
+            candidates = self._cell_candidates(cx - reach, cx + reach, cy - reach, cy + reach)
+            covers_grid = cx - reach <= 0 and cy - reach <= 0 and cx + reach >= self.nx - 1 and cy + reach >= self.ny - 1
+            if len(candidates) >= k or covers_grid:
+                break
+            reach = max(2 * reach, 1)
+
+        # ... then the k-th distance bounds the search: points in the cells just
+        # outside the window can still be closer than the window's corners
+        distances = self._squared_distances(candidates, x, y)
+        radius = math.sqrt(np.partition(distances, k - 1)[k - 1])
+        candidates = self._candidates(x - radius, y - radius, x + radius, y + radius)
+        distances = self._squared_distances(candidates, x, y)
+        nearest = np.argpartition(distances, k - 1)[:k]
+        return candidates[nearest[np.argsort(distances[nearest], kind="stable")]]
+
+    def query_point(self, x: float, y: float, max_distance: float = math.inf) -> int:
+        """Index of the point nearest to (x, y), or -1 when none is within `max_distance`."""
+        nearest = self.query_knn(x, y, 1)
+        if not len(nearest) or self._squared_distances(nearest, x, y)[0] > max_distance * max_distance:
+            return -1
+        return int(nearest[0])
+
+    def _candidates(self, x1: float, y1: float, x2: float, y2: float) -> np.ndarray:
+        """Points of the cells overlapping [x1, x2] x [y1, y2], unfiltered."""
+        if not len(self.xs) or x2 < x1 or y2 < y1:
+            return np.empty(0, dtype=np.int64)
+        cx1, cx2 = self._cell_x(np.array([x1, x2]))
+        cy1, cy2 = self._cell_y(np.array([y1, y2]))
+        return self._cell_candidates(int(cx1), int(cx2), int(cy1), int(cy2))
+
+    def _cell_candidates(self, cx1: int, cx2: int, cy1: int, cy2: int) -> np.ndarray:
+        cx1, cx2 = max(cx1, 0), min(cx2, self.nx - 1)
+        cy1, cy2 = max(cy1, 0), min(cy2, self.ny - 1)
+        rows = [
+            self.order[self.offsets[cy * self.nx + cx1]:self.offsets[cy * self.nx + cx2 + 1]]
+            for cy in range(cy1, cy2 + 1)
+        ]
+        return np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+
+    def _squared_distances(self, indices: np.ndarray, x: float, y: float) -> np.ndarray:
+        return (self.xs[indices] - x) ** 2 + (self.ys[indices] - y) ** 2
+
+    def _cell_x(self, xs: np.ndarray) -> np.ndarray:
+        return np.clip(((xs - self.x_min) // self.cell_size).astype(np.int64), 0, self.nx - 1)
+
+    def _cell_y(self, ys: np.ndarray) -> np.ndarray:
+        return np.clip(((ys - self.y_min) // self.cell_size).astype(np.int64), 0, self.ny - 1)
@@ -1,21 +1,73 @@
 import re
-from collections import defaultdict
-from itertools import chain
-from typing import Generator, Iterator
+import threading
+from dataclasses import fields
+from typing import Iterator, Mapping
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from src.Models.Components.SpatialIndex import SpatialIndex
+from src.Models.Components.SpiComponentView import SpiComponentView
 from src.Models.DataClasses.SpiComponent import SpiComponent
 
 
 class SpiComponentManager:
+    """
+    Columnar store of SPI components.
+
+    Every SpiComponent field is kept as one NumPy array. String fields are stored as
+    integer codes into a per-field category list, and the size / id groupings are kept
+    as index arrays over the rows instead of lists of objects. A grid index over the
+    pad positions answers "which pads are near here" without scanning the rows.
+    """
+
+    CATEGORICAL_FIELDS: tuple[str, ...] = tuple(
+        f.name for f in fields(SpiComponent) if f.type is str
+    )
+    NUMERIC_FIELDS: dict[str, np.dtype] = {
+        f.name: np.dtype(f.type) for f in fields(SpiComponent)
+        if f.type is not str and not f.name.startswith("canvas")
+    }
+    CANVAS_FIELDS: tuple[str, ...] = tuple(
+        f.name for f in fields(SpiComponent) if f.name.startswith("canvas")
+    )
+    GROUPINGS: dict[str, tuple[str, ...]] = {
+        "size": ("component_type", "size"),
+        "id": ("component_type", "component_id"),
+        # Finest grouping the viewer needs: every size and id layer is a union of these
+        "layer": ("component_type", "size", "component_id", "lineid", "panel_id"),
+    }
+
     def __init__(self):
-        self._component_size_dict = defaultdict(lambda: defaultdict(list))
-        self._component_id_dict = defaultdict(lambda: defaultdict(list))
-        self._component_list: list[SpiComponent] = []
+        self._lock = threading.RLock()
+        self._columns: dict[str, np.ndarray] = {}
+        self._categories: dict[str, list[str]] = {}
+        self._category_lookup: dict[str, dict[str, int]] = {}
+        self._pending: list[dict[str, np.ndarray]] = []
+        self._groups: dict[str, dict[str, dict[str, np.ndarray]]] = {}
+        self._group_index: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._spatial_index: SpatialIndex | None = None
+        self._canvas_transform: tuple[float, float, float] | None = None
         self._line_id_list: list[str] = []
         self._panel_id_list: list[str] = []
         self._count = 0
         self._idno: int = -1
         self._product_name: str = ""
+        self._reset_columns()
+
+    def _reset_columns(self):
+        self._columns = {name: np.empty(0, dtype=dtype) for name, dtype in self.NUMERIC_FIELDS.items()}
+        for name in self.CATEGORICAL_FIELDS + ("size",):
+            self._columns[name] = np.empty(0, dtype=np.int32)
+            self._categories[name] = []
+            self._category_lookup[name] = {}
+        self._pending.clear()
+        self._groups.clear()
+        self._group_index.clear()
+        self._spatial_index = None
+        self._canvas_transform = None
 
     def set_idno(self, idno: str | int):
         self._idno = int(idno)
@@ -41,59 +93,293 @@ class SpiComponentManager:
     def get_panel_id_list(self) -> list[str]:
         return self._panel_id_list
 
-    def add_component(self, component):
-        self._component_size_dict[component.component_type][component.size].append(component)
-        self._component_id_dict[component.component_type][component.component_id].append(component)
-        self._component_list.append(component)
-        self._count += 1
+    def add_component(self, component: SpiComponent):
+        names = list(self.NUMERIC_FIELDS) + list(self.CATEGORICAL_FIELDS)
+        self.extend({name: [getattr(component, name)] for name in names})
+
+    def extend(self, columns: Mapping[str, "np.ndarray | pd.Series | pd.Categorical | list"]):
+        """
+        Append a block of rows. `columns` maps every SpiComponent field name to an
+        array-like of equal length (a DataFrame works as-is). String fields may be
+        given as pd.Categorical to skip the factorization.
+        """
+        block: dict[str, np.ndarray] = {}
+        for name, dtype in self.NUMERIC_FIELDS.items():
+            block[name] = np.asarray(columns[name]).astype(dtype, copy=False)
+        for name in self.CATEGORICAL_FIELDS:
+            values = columns[name]
+            if isinstance(values, pd.Categorical):
+                codes, uniques = values.codes, values.categories
+            else:
+                codes, uniques = pd.factorize(np.asarray(values), use_na_sentinel=False)
+            block[name] = self._encode(name, codes, uniques)
+
+        # Size is a derived categorical of (size_min, size_max); a missing size is its own "nan" value,
+        # the sentinel code -1 would index the last unique and borrow another row's size
+        min_codes, min_uniques = pd.factorize(block["size_min"], use_na_sentinel=False)
+        max_codes, max_uniques = pd.factorize(block["size_max"], use_na_sentinel=False)
+        codes, pair_keys = pd.factorize(min_codes.astype(np.int64) * len(max_uniques) + max_codes)
+        block["size"] = self._encode("size", codes, [
+            f"{float(min_uniques[key // len(max_uniques)])}x{float(max_uniques[key % len(max_uniques)])}"
+            for key in pair_keys.tolist()
+        ])
+
+        length = len(block["pad_id"])
+        with self._lock:
+            self._pending.append(block)
+            self._groups.clear()
+            self._group_index.clear()
+            self._count += length
+
+    def extend_arrow(self, batch: pa.RecordBatch):
+        """Append an Arrow batch; string columns are dictionary-encoded in Arrow, never as Python objects."""
+        columns = {}
+        for name in self.NUMERIC_FIELDS:
+            columns[name] = batch.column(name).to_numpy(zero_copy_only=False)
+        for name in self.CATEGORICAL_FIELDS:
+            encoded = pc.fill_null(batch.column(name), "").dictionary_encode()
+            columns[name] = pd.Categorical.from_codes(
+                encoded.indices.to_numpy(zero_copy_only=False), categories=encoded.dictionary.to_pylist(), validate=False
+            )
+        self.extend(columns)
+
+    def _encode(self, name: str, codes: np.ndarray, uniques) -> np.ndarray:
+        """Map block-local codes onto the manager-wide category codes of `name`."""
+        lookup = self._category_lookup[name]
+        categories = self._categories[name]
+        values = uniques.tolist() if hasattr(uniques, "tolist") else list(uniques)
+        mapping = np.empty(len(values), dtype=np.int32)
+        for i, value in enumerate(values):
+            value = str(value)
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(categories)
+                categories.append(value)
+            mapping[i] = code
+        return mapping[codes]
+
+    def _consolidate(self):
+        with self._lock:
+            if not self._pending:
+                return
+            for name in self._columns:
+                self._columns[name] = np.concatenate([self._columns[name]] + [block[name] for block in self._pending])
+            self._pending.clear()
+            if self._spatial_index is not None:
+                self._spatial_index.add_rows(self._columns["pos_x"], self._columns["pos_y"])
+
+    @property
+    def column_names(self) -> list[str]:
+        """Names of the stored columns, including the derived size; the canvas positions are computed, see get_canvas_positions()."""
+        return list(self._columns)
+
+    def get_column(self, name: str) -> np.ndarray:
+        """Return the values of a field; categorical fields are decoded to an object array."""
+        if name in self.CANVAS_FIELDS:
+            return self.get_canvas_positions()[self.CANVAS_FIELDS.index(name)]
+        if name in self._categories:
+            return np.asarray(self._categories[name], dtype=object)[self.get_codes(name)]
+        self._consolidate()
+        return self._columns[name]
+
+    def get_codes(self, name: str) -> np.ndarray:
+        self._consolidate()
+        return self._columns[name]
+
+    def get_categories(self, name: str) -> list[str]:
+        return self._categories[name]
+
+    def get_component(self, index: int) -> SpiComponent:
+        # Locked, so a parse worker cannot clear the columns between the field reads
+        with self._lock:
+            self._consolidate()
+            kwargs = {}
+            for name in self.NUMERIC_FIELDS:
+                kwargs[name] = self._columns[name][index].item()
+            for name in self.CATEGORICAL_FIELDS:
+                kwargs[name] = self._categories[name][self._columns[name][index]]
+            canvas_pos_x, canvas_pos_y = self.get_canvas_positions(np.array([index]))
+        return SpiComponent(**kwargs, canvas_pos_x=int(canvas_pos_x[0]), canvas_pos_y=int(canvas_pos_y[0]))
+
+    def set_canvas_transform(self, scale: float, dx: float, dy: float):
+        """Set the board to canvas mapping, canvas_pos = pos * scale + (dx, dy); see CanvasConfig.board_to_canvas."""
+        self._canvas_transform = (scale, dx, dy)
+
+    def get_canvas_positions(self, indices: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Canvas pixel positions of the given rows (all by default), computed from the
+        canvas transform instead of being stored, so a relayout costs nothing per pad.
+        All -1 until a transform is set.
+        """
+        self._consolidate()
+        pos_x, pos_y = self._columns["pos_x"], self._columns["pos_y"]
+        if indices is not None:
+            pos_x, pos_y = pos_x[indices], pos_y[indices]
+        if self._canvas_transform is None:
+            return np.full(len(pos_x), -1, dtype=np.int32), np.full(len(pos_y), -1, dtype=np.int32)
+        scale, dx, dy = self._canvas_transform
+        return (pos_x * scale + dx).astype(np.int32), (pos_y * scale + dy).astype(np.int32)
+
+    def get_spatial_index(self) -> SpatialIndex:
+        """
+        Grid index over the board positions (pos_x, pos_y); point i is row i. Built on
+        first use, then rows appended by extend() are added to it in place. Canvas
+        positions are a scaled and shifted copy of these, so a relayout keeps the index
+        valid; map canvas coordinates back to board units before querying.
+        """
+        with self._lock:
+            if self._spatial_index is None:
+                self._consolidate()
+                self._spatial_index = SpatialIndex(self._columns["pos_x"], self._columns["pos_y"])
+            return self._spatial_index
 
     def clear(self):
-        self._component_size_dict.clear()
-        self._component_id_dict.clear()
-        self._component_list.clear()
-        self._line_id_list.clear()
-        self._panel_id_list.clear()
-        self._count = 0
-        self._idno: int = -1
+        with self._lock:
+            self._reset_columns()
+            self._line_id_list.clear()
+            self._panel_id_list.clear()
+            self._count = 0
+            self._idno: int = -1
+
+    def load_columns(self, columns: Mapping[str, np.ndarray], categories: Mapping[str, list[str]]):
+        """
+        Replace the store with already encoded columns (codes for categorical fields),
+        e.g. read-only arrays memory-mapped from a session snapshot. No copy is made.
+        """
+        with self._lock:
+            self._reset_columns()
+            for name in self._columns:
+                self._columns[name] = columns[name]
+            for name, values in categories.items():
+                self._categories[name] = list(values)
+                self._category_lookup[name] = {value: code for code, value in enumerate(values)}
+            self._count = len(self._columns["pad_id"])
+
+    def get_group_index(self, grouping: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the CSR index of a grouping: the sorted group keys (the field codes
+        combined in mixed radix, see decode_group_keys), the row order and the offsets
+        into the order, so rows of group i are order[offsets[i]:offsets[i + 1]].
+        """
+        with self._lock:
+            if grouping in self._group_index:
+                return self._group_index[grouping]
+
+            keys = np.zeros(len(self), dtype=np.int64)
+            for name in self.GROUPINGS[grouping]:
+                keys = keys * max(len(self._categories[name]), 1) + self.get_codes(name)
+
+            order = np.argsort(keys, kind="stable")
+            unique_keys, starts = np.unique(keys[order], return_index=True)
+            offsets = np.append(starts, len(order))
+
+            self._group_index[grouping] = (unique_keys, order, offsets)
+            return self._group_index[grouping]
+
+    def decode_group_keys(self, grouping: str, keys: np.ndarray) -> list[np.ndarray]:
+        """Split group keys back into the category codes of each grouping field."""
+        codes = []
+        for name in reversed(self.GROUPINGS[grouping]):
+            keys, field_codes = np.divmod(keys, max(len(self._categories[name]), 1))
+            codes.append(field_codes)
+        return codes[::-1]
 
-    def iter_components_by_size(self) -> Iterator[tuple[str, str, list[SpiComponent]]]:
-        for component_type, d in self._component_size_dict.items():
-            for size, components in d.items():
-                yield component_type, size, components
+    def set_group_index(self, grouping: str, keys: np.ndarray, order: np.ndarray, offsets: np.ndarray):
+        """Install a CSR index saved from get_group_index() for the current columns."""
+        with self._lock:
+            self._group_index[grouping] = (keys, order, offsets)
+            self._groups.pop(grouping, None)
 
-    def iter_components_by_id(self) -> Iterator[tuple[str, str, list[SpiComponent]]]:
-        for component_type, d in self._component_id_dict.items():
-            for component_id, components in d.items():
-                yield component_type, component_id, components
+    def iter_groups(self, grouping: str) -> Iterator[tuple[tuple[str, ...], SpiComponentView]]:
+        """Yield (field values, components) for every group of a grouping, in key order."""
+        keys, order, offsets = self.get_group_index(grouping)
+        field_values = [
+            np.asarray(self._categories[name], dtype=object)[codes].tolist()
+            for name, codes in zip(self.GROUPINGS[grouping], self.decode_group_keys(grouping, keys))
+        ]
+        for values, start, stop in zip(zip(*field_values), offsets[:-1].tolist(), offsets[1:].tolist()):
+            yield values, SpiComponentView(self, order[start:stop])
 
-    def get_components_by_size(self, component_type, size: str = None) -> list[SpiComponent]:
+    def _get_groups(self, grouping: str) -> dict[str, dict[str, np.ndarray]]:
+        """Build (or reuse) the {outer: {inner: row indices}} index for a two-field grouping."""
+        if grouping in self._groups:
+            return self._groups[grouping]
+
+        groups: dict[str, dict[str, np.ndarray]] = {}
+        for (outer, inner), components in self.iter_groups(grouping):
+            groups.setdefault(outer, {})[inner] = components.indices
+
+        self._groups[grouping] = groups
+        return groups
+
+    def iter_components_by_size(self) -> Iterator[tuple[str, str, SpiComponentView]]:
+        for component_type, d in self._get_groups("size").items():
+            for size, indices in d.items():
+                yield component_type, size, SpiComponentView(self, indices)
+
+    def iter_components_by_id(self) -> Iterator[tuple[str, str, SpiComponentView]]:
+        for component_type, d in self._get_groups("id").items():
+            for component_id, indices in d.items():
+                yield component_type, component_id, SpiComponentView(self, indices)
+
+    def get_components_by_size(self, component_type, size: str = None) -> SpiComponentView:
+        groups = self._get_groups("size").get(component_type, {})
         if size:
-            return self._component_size_dict[component_type][size]
+            indices = groups.get(size, np.empty(0, dtype=np.int64))
         else:
-            return list(chain.from_iterable(self._component_size_dict[component_type].values()))
+            indices = np.concatenate(list(groups.values())) if groups else np.empty(0, dtype=np.int64)
+        return SpiComponentView(self, indices)
 
-    def get_components_by_id(self, component_id):
+    def get_components_by_id(self, component_id) -> SpiComponentView:
         component_size = component_id[0]
-        return self._component_id_dict[component_size][component_id]
+        indices = self._get_groups("id").get(component_size, {}).get(component_id, np.empty(0, dtype=np.int64))
+        return SpiComponentView(self, indices)
+
+    def get_components(self, indices: np.ndarray) -> SpiComponentView:
+        return SpiComponentView(self, np.asarray(indices, dtype=np.int64))
+
+    def get_statistics(self, indices: np.ndarray, columns: tuple[str, ...] = ("volume", "area")) -> pd.DataFrame:
+        """
+        Count and mean / min / max of `columns` per component type over the given rows,
+        computed with one sort and segment reductions instead of a pandas groupby.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        with self._lock:
+            codes = self.get_codes("component_type")[indices]
+            order = np.argsort(codes, kind="stable")
+            type_codes, starts, counts = np.unique(codes[order], return_index=True, return_counts=True)
+
+            statistics = {"count": counts}
+            for name in columns:
+                values = self.get_column(name)[indices[order]].astype(np.float64)
+                if len(values):
+                    statistics[f"{name}_mean"] = np.add.reduceat(values, starts) / counts
+                    statistics[f"{name}_min"] = np.minimum.reduceat(values, starts)
+                    statistics[f"{name}_max"] = np.maximum.reduceat(values, starts)
+                else:
+                    statistics[f"{name}_mean"] = statistics[f"{name}_min"] = statistics[f"{name}_max"] = values
+
+            categories = np.asarray(self._categories["component_type"], dtype=object)
+        return pd.DataFrame(statistics, index=pd.Index(categories[type_codes], name="component_type")).sort_index()
 
     def get_component_size_structure(self) -> list:
         res = []
-        for component_type, d in self._component_size_dict.items():
-            for size, components in d.items():
-                res.append([component_type, size, len(components)])
+        for component_type, d in self._get_groups("size").items():
+            for size, indices in d.items():
+                res.append([component_type, size, len(indices)])
 
         return sorted(res, key=lambda item: (item[0], item[1]))
 
     def get_component_id_structure(self) -> list:
         res = []
-        for component_type, d in self._component_id_dict.items():
-            for component_id, components in d.items():
-                res.append([component_type, component_id, len(components)])
+        for component_type, d in self._get_groups("id").items():
+            for component_id, indices in d.items():
+                res.append([component_type, component_id, len(indices)])
 
         return sorted(res, key=self.component_id_sort_key)
 
     def __iter__(self):
-        return iter(self._component_list)
+        return iter(SpiComponentView(self, np.arange(self._count)))
 
     def __len__(self):
         return self._count
@@ -108,4 +394,4 @@ class SpiComponentManager:
             # 轉換數字字串為整數（如果為空則預設為0）
             number_val = int(numbers) if numbers else 0
             return (item[0], letters, number_val)
-        return (item[0], item[1], 0)
\ No newline at end of file
+        return (item[0], item[1], 0)
@@ -0,0 +1,56 @@
+from typing import TYPE_CHECKING, Iterator
+
+import numpy as np
+import pandas as pd
+
+from src.Models.DataClasses.SpiComponent import SpiComponent
+
+if TYPE_CHECKING:
+    from src.Models.Components.SpiComponentManager import SpiComponentManager
+
+
+class SpiComponentView:
+    """
+    Lightweight view over a subset of the rows stored in a SpiComponentManager.
+    Columns are read lazily from the manager; no per-component objects are created
+    unless the view is iterated.
+    """
+
+    __slots__ = ("_manager", "_indices")
+
+    def __init__(self, manager: "SpiComponentManager", indices: np.ndarray):
+        self._manager = manager
+        self._indices = indices
+
+    @property
+    def indices(self) -> np.ndarray:
+        return self._indices
+
+    def column(self, name: str) -> np.ndarray:
+        return self._manager.get_column(name)[self._indices]
+
+    def codes(self, name: str) -> np.ndarray:
+        return self._manager.get_codes(name)[self._indices]
+
+    def to_frame(self, columns: list[str] | None = None) -> pd.DataFrame:
+        """The rows as a DataFrame with decoded values, e.g. for exporting."""
+        columns = self._manager.column_names if columns is None else columns
+        return pd.DataFrame({name: self.column(name) for name in columns})
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self.column(name)
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __iter__(self) -> Iterator[SpiComponent]:
+        for index in self._indices.tolist():
+            yield self._manager.get_component(index)
+
+    def __repr__(self):
+        return f"<SpiComponentView: {len(self)} components>"
@@ -41,6 +41,43 @@ class CanvasConfig:
         offset_x = (available_w - scaled_width) / 2
         return int(offset_y), int(offset_x)
 
+    @property
+    def has_bounds(self) -> bool:
+        return (
+            self.component_x_max > self.component_x_min
+            and self.component_y_max > self.component_y_min
+        )
+
+    @property
+    def board_to_canvas(self) -> tuple[float, float, float]:
+        # (scale, dx, dy) such that canvas_pos = board_pos * scale + (dx, dy)
+        scaling_ratio = self.scaling_ratio
+        offset_y, offset_x = self.offset_to_center
+        dx = self.margin + offset_x - self.component_x_min * scaling_ratio
+        dy = self.margin + offset_y - self.component_y_min * scaling_ratio
+        return scaling_ratio, dx, dy
+
+    def copy_bounds_from(self, other: "CanvasConfig"):
+        self.component_x_min = other.component_x_min
+        self.component_x_max = other.component_x_max
+        self.component_y_min = other.component_y_min
+        self.component_y_max = other.component_y_max
+
+    def fit_canvas_to_components(self):
+        # Auto mode: shrink the shorter canvas side to the aspect ratio of the component bounds
+        if self.canvas_mode != "auto":
+            return
+
+        canvas_h, canvas_w = self.canvas_size[:2]
+        component_x_dist = self.component_x_max - self.component_x_min
+        component_y_dist = self.component_y_max - self.component_y_min
+        if component_x_dist > component_y_dist:
+            canvas_h = int(canvas_w / component_x_dist * component_y_dist)
+        elif component_x_dist < component_y_dist:
+            canvas_w = int(canvas_h / component_y_dist * component_x_dist)
+
+        self.canvas_size = (canvas_h, canvas_w, 3)
+
     def compare(self, other: "CanvasConfig") -> int:
         if self.canvas_size != other.canvas_size:
             return 1 # Restart from update_component_thread
@@ -0,0 +1,157 @@
+# Built-in Imports
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from typing import Iterator
+
+# Data Science and Third Party Imports
+import openpyxl
+import pandas as pd
+import pyarrow.parquet as pq
+
+# User Imports
+from src.Models.Components.ProxyCache import ProxyCache
+from src.Models.Readers.SpiFileReader import SpiFileReader
+
+# Logger
+import logging
+logger = logging.getLogger(__name__)
+
+
+def _iter_sheet_frames(file_path: str, sheet_name: str | None, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    if os.path.splitext(file_path)[-1].lower() == ".xls":
+        # xlrd has no streaming mode; legacy workbooks are small enough to read at once
+        yield pd.read_excel(file_path, sheet_name=sheet_name or 0, engine="xlrd")
+        return
+
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        rows = worksheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+
+        buffer = []
+        for row in rows:
+            buffer.append(row)
+            if len(buffer) == chunk_rows:
+                yield pd.DataFrame(buffer, columns=header)
+                buffer = []
+        if buffer:
+            yield pd.DataFrame(buffer, columns=header)
+    finally:
+        workbook.close()
+
+
+def convert_excel_sheet(file_path: str, sheet_name: str | None, out_path: str, chunk_rows: int) -> int:
+    """
+    Worker entry point: stream one sheet, normalize it chunk by chunk and write the
+    rows to a parquet file matching SpiFileReader.SCHEMA. Returns the row count.
+    """
+    row_count = 0
+    with pq.ParquetWriter(out_path, SpiFileReader.SCHEMA) as writer:
+        for df in _iter_sheet_frames(file_path, sheet_name, chunk_rows):
+            df.columns = [SpiFileReader.to_snake_case(str(col)) for col in df.columns]
+            batch = SpiFileReader.frame_to_batch(df)
+            writer.write_batch(batch)
+            row_count += batch.num_rows
+    return row_count
+
+
+class ExcelReaderPool:
+    """
+    Decodes Excel workbooks in worker processes, so openpyxl never holds the GIL of
+    the GUI process. Workers write normalized parquet proxies straight into the
+    ProxyCache; the caller only gets the proxy path back and streams it as Arrow.
+    Sheets of one workbook and separate workbooks are decoded in parallel.
+    """
+
+    CHUNK_ROWS = 50_000     # Rows normalized and written per step inside a worker
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        # Started on first use, workers stay alive for later files
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    @staticmethod
+    def get_sheet_names(file_path: str) -> list[str]:
+        if os.path.splitext(file_path)[-1].lower() == ".xls":
+            return pd.ExcelFile(file_path, engine="xlrd").sheet_names
+        workbook = openpyxl.load_workbook(file_path, read_only=True)
+        try:
+            return workbook.sheetnames
+        finally:
+            workbook.close()
+
+    def convert(
+        self, file_path: str, proxy_cache: ProxyCache, key: str | None = None, sheet_names: list[str] | None = None
+    ) -> str:
+        """
+        Convert a workbook into a cached proxy and return its path. Only the first
+        sheet is read unless `sheet_names` is given; several sheets are decoded in
+        parallel and concatenated in the given order.
+        """
+        key = key or proxy_cache.make_key(file_path)
+        return self._commit(file_path, proxy_cache, key, self._submit(file_path, proxy_cache, sheet_names))
+
+    def convert_many(self, file_paths: list[str], proxy_cache: ProxyCache) -> dict[str, str]:
+        """Convert several workbooks at once; returns {file_path: proxy_path}."""
+        keys = {file_path: proxy_cache.make_key(file_path) for file_path in file_paths}
+        jobs = {file_path: self._submit(file_path, proxy_cache, None) for file_path in file_paths}
+        return {
+            file_path: self._commit(file_path, proxy_cache, keys[file_path], parts)
+            for file_path, parts in jobs.items()
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _submit(
+        self, file_path: str, proxy_cache: ProxyCache, sheet_names: list[str] | None
+    ) -> list[tuple[str, Future]]:
+        parts = []
+        for sheet_name in sheet_names or [None]:
+            out_path = proxy_cache.reserve()
+            future = self.executor.submit(convert_excel_sheet, file_path, sheet_name, out_path, self.CHUNK_ROWS)
+            parts.append((out_path, future))
+        return parts
+
+    @staticmethod
+    def _commit(file_path: str, proxy_cache: ProxyCache, key: str, parts: list[tuple[str, Future | None]]) -> str:
+        try:
+            for _, future in parts:
+                future.result()
+
+            if len(parts) == 1:
+                written_path = parts[0][0]
+            else:
+                # Concatenate the per-sheet files without materializing them
+                written_path = proxy_cache.reserve()
+                sheet_paths = [part_path for part_path, _ in parts]
+                parts.append((written_path, None))
+                with pq.ParquetWriter(written_path, SpiFileReader.SCHEMA) as writer:
+                    for part_path in sheet_paths:
+                        for batch in pq.ParquetFile(part_path).iter_batches():
+                            writer.write_batch(batch)
+                for part_path in sheet_paths:
+                    os.remove(part_path)
+
+            return proxy_cache.commit(file_path, written_path, key)
+        except Exception:
+            # Let the remaining sheets finish so none of their files is left behind
+            futures = [future for _, future in parts if future is not None]
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            for part_path, _ in parts:
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+            raise
@@ -0,0 +1,140 @@
+# Built-in Imports
+import csv
+import re
+from dataclasses import fields
+from typing import Iterator, Literal
+
+# Data Science and Third Party Imports
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+# User Imports
+from src.Models.DataClasses.SpiComponent import SpiComponent
+
+CSV_ENGINE_HINT = Literal["pyarrow", "pyarrow-parallel", "pandas"]
+ARROW_TYPES = {str: pa.string(), int: pa.int64(), float: pa.float64()}
+
+
+class SpiFileReader:
+    """
+    Reads SPI exports into normalized Arrow record batches: snake_case column names,
+    projected to the columns the application uses, with explicit types.
+    """
+
+    CSV_CHUNK_SIZE = 50_000             # Rows per chunk (pandas engine) / per batch (pyarrow-parallel engine)
+    ARROW_BLOCK_SIZE = 4 << 20          # Bytes per parsed block (pyarrow engines)
+
+    SPI_COMPONENT_COLS = [col.name for col in fields(SpiComponent) if not col.name.startswith("canvas")]
+    REQUIRED_COLS = SPI_COMPONENT_COLS + ["idno"]
+    OPTIONAL_COLS = ["product_group"]
+
+    SCHEMA = pa.schema(
+        [(col.name, ARROW_TYPES[col.type]) for col in fields(SpiComponent) if not col.name.startswith("canvas")]
+        + [("idno", pa.int64()), ("product_group", pa.string())]
+    )
+
+    @classmethod
+    def iter_csv_batches(cls, file_path: str, engine: CSV_ENGINE_HINT = "pyarrow") -> Iterator[pa.RecordBatch]:
+        """
+        "pyarrow" streams the file block by block, so the first batches arrive early but
+        parsing is mostly sequential; "pyarrow-parallel" parses the blocks of the whole
+        file on the Arrow thread pool and only then yields the batches.
+        """
+        if engine == "pyarrow":
+            return cls._iter_csv_batches_arrow(file_path)
+        elif engine == "pyarrow-parallel":
+            return cls._iter_csv_batches_arrow_parallel(file_path)
+        elif engine == "pandas":
+            return cls._iter_csv_batches_pandas(file_path)
+        else:
+            raise ValueError(f"Unsupported csv engine: {engine}")
+
+    @classmethod
+    def _iter_csv_batches_pandas(cls, file_path: str) -> Iterator[pa.RecordBatch]:
+        for chunk in pd.read_csv(file_path, chunksize=cls.CSV_CHUNK_SIZE):
+            chunk.columns = [cls.to_snake_case(col) for col in chunk.columns]
+            yield cls.frame_to_batch(chunk)
+
+    @classmethod
+    def _iter_csv_batches_arrow(cls, file_path: str) -> Iterator[pa.RecordBatch]:
+        reader = pa_csv.open_csv(file_path, **cls._arrow_csv_options(file_path))
+        snake_names = [cls.to_snake_case(name) for name in reader.schema.names]
+        for batch in reader:
+            if batch.num_rows:
+                yield cls._conform(pa.RecordBatch.from_arrays(batch.columns, names=snake_names))
+
+    @classmethod
+    def _iter_csv_batches_arrow_parallel(cls, file_path: str) -> Iterator[pa.RecordBatch]:
+        table = pa_csv.read_csv(file_path, **cls._arrow_csv_options(file_path))
+        snake_names = [cls.to_snake_case(name) for name in table.schema.names]
+        for batch in table.to_batches(max_chunksize=cls.CSV_CHUNK_SIZE):
+            if batch.num_rows:
+                yield cls._conform(pa.RecordBatch.from_arrays(batch.columns, names=snake_names))
+
+    @classmethod
+    def _arrow_csv_options(cls, file_path: str) -> dict:
+        # Map the raw header onto the normalized names so only needed columns get parsed.
+        # utf-8-sig strips a BOM from the first name here; Arrow's utf8 decoder skips it on its own,
+        # and any other encoding would route every block through a single-threaded transcoder
+        with open(file_path, newline="", encoding="utf-8-sig") as f:
+            header = next(csv.reader(f))
+        raw_names = {cls.to_snake_case(raw): raw for raw in header}
+        missing = [col for col in cls.REQUIRED_COLS if col not in raw_names]
+        if missing:
+            raise ValueError(f"Missing columns: {missing}")
+
+        include = [raw_names[field.name] for field in cls.SCHEMA if field.name in raw_names]
+        column_types = {raw_names[field.name]: field.type for field in cls.SCHEMA if field.name in raw_names}
+        return dict(
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=cls.ARROW_BLOCK_SIZE),
+            convert_options=pa_csv.ConvertOptions(include_columns=include, column_types=column_types),
+        )
+
+    @classmethod
+    def iter_parquet_batches(cls, file_path: str) -> Iterator[pa.RecordBatch]:
+        """Stream a normalized proxy file written from SCHEMA batches."""
+        for batch in pq.ParquetFile(file_path).iter_batches(batch_size=cls.CSV_CHUNK_SIZE):
+            yield cls._conform(batch)
+
+    @staticmethod
+    def count_parquet_rows(file_path: str) -> int:
+        return pq.ParquetFile(file_path).metadata.num_rows
+
+    @classmethod
+    def frame_to_batch(cls, df: pd.DataFrame) -> pa.RecordBatch:
+        """Convert a DataFrame with normalized column names into a batch matching SCHEMA."""
+        columns = [col for col in cls.SCHEMA.names if col in df.columns]
+        batch = pa.RecordBatch.from_pandas(df[columns], preserve_index=False)
+        return cls._conform(batch)
+
+    @classmethod
+    def _conform(cls, batch: pa.RecordBatch) -> pa.RecordBatch:
+        """Cast to SCHEMA order and types; optional columns that are absent become nulls."""
+        arrays = []
+        for field in cls.SCHEMA:
+            index = batch.schema.get_field_index(field.name)
+            if index >= 0:
+                arrays.append(pc.cast(batch.column(index), field.type))
+            elif field.name in cls.OPTIONAL_COLS:
+                arrays.append(pa.nulls(batch.num_rows, field.type))
+            else:
+                raise ValueError(f"Missing column: {field.name}")
+        return pa.RecordBatch.from_arrays(arrays, schema=cls.SCHEMA)
+
+    @staticmethod
+    def to_snake_case(s: str) -> str:
+        if s in {"IDNO", "DID", "SKU", "FIDL", "MFGPN"}:
+            res = s.lower()
+        elif "ID" in s:
+            res = s.replace("ID", "_id").lower()
+        elif "BR" in s:
+            res = s.replace("BR", "_br_").lower()
+        elif "DB" in s:
+            res = s.replace("DB", "_db_").lower()
+        else:
+            res = re.sub(r'(?<!^)([A-Z])', r'_\1', s).lower()
+
+        return res.strip("_")
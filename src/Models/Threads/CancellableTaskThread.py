@@ -0,0 +1,126 @@
+import threading
+from typing import Any, Hashable
+
+# Import necessary libraries
+from PyQt6.QtCore import QThread, pyqtSignal
+
+# Logger
+import logging
+logger = logging.getLogger(__name__)
+
+
+class TaskCancelled(Exception):
+    """Raised by CancellableTaskThread.check_cancelled() to unwind a superseded task."""
+
+
+class CancellableTaskThread(QThread):
+    """
+    Worker thread that keeps at most one pending task per target.
+
+    Submitting a task for a target replaces that target's pending task. If the
+    target's task is already running, it is asked to stop: the subclass calls
+    check_cancelled() at its stage boundaries, which raises TaskCancelled there.
+    Targets are processed in submission order. A task that fails is logged and
+    reported through task_failed_signal; the thread moves on to the next one.
+    """
+
+    IDLE = "idle"
+    RUNNING = "running"
+    CANCELLING = "cancelling"
+
+    state_changed_signal = pyqtSignal(str, int)  # state, number of pending tasks
+    task_cancelled_signal = pyqtSignal()
+    task_failed_signal = pyqtSignal(str)  # error message
+
+    def __init__(self):
+        super().__init__()
+        self.is_running = False  # Initially not running
+        self._lock = threading.Lock()
+        self._pending: dict[Hashable, Any] = {}
+        self._current_target: Hashable | None = None
+        self._cancel_requested = False
+
+        # A task submitted while run() was returning is picked up here
+        self.finished.connect(self._start_if_pending)
+
+    @property
+    def queue_depth(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if not self.is_running:
+                return self.IDLE
+            return self.CANCELLING if self._cancel_requested else self.RUNNING
+
+    def submit(self, target: Hashable, task: Any):
+        with self._lock:
+            # Re-inserting moves the target behind the other pending ones
+            self._pending.pop(target, None)
+            self._pending[target] = task
+            if target == self._current_target:
+                self._cancel_requested = True
+            start = not self.is_running
+            self.is_running = True
+
+        self._emit_state()
+        if start:
+            self.start()
+
+    def cancel(self, target: Hashable | None = None):
+        """Drop the pending task of `target` and stop its running one; all targets when None."""
+        with self._lock:
+            if target is None:
+                self._pending.clear()
+            else:
+                self._pending.pop(target, None)
+            if self._current_target is not None and target in (None, self._current_target):
+                self._cancel_requested = True
+        self._emit_state()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_requested
+
+    def check_cancelled(self):
+        if self._cancel_requested:
+            raise TaskCancelled()
+
+    def run(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._current_target = None
+                    self._cancel_requested = False
+                    self.is_running = False
+                    break
+                self._current_target = next(iter(self._pending))
+                task = self._pending.pop(self._current_target)
+                self._cancel_requested = False
+
+            self._emit_state()
+            try:
+                self.run_task(task)
+            except TaskCancelled:
+                self.task_cancelled_signal.emit()
+            except Exception as e:
+                # Keep the loop alive; otherwise is_running stays set and no task ever starts again
+                logger.error(f"{type(self).__name__} task failed: {e}", exc_info=True)
+                self.task_failed_signal.emit(f"{type(e).__name__}: {e}")
+
+        self._emit_state()
+
+    def run_task(self, task: Any):
+        raise NotImplementedError
+
+    def _start_if_pending(self):
+        with self._lock:
+            start = bool(self._pending)
+            if start:
+                self.is_running = True
+        if start:
+            self.start()
+
+    def _emit_state(self):
+        self.state_changed_signal.emit(self.state, self.queue_depth)
@@ -1,153 +1,169 @@
 from dataclasses import dataclass
 import os
+import numpy as np
 import pandas as pd
-import re
-from dataclasses import fields
+import pyarrow as pa
+import pyarrow.compute as pc
 
-from queue import Queue
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Iterator
 
 # Import necessary libraries
-from PyQt6.QtCore import QThread, pyqtSignal
-from src.Models.DataClasses.SpiComponent import SpiComponent
+from PyQt6.QtCore import pyqtSignal
+from src.Models.Components.ProxyCache import ProxyCache
+from src.Models.Readers.ExcelReaderPool import ExcelReaderPool
+from src.Models.Readers.SpiFileReader import SpiFileReader, CSV_ENGINE_HINT
+from src.Models.Threads.CancellableTaskThread import CancellableTaskThread
+from src.Utils.ProgressReporter import ProgressReporter
 
 if TYPE_CHECKING:
     from src.Models.DataClasses.CanvasConfig import CanvasConfig
     from src.Models.Components.SpiComponentManager import SpiComponentManager
 
+# Logger
+import logging
+logger = logging.getLogger(__name__)
+
 @dataclass
 class SpiFileTask:
     file_path: str
     spi_component_manager: "SpiComponentManager"
     canvas_config: "CanvasConfig"
 
-class ParseSpiFileThread(QThread):
+@dataclass
+class SpiChunk:
+    start: int
+    stop: int
+    pos_x: np.ndarray
+    pos_y: np.ndarray
+    component_type: pd.Categorical
+
+class ParseSpiFileThread(CancellableTaskThread):
 
     update_progress_signal = pyqtSignal(int)
     update_progress_desc_signal = pyqtSignal(str)
+    chunk_loaded_signal = pyqtSignal(object)  # SpiChunk
     next_step_signal = pyqtSignal()
 
-    task_queue = Queue()
+    # Files up to this size are parsed in parallel, which is over before a preview would help;
+    # larger ones stream, so chunks are previewed and memory stays bounded while they are parsed
+    CSV_PARALLEL_MAX_BYTES = 256 << 20
+    SPI_COMPONENT_COLS = SpiFileReader.SPI_COMPONENT_COLS
 
     def __init__(self):
         super().__init__()
-        self.is_running = False  # Initially not running
+        self.progress = ProgressReporter(self.update_progress_signal, self.update_progress_desc_signal)
+        self.proxy_cache = ProxyCache()
+        self.excel_reader_pool = ExcelReaderPool()
 
     def add_task(self, file_path: str, spi_component_manager: "SpiComponentManager", canvas_config: "CanvasConfig"):
-        task = SpiFileTask(file_path, spi_component_manager, canvas_config)
-        if os.path.exists(file_path) and task not in self.task_queue.queue:
-            self.task_queue.put(task)  # Enqueue the dataclass task object
-
-        if not self.is_running:
-            self.is_running = True
-            self.start()
-
-    def run(self):
-        while not self.task_queue.empty():
-            task: SpiFileTask = self.task_queue.get()
-            self.processing(task.file_path, task.spi_component_manager, task.canvas_config)
-            self.task_queue.task_done()
+        # A newer file for the same manager supersedes the pending or running one
+        if os.path.exists(file_path):
+            self.submit(spi_component_manager, SpiFileTask(file_path, spi_component_manager, canvas_config))
 
-        self.is_running = False
+    def run_task(self, task: SpiFileTask):
+        self.processing(task.file_path, task.spi_component_manager, task.canvas_config)
 
     def processing(self, file_path: str, spi_component_manager: "SpiComponentManager", canvas_config: "CanvasConfig"):
-        df: pd.DataFrame | None = None
-        ext = os.path.splitext(file_path)[-1].lower()
-        proxy_success = False
-        spi_component_cols = [col.name for col in fields(SpiComponent) if not col.name.startswith("canvas")]
-        check_col_set = set(spi_component_cols + ["idno"])
-
         print(f"{canvas_config.canvas_mode = }")
 
-        # Define proxy file path based on original file name
-        proxy_file_path = os.path.splitext(file_path)[0] + '.parquet'
-
-        if ext == ".csv":
-            df = pd.read_csv(file_path)
-            df.columns = [self.to_snake_case(col) for col in df.columns]
-            proxy_success = True
-        elif ext in (".xlsx", "xls"):
-            # Check if the proxy file already exists
-            if os.path.exists(proxy_file_path):
-                self.update_progress_desc_signal.emit(f"Loading proxy file: {proxy_file_path}")
-                df = pd.read_parquet(proxy_file_path)
-                # Ensure columns match exactly
-                proxy_success = set(df.columns) == check_col_set
-
-        if not proxy_success:
-            # Load original file according to its extension
-            self.update_progress_desc_signal.emit(f"Loading original file: {file_path}")
-            ext = os.path.splitext(file_path)[-1].lower()
-            if ext == '.xlsx':
-                df = pd.read_excel(file_path)
-            elif ext == '.xls':
-                df = pd.read_excel(file_path, engine='xlrd')
-            else:
-                raise ValueError("Unsupported file format")
-
-            # Save the loaded DataFrame as a proxy file for future reuse
-            self.update_progress_desc_signal.emit("Saving proxy file for future use")
-            df.columns = [self.to_snake_case(col) for col in df.columns]
-            df = df[spi_component_cols + ["idno"]]
-            df.to_parquet(proxy_file_path)
-
-        if df is None:
-            self.update_progress_desc_signal.emit("Failed to load data")
-            return
+        batches = self._iter_batches(file_path)
 
         # Reset
         spi_component_manager.clear()
-
-        # Update idno
-        spi_component_manager.set_idno(int(df["idno"].iloc[0]))
-        spi_component_manager.set_product_name(str(df["product_group"].iloc[0]))
-        spi_component_manager.set_line_id_list(*df["lineid"].unique())
-        spi_component_manager.set_panel_id_list(*df["panel_id"].unique())
-
-        # Update canvas configuration bounds
-        self.update_progress_desc_signal.emit("Updating canvas config")
-        x_min, y_min = df.loc[:, ["pos_x", "pos_y"]].min()
-        x_max, y_max = df.loc[:, ["pos_x", "pos_y"]].max()
-
-        canvas_config.component_x_min = x_min
-        canvas_config.component_x_max = x_max
-        canvas_config.component_y_min = y_min
-        canvas_config.component_y_max = y_max
+        canvas_config.component_x_min = canvas_config.component_y_min = float("inf")
+        canvas_config.component_x_max = canvas_config.component_y_max = float("-inf")
+
+        row_count = 0
+        has_idno = has_product_name = False
+        try:
+            for batch in batches:
+                self.check_cancelled()
+                # Update idno and product name from the first rows that have them
+                if not has_idno and (idno := self._first_valid(batch.column("idno"))) is not None:
+                    spi_component_manager.set_idno(int(idno))
+                    has_idno = True
+                if not has_product_name and (product_name := self._first_valid(batch.column("product_group"))) is not None:
+                    spi_component_manager.set_product_name(str(product_name))
+                    has_product_name = True
+
+                # Store the component columns in the manager
+                spi_component_manager.extend_arrow(batch)
+
+                # Update canvas configuration bounds
+                x_min, x_max = pc.min_max(batch.column("pos_x")).values()
+                y_min, y_max = pc.min_max(batch.column("pos_y")).values()
+                canvas_config.component_x_min = min(canvas_config.component_x_min, x_min.as_py())
+                canvas_config.component_x_max = max(canvas_config.component_x_max, x_max.as_py())
+                canvas_config.component_y_min = min(canvas_config.component_y_min, y_min.as_py())
+                canvas_config.component_y_max = max(canvas_config.component_y_max, y_max.as_py())
+
+                # Hand the chunk to the renderer for an early preview
+                component_type = batch.column("component_type").dictionary_encode()
+                self.chunk_loaded_signal.emit(SpiChunk(
+                    start=row_count,
+                    stop=row_count + batch.num_rows,
+                    pos_x=batch.column("pos_x").to_numpy(zero_copy_only=False),
+                    pos_y=batch.column("pos_y").to_numpy(zero_copy_only=False),
+                    component_type=pd.Categorical.from_codes(
+                        component_type.indices.to_numpy(zero_copy_only=False), categories=component_type.dictionary.to_pylist()
+                    ),
+                ))
+                row_count += batch.num_rows
+                self.progress.update(row_count)
+        finally:
+            # Stops a proxy write-through of an abandoned read
+            if hasattr(batches, "close"):
+                batches.close()
+
+        if row_count == 0:
+            # Reported through task_failed_signal, whose receiver restores the UI
+            raise ValueError(f"No components found in {os.path.basename(file_path)}")
+
+        spi_component_manager.set_line_id_list(*spi_component_manager.get_categories("lineid"))
+        spi_component_manager.set_panel_id_list(*spi_component_manager.get_categories("panel_id"))
 
         # Update canvas size
-        if canvas_config.canvas_mode == "auto":
-            canvas_h, canvas_w = canvas_config.canvas_size[:2]
-            component_x_dist = x_max - x_min
-            component_y_dist = y_max - y_min
-            if component_x_dist > component_y_dist:
-                canvas_h = int(canvas_w / component_x_dist * component_y_dist)
-            elif component_x_dist < component_y_dist:
-                canvas_w = int(canvas_h / component_y_dist * component_x_dist)
+        self.check_cancelled()
+        self.progress.finish()
+        self.progress.start("Updating canvas config")
+        canvas_config.fit_canvas_to_components()
 
-            canvas_config.canvas_size = (canvas_h, canvas_w, 3)
+        self.next_step_signal.emit()
 
-        # Instantiate SpiComponent objects from DataFrame rows
-        self.update_progress_desc_signal.emit("Creating spi components")
-        for i, row in enumerate(df[spi_component_cols].to_dict(orient='records')):
-            if i % 10 == 0:
-                self.update_progress_desc_signal.emit(f"Creating spi components ({i / len(df):.1%})")
+    def _iter_batches(self, file_path: str) -> Iterator[pa.RecordBatch]:
+        """Yield normalized Arrow batches in bounded-size blocks, from the proxy cache whenever possible."""
+        ext = os.path.splitext(file_path)[-1].lower()
+        if ext not in (".csv", ".xlsx", ".xls"):
+            raise ValueError("Unsupported file format")
 
-            spi_component_manager.add_component(SpiComponent(**row))
-
-        self.next_step_signal.emit()
+        # Check if a proxy of the current file version already exists
+        proxy_key = self.proxy_cache.make_key(file_path)
+        if proxy_file_path := self.proxy_cache.lookup(file_path, proxy_key):
+            self.progress.start("Loading proxy file", SpiFileReader.count_parquet_rows(proxy_file_path))
+            return SpiFileReader.iter_parquet_batches(proxy_file_path)
 
+        if ext == ".csv":
+            # Parse the text and write the normalized batches to a proxy on the way
+            engine = self._csv_engine(file_path)
+            action = "Parsing" if engine == "pyarrow-parallel" else "Streaming"
+            self.progress.start(f"{action} file: {os.path.basename(file_path)}")
+            batches = SpiFileReader.iter_csv_batches(file_path, engine)
+            return self.proxy_cache.write_through(file_path, batches, SpiFileReader.SCHEMA, proxy_key)
+
+        # Decode the workbook in a worker process, which writes the proxy directly
+        self.progress.start(f"Decoding workbook: {os.path.basename(file_path)}")
+        proxy_file_path = self.excel_reader_pool.convert(file_path, self.proxy_cache, proxy_key)
+        self.progress.start("Loading proxy file", SpiFileReader.count_parquet_rows(proxy_file_path))
+        return SpiFileReader.iter_parquet_batches(proxy_file_path)
 
     @staticmethod
-    def to_snake_case(s: str) -> str:
-        if s in {"IDNO", "DID", "SKU", "FIDL", "MFGPN"}:
-            res = s.lower()
-        elif "ID" in s:
-            res = s.replace("ID", "_id").lower()
-        elif "BR" in s:
-            res = s.replace("BR", "_br_").lower()
-        elif "DB" in s:
-            res = s.replace("DB", "_db_").lower()
-        else:
-            res = re.sub(r'(?<!^)([A-Z])', r'_\1', s).lower()
-
-        return res.strip("_")
+    def _first_valid(column: pa.Array) -> Any:
+        valid = pc.drop_null(column)
+        return valid[0].as_py() if len(valid) else None
+
+    def _csv_engine(self, file_path: str) -> CSV_ENGINE_HINT:
+        if os.path.getsize(file_path) <= self.CSV_PARALLEL_MAX_BYTES:
+            return "pyarrow-parallel"
+        return "pyarrow"
+
+    to_snake_case = staticmethod(SpiFileReader.to_snake_case)
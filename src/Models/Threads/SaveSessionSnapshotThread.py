@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+from src.Models.Components.SessionSnapshot import SessionSnapshot, SessionSnapshotData
+from src.Models.Threads.CancellableTaskThread import CancellableTaskThread
+
+
+@dataclass
+class SaveSessionSnapshotTask:
+    session_snapshot: SessionSnapshot
+    data: SessionSnapshotData
+
+
+class SaveSessionSnapshotThread(CancellableTaskThread):
+    """Writes session snapshots captured on the GUI thread, so the Arrow IPC files never block it."""
+
+    def add_task(self, session_snapshot: SessionSnapshot, data: SessionSnapshotData):
+        # A newer snapshot of the same directory supersedes the pending or unfinished one
+        self.submit(session_snapshot.snapshot_dir, SaveSessionSnapshotTask(session_snapshot, data))
+
+    def run_task(self, task: SaveSessionSnapshotTask):
+        task.session_snapshot.write(task.data, self.check_cancelled)
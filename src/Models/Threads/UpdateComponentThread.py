@@ -1,15 +1,15 @@
 from dataclasses import dataclass
 
-from queue import Queue
 from typing import TYPE_CHECKING
 
 # Import necessary libraries
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import pyqtSignal
 
 from src.Models.Components.SpiComponentManager import SpiComponentManager
+from src.Models.Threads.CancellableTaskThread import CancellableTaskThread
+from src.Utils.ProgressReporter import ProgressReporter
 
 if TYPE_CHECKING:
-    from src.Models.DataClasses.SpiComponent import SpiComponent
     from src.Models.DataClasses.CanvasConfig import CanvasConfig
 
 
@@ -18,47 +18,26 @@ class UpdateComponentTask:
     spi_component_manager: SpiComponentManager
     canvas_config: "CanvasConfig"
 
-class UpdateComponentThread(QThread):
+class UpdateComponentThread(CancellableTaskThread):
 
     update_progress_signal = pyqtSignal(int)
     update_progress_desc_signal = pyqtSignal(str)
-
-    task_queue = Queue()
+    layout_finished_signal = pyqtSignal()
 
     def __init__(self):
         super().__init__()
-        self.is_running = False  # Initially not running
+        self.progress = ProgressReporter(self.update_progress_signal, self.update_progress_desc_signal)
 
     def add_task(self, spi_component_manager: SpiComponentManager, canvas_config: "CanvasConfig"):
-        task = UpdateComponentTask(spi_component_manager, canvas_config)
-        if task not in self.task_queue.queue:
-            self.task_queue.put(task)  # Put the dataclass object into the queue
-
-        if not self.is_running:
-            self.is_running = True
-            self.start()
-
-    def run(self):
-        while not self.task_queue.empty():
-            task: UpdateComponentTask = self.task_queue.get()
-            self.processing(task.spi_component_manager, task.canvas_config)
-            self.task_queue.task_done()
+        # A newer layout for the same manager supersedes the pending or running one
+        self.submit(spi_component_manager, UpdateComponentTask(spi_component_manager, canvas_config))
 
-        self.is_running = False
+    def run_task(self, task: UpdateComponentTask):
+        self.processing(task.spi_component_manager, task.canvas_config)
+        self.layout_finished_signal.emit()
 
     def processing(self, spi_component_manager: SpiComponentManager, canvas_config: "CanvasConfig"):
-
-        scaling_ratio = canvas_config.scaling_ratio
-        offset_y, offset_x = canvas_config.offset_to_center
-        x_min = canvas_config.component_x_min
-        y_min = canvas_config.component_y_min
-        margin = canvas_config.margin
-
-        self.update_progress_desc_signal.emit("Updating components")
-        component: "SpiComponent"
-        for i, component in enumerate(spi_component_manager):
-            if i % 10 == 0:
-                self.update_progress_desc_signal.emit(f"Updating components ({i/len(spi_component_manager):.1%})")
-
-            component.canvas_pos_x = int((component.pos_x - x_min) * scaling_ratio + margin + offset_x)
-            component.canvas_pos_y = int((component.pos_y - y_min) * scaling_ratio + margin + offset_y)
+        # Canvas positions are derived from the board transform on demand; nothing is computed per pad
+        self.progress.start("Updating components")
+        spi_component_manager.set_canvas_transform(*canvas_config.board_to_canvas)
+        self.progress.finish()
@@ -0,0 +1,61 @@
+# Built-in Imports
+import time
+
+# PyQt Imports
+from PyQt6.QtCore import pyqtBoundSignal
+
+
+class ProgressReporter:
+    """
+    Rate-limited progress for worker threads.
+
+    Workers report plain numbers as often as they like; the reporter formats and
+    emits them through the thread's signals at most `rate` times per second, so the
+    GUI event loop is not flooded with cross-thread signals. The percent signal gets
+    -1 while the total is unknown.
+    """
+
+    def __init__(self, percent_signal: pyqtBoundSignal, desc_signal: pyqtBoundSignal, rate: float = 20.0):
+        self._percent_signal = percent_signal
+        self._desc_signal = desc_signal
+        self._interval = 1.0 / rate
+        self._last_emit = 0.0
+        self._stage = ""
+        self._unit = ""
+        self._done = 0
+        self._total = 0
+
+    def start(self, stage: str, total: int = 0, unit: str = "rows"):
+        """Begin a stage; a `total` of 0 means the amount of work is not known up front."""
+        self._stage = stage
+        self._unit = unit
+        self._done = 0
+        self._total = total
+        self._emit()
+
+    def update(self, done: int, total: int | None = None):
+        self._done = done
+        if total is not None:
+            self._total = total
+        if time.monotonic() - self._last_emit >= self._interval:
+            self._emit()
+
+    def advance(self, amount: int = 1):
+        self.update(self._done + amount)
+
+    def finish(self):
+        self._done = max(self._done, self._total)
+        self._emit()
+
+    def _emit(self):
+        self._last_emit = time.monotonic()
+        if self._total:
+            percent = min(int(self._done * 100 / self._total), 100)
+            self._percent_signal.emit(percent)
+            self._desc_signal.emit(f"{self._stage} ({self._done:,} / {self._total:,} {self._unit}, {percent}%)")
+        elif self._done:
+            self._percent_signal.emit(-1)
+            self._desc_signal.emit(f"{self._stage} ({self._done:,} {self._unit})")
+        else:
+            self._percent_signal.emit(-1)
+            self._desc_signal.emit(self._stage)
@@ -1,14 +1,16 @@
 # Built-in Imports
 import os
 import sys
-from typing import Callable, Any
+import time
+from collections import deque
+from typing import Callable, Any, Iterable
 
 # Data Science and Third Party Imports
 
 # Machine Learning Imports
 
 # PyQt Imports
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QObject, pyqtSignal
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QFont
 from PyQt6.QtWidgets import QApplication, QMessageBox
 
@@ -132,3 +134,51 @@ class CallTimerManager:
             for callback in self.timers[timer_key]["callbacks"]:
                 callback()
             del self.timers[timer_key]
+
+
+class TimeSlicedRunner(QObject):
+    """
+    Runs a queue of small jobs on the GUI thread without blocking it. Jobs are taken
+    from a zero-delay timer until the time budget of the slice is used up, then
+    control goes back to the event loop until the next slice.
+    """
+    progress_signal = pyqtSignal(int, int)  # done, total
+    finished_signal = pyqtSignal()
+
+    def __init__(self, budget_ms: float = 12, parent: QObject | None = None):
+        super().__init__(parent)
+        self.budget = budget_ms / 1000
+        self._jobs: deque[Callable[[], Any]] = deque()
+        self._done = 0
+        self._total = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._run_slice)
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._jobs)
+
+    def start(self, jobs: Iterable[Callable[[], Any]]):
+        """Replace the pending jobs with `jobs`, run in the given order."""
+        self._jobs = deque(jobs)
+        self._done = 0
+        self._total = len(self._jobs)
+        self._timer.start()
+
+    def cancel(self):
+        self._jobs.clear()
+        self._timer.stop()
+
+    def _run_slice(self):
+        deadline = time.perf_counter() + self.budget
+        while self._jobs and time.perf_counter() < deadline:
+            self._jobs.popleft()()
+            self._done += 1
+
+        self.progress_signal.emit(self._done, self._total)
+        if self._jobs:
+            self._timer.start()
+        else:
+            self.finished_signal.emit()
@@ -0,0 +1,43 @@
+# Built-in Imports
+import math
+
+# Data Science and Third Party Imports
+import numpy as np
+
+
+def disk_offsets(radius: float) -> tuple[np.ndarray, np.ndarray]:
+    """Pixel offsets (dx, dy) covered by a disk of `radius` pixels; at least the center pixel."""
+    radius = max(radius, 0.5)
+    extent = int(math.ceil(radius))
+    dy, dx = np.mgrid[-extent:extent + 1, -extent:extent + 1].astype(np.int32)
+    inside = dx ** 2 + dy ** 2 <= radius ** 2
+    return dx[inside], dy[inside]
+
+
+def rasterize_circles(
+    image: np.ndarray, centers: np.ndarray, radius: float, rgba: np.ndarray, chunk_pixels: int = 1 << 22
+) -> None:
+    """
+    Splat filled circles into an (H, W, 4) uint8 image in place.
+
+    `centers` are (N, 2) pixel coordinates and `rgba` is one color for all circles
+    or an (N, 4) array with one color per circle. Later circles overwrite earlier
+    ones, so callers pass them in drawing order. Circles are expanded into about
+    `chunk_pixels` disk pixels at a time, which bounds the temporary index arrays
+    whatever the radius.
+    """
+    height, width = image.shape[:2]
+    dx, dy = disk_offsets(radius)
+    chunk_size = max(chunk_pixels // len(dx), 1)
+    rgba = np.asarray(rgba, dtype=np.uint8)
+    for start in range(0, len(centers), chunk_size):
+        # int32 pixel indices: the image is far smaller than 2**31 pixels a side
+        chunk = np.rint(centers[start:start + chunk_size]).astype(np.int32)
+        xs = (chunk[:, 0:1] + dx).ravel()
+        ys = (chunk[:, 1:2] + dy).ravel()
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        if rgba.ndim == 1:
+            image[ys[inside], xs[inside]] = rgba
+        else:
+            colors = np.repeat(rgba[start:start + chunk_size], len(dx), axis=0)
+            image[ys[inside], xs[inside]] = colors[inside]
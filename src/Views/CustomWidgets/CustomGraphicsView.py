@@ -3,25 +3,31 @@ import hashlib
 import math
 import types
 from collections import defaultdict
-from typing import Union, Literal, Dict, Tuple, Optional, Any
+from contextlib import contextmanager
+from typing import Union, Literal, Dict, Tuple, Optional, Any, Iterator
 
 # Data Science and Third Party Imports
 import numpy as np
-import pandas as pd
 
 # Machine Learning Imports
 
 # PyQt Imports
-from PyQt6.QtCore import Qt, QPoint, QRectF
+from PyQt6.QtCore import Qt, QPoint, QPointF, QRectF, QTimer, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import (
     QGraphicsView, QMenu, QApplication, QGraphicsPixmapItem, QGraphicsScene, QGraphicsItemGroup,
-    QGraphicsRectItem, QGraphicsTextItem, QWidget, QHBoxLayout, QPushButton,
+    QGraphicsRectItem, QGraphicsTextItem, QWidget, QHBoxLayout, QPushButton, QLabel,
 )
 from PyQt6.QtGui import QImage, QPixmap, QWheelEvent, QPainter, QPen, QMouseEvent, QColor, QBrush, QIcon, QPainterPath, \
-    QFont, QContextMenuEvent
+    QFont, QContextMenuEvent, QTransform, QPolygonF
 
+from src.Configs import RenderConfigs
+from src.Models.Components.SpatialIndex import SpatialIndex
 from src.Views.CustomWidgets.CustomGraphicsViewItems import CustomRectItem, CustomPathItem, CustomLineItem, \
-    CustomEllipseItem, CustomTextItem
+    CustomEllipseItem, CustomTextItem, PointCloudItem, BatchedCircleLayerItem, LodRasterItem, TiledLayerItem
+from src.Views.CustomWidgets.LayerIndex import LayerIndex
+from src.Views.CustomWidgets.LayerRasterizer import BoardTransform, CircleLayerDraw, RasterJob, render_circle_tile, \
+    render_lod_raster
+from src.Views.CustomWidgets.TileCache import TileCache
 
 # Type Hints
 DRAWING_TYPE_HINT = Literal["rect", "rect-fill", "line", "circle", "text", "rect-fill-hole", "triangle", "vline", "hline"]
@@ -30,6 +36,15 @@ DRAWING_TYPE_HINT = Literal["rect", "rect-fill", "line", "circle", "text", "rect
 class CustomGraphicsView(QGraphicsView):
     ZOOM_UNIT = 0.005
 
+    pad_hovered_signal = pyqtSignal(object)  # obj_id of the circle under the mouse, None when there is none
+    region_selected_signal = pyqtSignal(object, bool)  # obj_ids of the visible circles in the region, drag finished
+
+    # How circle layers are drawn
+    VECTOR = "vector"   # The circle items paint themselves
+    RASTER = "raster"   # Level-of-detail raster, below lod_scale_threshold
+    TILES = "tiles"     # Cached tiles, above lod_scale_threshold
+    VIRTUAL = "virtual" # One item per pad around the viewport, above virtual_scale_threshold
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMouseTracking(True)
@@ -41,17 +56,103 @@ class CustomGraphicsView(QGraphicsView):
         self.h: int = 0
         self.w: int = 0
 
+        # Solid canvas painted in drawBackground (no pixel buffer), used instead of an image
+        self._canvas_color: Optional[QColor] = None
+
         self.setScene(QGraphicsScene())
         self.image_item = QGraphicsPixmapItem()
         self.scene().addItem(self.image_item)
+        self._board_root = self._create_board_root()
+
+        # Circle layers are shown as one raster below the threshold scale and through the
+        # tile cache above it; the circle items themselves are only painted in VECTOR mode
+        self.lod_scale_threshold: float = RenderConfigs.LOD_SCALE_THRESHOLD
+        self.tile_cache_enabled: bool = RenderConfigs.TILE_CACHE_ENABLED
+        self._circle_mode = self.VECTOR
+        self._lod_dirty = True
+        self._lod_item = self._create_lod_item()
+        self._lod_timer = QTimer(self)
+        self._lod_timer.setSingleShot(True)
+        self._lod_timer.timeout.connect(self._rebuild_lod)
+        self._tile_cache = TileCache()
+        self._tile_item = self._create_tile_item()
+        self._tile_layer_state: Optional[np.ndarray] = None  # Visibility / highlight of each layer
+        # Per tile (tx, ty, zoom) of the current zoom: the overlapping layers, which only change with the
+        # layer bounds or the board transform, and the state hash, which also changes with the layer state
+        self._tile_layers: Dict[tuple, np.ndarray] = {}
+        self._tile_states: Dict[tuple, int] = {}
+        self._tile_layers_zoom: Optional[float] = None
+
+        # The raster and the tiles are rendered on worker threads into QImages; results of a
+        # superseded generation are dropped when they arrive
+        self._raster_pool = QThreadPool(self)
+        self._raster_jobs: Dict[Any, RasterJob] = {}
+        self._layer_draws: Dict[int, list[CircleLayerDraw]] = {}  # Per layer index, built on demand
+        self._lod_job_pending = False
+        self._lod_generation = 0
+        self._tile_generation = 0
+
+        # Close up, pads are real items again, but only those around the viewport; items that
+        # scroll out are hidden and reused for the pads scrolling in
+        self.virtual_items_enabled: bool = RenderConfigs.VIRTUAL_ITEMS_ENABLED
+        self.virtual_scale_threshold: float = RenderConfigs.VIRTUAL_SCALE_THRESHOLD
+        self._circle_pads: Optional[dict] = None  # Pads of all circle items, built on demand (virtual items, hover)
+        # Index given by set_pad_index(), where point i is the circle with obj_id i, and which
+        # circle item draws each of its points (-1: none), recorded as the items are added
+        self._pad_index: Optional[SpatialIndex] = None
+        self._pad_items: Optional[np.ndarray] = None
+        self._pad_item_list: list[BatchedCircleLayerItem] = []
+        self._pad_item_layers: list[int] = []
+        # Without a pad index, layers streaming in keep the current pads until they stop arriving
+        self._circle_pads_timer = QTimer(self)
+        self._circle_pads_timer.setSingleShot(True)
+        self._circle_pads_timer.setInterval(RenderConfigs.PAD_REINDEX_DELAY_MS)
+        self._circle_pads_timer.timeout.connect(self._reindex_circle_pads)
+        self._virtual_items: Dict[int, CustomEllipseItem] = {}  # Pad index -> materialized item
+        self._virtual_pool: list[CustomEllipseItem] = []
+        self._virtual_group: Optional[QGraphicsItemGroup] = None
+        self._virtual_stale = False  # Layer state changed; the materialized items must be rebuilt
+        self._virtual_timer = QTimer(self)
+        self._virtual_timer.setSingleShot(True)
+        self._virtual_timer.timeout.connect(self._update_virtual_items)
 
         self._panning = False
         self._pan_start = QPoint()
 
+        # Hover inspection: the pad under the mouse is looked up in the pad index, throttled
+        self._hover_pos: Optional[QPoint] = None
+        self._hover_obj_id: Any = None
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(RenderConfigs.HOVER_INTERVAL_MS)
+        self._hover_timer.timeout.connect(self._update_hover)
+
+        # Region selection: Shift-drag draws a rectangle, Alt-drag a lasso; the circles inside
+        # are found in the pad index while dragging, throttled like the hover lookup
+        self._region_mode: Optional[Literal["rect", "lasso"]] = None
+        self._region_points: list[QPointF] = []  # Scene coordinates
+        self._region_timer = QTimer(self)
+        self._region_timer.setSingleShot(True)
+        self._region_timer.setInterval(RenderConfigs.HOVER_INTERVAL_MS)
+        self._region_timer.timeout.connect(lambda: self._emit_region_selection(finished=False))
+
         # Initialize annotation layers
         self._layer_groups: Dict[str, QGraphicsItemGroup] = {}
-        self._df_layer_info: pd.DataFrame = pd.DataFrame(columns=["layer_name", "component_type", "component_size", "component_id", "line_id", "panel_id"])
-        self._pending_layer_info: list = []
+        self._layer_index: Dict[str, int] = {}
+        self._layer_visible: list[bool] = []
+        self._layer_highlight: list[bool] = []
+        self._layer_bounds: list[list[float]] = []  # x1, y1, x2, y2 of each layer's circles, in board units
+        self._layer_bounds_array: Optional[np.ndarray] = None
+        self._layer_info = LayerIndex(["component_type", "component_size", "component_id", "line_id", "panel_id"])
+        self._layer_group_list: list[QGraphicsItemGroup] = []  # By layer index
+
+        # Visibility / highlight changes collected by batch_update() and applied once on commit()
+        self._batch_depth = 0
+        self._batch_visibility: Dict[int, bool] = {}
+        self._batch_highlight: Dict[int, bool] = {}
+
+        # Streaming preview layer (child of the board root)
+        self._preview_group: Optional[QGraphicsItemGroup] = None
 
         # Initialize drawing variables
         self.left_drawing = False
@@ -61,6 +162,36 @@ class CustomGraphicsView(QGraphicsView):
 
         # Initialize floating controls
         self._init_floating_controls()
+        self._init_hover_panel()
+
+        self.horizontalScrollBar().valueChanged.connect(self._on_viewport_moved)
+        self.verticalScrollBar().valueChanged.connect(self._on_viewport_moved)
+
+    def _create_board_root(self) -> QGraphicsItemGroup:
+        """
+        Parent of all annotation layers. Items are placed in board coordinates and the
+        root's transform maps them onto the canvas, so a canvas geometry change is a
+        single set_board_transform() call instead of moving every item.
+        """
+        board_root = QGraphicsItemGroup()
+        board_root.setZValue(1)
+        self.scene().addItem(board_root)
+        return board_root
+
+    def _create_lod_item(self) -> LodRasterItem:
+        lod_item = LodRasterItem()
+        lod_item.setZValue(1)
+        lod_item.setVisible(self._circle_mode == self.RASTER)
+        self.scene().addItem(lod_item)
+        return lod_item
+
+    def _create_tile_item(self) -> TiledLayerItem:
+        tile_item = TiledLayerItem(self._tile_cache, self._render_tile, self._tile_state)
+        tile_item.setZValue(1)
+        tile_item.setVisible(self._circle_mode == self.TILES)
+        tile_item.set_rect(QRectF(0, 0, self.w, self.h))
+        self.scene().addItem(tile_item)
+        return tile_item
 
     def _register_annotation_layer(
         self,
@@ -70,8 +201,14 @@ class CustomGraphicsView(QGraphicsView):
         """Register an annotation layer and set its Z-order."""
         layer_group = QGraphicsItemGroup()
         layer_group.setZValue(z_priority)
-        self.scene().addItem(layer_group)
+        layer_group.setParentItem(self._board_root)
         self._layer_groups[layer_name] = layer_group
+        self._layer_index[layer_name] = len(self._layer_visible)
+        self._layer_group_list.append(layer_group)
+        self._layer_visible.append(True)
+        self._layer_highlight.append(False)
+        self._layer_bounds.append([math.inf, math.inf, -math.inf, -math.inf])
+        self._invalidate_layer_bounds()
 
     def _clear_layer_items(self, layer_name: str) -> None:
         """Clear all annotation items in the specified layer."""
@@ -81,6 +218,7 @@ class CustomGraphicsView(QGraphicsView):
         for item in layer_group.childItems():
             layer_group.removeFromGroup(item)
             self.scene().removeItem(item)
+        self._circle_pads = None
 
     @property
     def layer_names(self) -> list[str]:
@@ -100,25 +238,62 @@ class CustomGraphicsView(QGraphicsView):
                 self.scene().removeItem(item)
             self.scene().removeItem(group)
         self._layer_groups.clear()
+        self._reset_layer_state()
 
     def clear_all(self):
         """清除所有圖層與影像"""
         self.scene().clear()
         self._layer_groups.clear()
-        self._df_layer_info = self._df_layer_info.iloc[0:0]
-        self._pending_layer_info.clear()
+        self._preview_group = None
+        self._virtual_group = None
+        self._virtual_items.clear()
+        self._virtual_pool.clear()
+        self._set_hovered(None)
+        self._pad_index = self._pad_items = None
         self.image_item = QGraphicsPixmapItem()
         self.scene().addItem(self.image_item)
-
-    def layer_info_flush(self):
-        """Flush the pending layer info to the DataFrame."""
-        if not self._pending_layer_info:
-            return
-
-        # Create a DataFrame from the pending layer info
-        df = pd.DataFrame(self._pending_layer_info)
-        self._df_layer_info = pd.concat([self._df_layer_info, df], ignore_index=True)
-        self._pending_layer_info.clear()
+        self._board_root = self._create_board_root()
+        self._lod_item = self._create_lod_item()
+        self._tile_item = self._create_tile_item()
+        self._reset_layer_state()
+
+    def _reset_layer_state(self):
+        self._layer_index.clear()
+        self._layer_group_list.clear()
+        self._batch_visibility.clear()
+        self._batch_highlight.clear()
+        self._layer_info.clear()
+        self._layer_visible.clear()
+        self._layer_highlight.clear()
+        self._layer_bounds.clear()
+        self._invalidate_layer_bounds()
+        self._pad_item_list.clear()
+        self._pad_item_layers.clear()
+        if self._pad_items is not None:
+            self._pad_items.fill(-1)
+        self._invalidate_rasters(geometry=True)
+
+    def add_preview_points(self, xs: np.ndarray, ys: np.ndarray, color: Union[str, QColor]) -> None:
+        """Add a point cloud in board coordinates to the preview layer shown while a file is streaming."""
+        if self._preview_group is None:
+            self._preview_group = QGraphicsItemGroup()
+            self._preview_group.setParentItem(self._board_root)
+        PointCloudItem(xs, ys, QColor(color)).setParentItem(self._preview_group)
+
+    def set_board_transform(self, scale: float, dx: float, dy: float) -> None:
+        """Map board coordinates onto the canvas: canvas = board * scale + (dx, dy)."""
+        self._board_root.setTransform(QTransform(scale, 0, 0, scale, dx, dy))
+        self._invalidate_rasters(geometry=True)
+
+    def set_circle_radius(self, radius: float, width: float) -> None:
+        """Resize every circle in place (board units), e.g. after the board scale changed."""
+        for layer_group in self._layer_groups.values():
+            for item in layer_group.childItems():
+                if isinstance(item, BatchedCircleLayerItem):
+                    item.set_radius(radius, width)
+        for layer_name in self._layer_groups:
+            self._update_layer_bounds(layer_name)
+        self._invalidate_rasters(geometry=True)
 
     def add_items_to_layer(
         self,
@@ -132,6 +307,10 @@ class CustomGraphicsView(QGraphicsView):
         h_align: str = "left",
         v_align: str = "top",
     ) -> None:
+        """
+        Add shapes to a layer. Coordinates, sizes and pen widths are in board units,
+        mapped onto the canvas by set_board_transform() (identity by default).
+        """
         if not shapes:
             return
 
@@ -139,26 +318,14 @@ class CustomGraphicsView(QGraphicsView):
         if isinstance(color, str) and color.startswith("#"):
             color = QColor(color)
 
-        # Add layer info to the DataFrame
-        self._pending_layer_info.append(layer_info)
-
-        # 自動註冊 layer
-        layer_group = self._layer_groups.get(layer_name)
-        if layer_group is None:
-            z_priority = len(self._layer_groups)
-            self._register_annotation_layer(layer_name, z_priority=z_priority)
-            layer_group = self._layer_groups[layer_name]
+        layer_group = self._get_or_register_layer(layer_name, layer_info)
 
         # 先收集所有 obj_id，從畫面上移除同名物件
         incoming_obj_ids = set()
         for shape_list in shapes.values():
             for _, obj_id in shape_list:
                 incoming_obj_ids.add(obj_id)
-
-        for item in list(layer_group.childItems()):
-            if getattr(item, "obj_id", None) in incoming_obj_ids:
-                layer_group.removeFromGroup(item)
-                self.scene().removeItem(item)
+        self._remove_layer_objects(layer_group, incoming_obj_ids)
 
         # 畫圖形
         for (x1, y1, x2, y2), obj_id in shapes.get("rect", []):
@@ -167,7 +334,7 @@ class CustomGraphicsView(QGraphicsView):
             item = CustomRectItem(x, y, w, h, base_color=color, obj_id=obj_id)
             item.setPen(QPen(color, width))
             item.setOpacity(opacity)
-            layer_group.addToGroup(item)
+            item.setParentItem(layer_group)
 
         # rect-fill
         for (x1, y1, x2, y2), obj_id in shapes.get("rect-fill", []):
@@ -176,7 +343,7 @@ class CustomGraphicsView(QGraphicsView):
             item = CustomRectItem(x, y, w, h, base_color=color, obj_id=obj_id)
             item.setBrush(QBrush(color, Qt.BrushStyle.SolidPattern))
             item.setOpacity(opacity)
-            layer_group.addToGroup(item)
+            item.setParentItem(layer_group)
 
         for (x1, y1, x2, y2, holes), obj_id in shapes.get("rect-fill-hole", []):
             path = QPainterPath()
@@ -188,7 +355,7 @@ class CustomGraphicsView(QGraphicsView):
             item = CustomPathItem(path, base_color=color, obj_id=obj_id)
             item.setBrush(QBrush(color, Qt.BrushStyle.SolidPattern))
             item.setOpacity(opacity)
-            layer_group.addToGroup(item)
+            item.setParentItem(layer_group)
 
         for (x1, y1, x2, y2, x3, y3), obj_id in shapes.get("triangle", []):
             path = QPainterPath()
@@ -200,32 +367,38 @@ class CustomGraphicsView(QGraphicsView):
             item.setPen(QPen(color, width))
             item.setBrush(QBrush(color, Qt.BrushStyle.SolidPattern))
             item.setOpacity(opacity)
-            layer_group.addToGroup(item)
+            item.setParentItem(layer_group)
 
         for (x1, y1, x2, y2), obj_id in shapes.get("line", []):
             item = CustomLineItem(x1, y1, x2, y2, base_color=color, obj_id=obj_id)
             item.setPen(QPen(color, width))
             item.setOpacity(opacity)
-            layer_group.addToGroup(item)
+            item.setParentItem(layer_group)
 
+        # Full-height / full-width lines span the canvas, expressed in board coordinates
+        canvas_rect = self._board_root.transform().inverted()[0].mapRect(QRectF(0, 0, self.w, self.h))
         for x, obj_id in shapes.get("vline", []):
-            item = CustomLineItem(x, 0, x, self.h, base_color=color, obj_id=obj_id)
+            item = CustomLineItem(x, canvas_rect.top(), x, canvas_rect.bottom(), base_color=color, obj_id=obj_id)
             item.setPen(QPen(color, width))
             item.setOpacity(opacity)
-            layer_group.addToGroup(item)
+            item.setParentItem(layer_group)
 
         for y, obj_id in shapes.get("hline", []):
-            item = CustomLineItem(0, y, self.w, y, base_color=color, obj_id=obj_id)
+            item = CustomLineItem(canvas_rect.left(), y, canvas_rect.right(), y, base_color=color, obj_id=obj_id)
             item.setPen(QPen(color, width))
             item.setOpacity(opacity)
-            layer_group.addToGroup(item)
+            item.setParentItem(layer_group)
 
+        # Circles are batched into one item per radius
+        circles_by_radius = defaultdict(list)
         for (cx, cy, r), obj_id in shapes.get("circle", []):
-            item = CustomEllipseItem(cx - r, cy - r, 2 * r, 2 * r, base_color=color, obj_id=obj_id)
-            item.setPen(QPen(color, width))
-            item.setBrush(color)
-            item.setOpacity(opacity)
-            layer_group.addToGroup(item)
+            circles_by_radius[r].append((cx, cy, obj_id))
+        for r, circles in circles_by_radius.items():
+            cxs, cys, obj_ids = zip(*circles)
+            self._add_circle_item(layer_name, np.column_stack([cxs, cys]), r, obj_ids, color, opacity, width)
+        if circles_by_radius:
+            self._update_layer_bounds(layer_name)
+            self._invalidate_rasters(layer_name=layer_name)
 
         for (x, y, txt), obj_id in shapes.get("text", []):
             item = CustomTextItem(txt, base_color=color, obj_id=obj_id)
@@ -237,73 +410,577 @@ class CustomGraphicsView(QGraphicsView):
             br = item.boundingRect()
             item.setX(x - (br.width() / 2 if h_align == "center" else br.width() if h_align == "right" else 0))
             item.setY(y - (br.height() / 2 if v_align == "middle" else br.height() if v_align == "bottom" else 0))
-            layer_group.addToGroup(item)
+            item.setParentItem(layer_group)
 
-    def set_layer_highlight(self, layer_name: str, highlight: bool):
-        """Set the highlight state of the specified layer."""
+    def add_circles_to_layer(
+        self,
+        layer_name: str,
+        layer_info: dict,
+        centers: np.ndarray,
+        radius: float,
+        obj_ids: np.ndarray,
+        color: Union[str, QColor],
+        opacity: float = 1.0,
+        width: float = 2,
+    ) -> None:
+        """
+        Add equally sized circles to a layer from arrays: centers is an (N, 2) array of
+        board coordinates and obj_ids holds one id per center. Same result as the "circle"
+        shape of add_items_to_layer(), without building a tuple per circle.
+        """
+        centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+        obj_ids = np.asarray(obj_ids)
+        if not len(centers):
+            return
+        if len(obj_ids) != len(centers):
+            raise ValueError(f"Got {len(obj_ids)} obj_ids for {len(centers)} circles")
+
+        if isinstance(color, str) and color.startswith("#"):
+            color = QColor(color)
+
+        layer_group = self._get_or_register_layer(layer_name, layer_info)
+        self._remove_layer_objects(layer_group, obj_ids)
+        self._add_circle_item(layer_name, centers, radius, obj_ids, color, opacity, width)
+        self._update_layer_bounds(layer_name)
+        self._invalidate_rasters(layer_name=layer_name)
+
+    def _get_or_register_layer(self, layer_name: str, layer_info: dict) -> QGraphicsItemGroup:
+        # 自動註冊 layer; its info is indexed once, under the same id as the layer
         layer_group = self._layer_groups.get(layer_name)
         if layer_group is None:
+            z_priority = len(self._layer_groups)
+            self._register_annotation_layer(layer_name, z_priority=z_priority)
+            self._layer_info.add(layer_name, layer_info)
+            layer_group = self._layer_groups[layer_name]
+        return layer_group
+
+    def _remove_layer_objects(self, layer_group: QGraphicsItemGroup, obj_ids):
+        """Remove the items of a layer whose obj_id is in obj_ids (a set or an array)."""
+        obj_id_set = None
+        for item in list(layer_group.childItems()):
+            if isinstance(item, BatchedCircleLayerItem):
+                if self._pad_items is not None:
+                    ids = list(obj_ids) if isinstance(obj_ids, (set, frozenset)) else obj_ids
+                    self._pad_items[item.obj_ids[np.isin(item.obj_ids, ids)].astype(np.int64)] = -1
+                count = len(item)
+                item.remove_objects(obj_ids)
+                if len(item) != count:
+                    self._circle_pads = None
+                if len(item) == 0:
+                    self.scene().removeItem(item)
+                continue
+            obj_id = getattr(item, "obj_id", None)
+            if obj_id is None:
+                continue
+            if obj_id_set is None:
+                obj_id_set = obj_ids if isinstance(obj_ids, (set, frozenset)) else set(obj_ids.tolist())
+            if obj_id in obj_id_set:
+                layer_group.removeFromGroup(item)
+                self.scene().removeItem(item)
+
+    def _add_circle_item(self, layer_name: str, centers, radius, obj_ids, color: QColor, opacity: float, width: float):
+        item = BatchedCircleLayerItem(centers, radius, base_color=color, obj_ids=obj_ids, width=width)
+        item.setOpacity(opacity)
+        item.setVisible(self._circle_mode == self.VECTOR)
+        item.setParentItem(self._layer_groups[layer_name])
+        if self._pad_index is not None:
+            self._pad_item_list.append(item)
+            self._pad_item_layers.append(self._layer_index[layer_name])
+            self._register_pad_item(len(self._pad_item_list) - 1)
+
+    def set_pad_index(self, index: Optional[SpatialIndex]) -> None:
+        """
+        Answer hover, region selection and virtual item lookups from an index over the
+        pads, e.g. SpiComponentManager.get_spatial_index(): point i of the index is the
+        circle added with obj_id i, so circles must then be added with integer obj_ids.
+        A new layer only records which item draws its rows instead of re-indexing every
+        shown pad. With None, the view indexes the shown circles itself after changes.
+        """
+        self._pad_index = index
+        self._pad_items = None if index is None else np.full(len(index), -1, dtype=np.int32)
+        self._pad_item_list.clear()
+        self._pad_item_layers.clear()
+        if index is not None:
+            for layer_index, layer_group in enumerate(self._layer_group_list):
+                for item in layer_group.childItems():
+                    if isinstance(item, BatchedCircleLayerItem):
+                        self._pad_item_list.append(item)
+                        self._pad_item_layers.append(layer_index)
+                        self._register_pad_item(len(self._pad_item_list) - 1)
+        self._circle_pads = None
+        self._virtual_stale = True
+
+    def _register_pad_item(self, number: int):
+        """Point the index rows drawn by pad item `number` at it."""
+        self._grow_pad_items()
+        self._pad_items[self._pad_item_list[number].visible_objects()[1].astype(np.int64)] = number
+
+    def set_layer_highlight(self, layer_name: str, highlight: bool):
+        """Set the highlight state of the specified layer."""
+        index = self._layer_index.get(layer_name)
+        if index is None:
             raise ValueError(f"Invalid layer: {layer_name}")
-        for item in layer_group.childItems():
-            item.set_highlight(highlight)
+        with self.batch_update():
+            self._batch_highlight[index] = highlight
 
     def set_layer_visibility(self, layer_name: str, visible: bool):
         """Set the visibility of the specified layer."""
-        layer_group = self._layer_groups.get(layer_name)
-        if layer_group is None:
+        index = self._layer_index.get(layer_name)
+        if index is None:
             raise ValueError(f"Invalid layer: {layer_name}")
-        layer_group.setVisible(visible)
+        with self.batch_update():
+            self._batch_visibility[index] = visible
+
+    @contextmanager
+    def batch_update(self):
+        """
+        Collect layer visibility / highlight changes made inside the block and apply
+        them together when the outermost block exits, see begin_batch() / commit().
+        """
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.commit()
+
+    def begin_batch(self):
+        """Start collecting layer changes; batches nest, only the outermost commit() applies them."""
+        self._batch_depth += 1
+
+    def commit(self):
+        """
+        Apply the collected changes in one pass. Only the last state requested for a
+        layer counts and layers that end up unchanged are skipped, so hiding every layer
+        and showing most of them again touches only the difference. The caches are
+        invalidated once and the union of the changed layers is repainted once.
+        """
+        self._batch_depth -= 1
+        if self._batch_depth > 0:
+            return
+
+        visibility = {i: v for i, v in self._batch_visibility.items() if self._layer_visible[i] != v}
+        highlight = {i: h for i, h in self._batch_highlight.items() if self._layer_highlight[i] != h}
+        self._batch_visibility.clear()
+        self._batch_highlight.clear()
+        if not visibility and not highlight:
+            return
+
+        for index, visible in visibility.items():
+            self._layer_group_list[index].setVisible(visible)
+            self._layer_visible[index] = visible
+        for index, highlighted in highlight.items():
+            for item in self._layer_group_list[index].childItems():
+                item.set_highlight(highlighted)
+            self._layer_highlight[index] = highlighted
+            self._layer_draws.pop(index, None)
+        self._invalidate_rasters(dirty_rect=self._layers_scene_rect(visibility.keys() | highlight.keys()))
+
+    def _layers_scene_rect(self, layer_indexes) -> Optional[QRectF]:
+        """Scene rect covering the circles of the given layers; None when a layer has other shapes or none."""
+        bounds = np.array([self._layer_bounds[index] for index in layer_indexes], dtype=np.float64).reshape(-1, 4)
+        if not np.isfinite(bounds).all():
+            return None
+        x1, y1 = bounds[:, :2].min(axis=0)
+        x2, y2 = bounds[:, 2:].max(axis=0)
+        return self._board_root.transform().mapRect(QRectF(x1, y1, x2 - x1, y2 - y1))
 
     def close_layer(self, target: str):
-        layer_names = self._df_layer_info[self._df_layer_info[target].notna()]['layer_name'].tolist()
-        for layer_name in layer_names:
-            self.set_layer_visibility(layer_name, False)
+        """Hide every layer that has a value for the `target` attribute."""
+        with self.batch_update():
+            for layer_id in self._layer_info.with_attribute(target).tolist():
+                self._batch_visibility[layer_id] = False
 
     def set_layer_highlight_with_condition(self, conditions: dict, highlight: bool = True):
-        for layer_name in self._get_layer_names_by_condition(**conditions):
-            self.set_layer_highlight(layer_name, highlight)
+        self.set_layer_highlight_with_conditions([(conditions, highlight)])
 
     def set_layer_visibility_with_condition(self, conditions: dict, visible: bool = True):
-        for layer_name in self._get_layer_names_by_condition(**conditions):
-            self.set_layer_visibility(layer_name, visible)
+        self.set_layer_visibility_with_conditions([(conditions, visible)])
 
-    def _get_layer_names_by_condition(
-        self,
-        component_type: str | None = None,
-        component_size: str | None = None,
-        component_id: str | None = None,
-        line_id: str | None = None,
-        panel_id: str | None = None,
-    ) -> list[str]:
-        conditions = []
-
-        if component_type is not None:
-            conditions.append(self._df_layer_info['component_type'] == component_type)
-        if component_size is not None:
-            conditions.append(self._df_layer_info['component_size'] == component_size)
-        if component_id is not None:
-            conditions.append(self._df_layer_info['component_id'] == component_id)
-        if line_id is not None:
-            conditions.append(self._df_layer_info['line_id'] == line_id)
-        if panel_id is not None:
-            conditions.append(self._df_layer_info['panel_id'] == panel_id)
-
-        if conditions:
-            final_condition = conditions[0]
-            for cond in conditions[1:]:
-                final_condition &= cond
-            layer_names = self._df_layer_info[final_condition]['layer_name'].tolist()
-        else:
-            layer_names = self._df_layer_info['layer_name'].tolist()
+    def set_layer_highlight_with_conditions(self, changes: list[Tuple[dict, bool]]):
+        """Apply several (conditions, highlight) pairs, in order, with one batched layer query."""
+        with self.batch_update():
+            for layer_ids, (_, highlight) in zip(self._layer_info.query_many(c for c, _ in changes), changes):
+                self._batch_highlight.update(dict.fromkeys(layer_ids.tolist(), highlight))
 
-        return layer_names
+    def set_layer_visibility_with_conditions(self, changes: list[Tuple[dict, bool]]):
+        """Apply several (conditions, visible) pairs, in order, with one batched layer query."""
+        with self.batch_update():
+            for layer_ids, (_, visible) in zip(self._layer_info.query_many(c for c, _ in changes), changes):
+                self._batch_visibility.update(dict.fromkeys(layer_ids.tolist(), visible))
 
     def set_object_visibility(self, obj_id: str, visible: bool):
         """根據 obj_id 設定個別圖層物件的可見性"""
         for layer_group in self._layer_groups.values():
             for item in layer_group.childItems():
-                if getattr(item, "obj_id", None) == obj_id:
+                if isinstance(item, BatchedCircleLayerItem):
+                    item.set_object_visibility(obj_id, visible)
+                elif getattr(item, "obj_id", None) == obj_id:
                     item.setVisible(visible)
+        if self._pad_items is not None:
+            self._pad_items[obj_id] = -1
+            if visible:
+                for number, item in enumerate(self._pad_item_list):
+                    if item.scene() is not None and (item.obj_ids == obj_id).any():
+                        self._register_pad_item(number)
+        self._invalidate_rasters(geometry=True)
+
+    def _iter_circle_items(self) -> Iterator[Tuple[QGraphicsItemGroup, BatchedCircleLayerItem]]:
+        for layer_group in self._layer_groups.values():
+            for item in layer_group.childItems():
+                if isinstance(item, BatchedCircleLayerItem):
+                    yield layer_group, item
+
+    def set_lod_threshold(self, threshold: float):
+        """Set the view scale below which circle layers are drawn from the raster."""
+        self.lod_scale_threshold = threshold
+        self._update_circle_mode()
+
+    def _update_circle_mode(self):
+        if not self.has_canvas:
+            self._set_circle_mode(self.VECTOR)
+        elif self._scale_value < self.lod_scale_threshold:
+            self._set_circle_mode(self.RASTER)
+        elif self.virtual_items_enabled and self._scale_value >= self.virtual_scale_threshold:
+            self._set_circle_mode(self.VIRTUAL)
+        else:
+            self._set_circle_mode(self.TILES if self.tile_cache_enabled else self.VECTOR)
+
+    def _set_circle_mode(self, mode: str):
+        """Choose what draws the circle layers: the items, the LOD raster, the tile cache or pad items."""
+        if mode == self._circle_mode:
+            return
+        self._circle_mode = mode
+        for _, item in self._iter_circle_items():
+            item.setVisible(mode == self.VECTOR)
+        if mode == self.RASTER and self._lod_dirty:
+            self._rebuild_lod()
+        self._lod_item.setVisible(mode == self.RASTER)
+        self._tile_item.setVisible(mode == self.TILES)
+        if mode == self.VIRTUAL:
+            self._update_virtual_items()
+        else:
+            self._release_virtual_items()
+
+    def _invalidate_rasters(
+        self, geometry: bool = False, layer_name: Optional[str] = None, dirty_rect: Optional[QRectF] = None
+    ):
+        """
+        Mark the LOD raster stale after a layer change. The tile keys hash the layers
+        overlapping each tile with their visibility and highlight, so a visibility
+        change or a new layer only affects the tiles it touches; geometry changes of
+        the whole board (transform, radius, object visibility) drop every cached tile.
+        """
+        self._lod_dirty = True
+        self._lod_generation += 1
+        self._tile_layer_state = None
+        self._tile_states.clear()
+        self._virtual_stale = True
+        if layer_name is not None:
+            self._layer_draws.pop(self._layer_index[layer_name], None)
+        if geometry:
+            self._circle_pads = None
+        elif layer_name is not None and self._pad_index is None and self._circle_pads is not None:
+            # Re-indexing every shown pad per layer would stall progressive rendering
+            self._circle_pads_timer.start()
+        if geometry:
+            self._layer_draws.clear()
+            self._tile_layers.clear()
+            self._tile_generation += 1
+            self._tile_cache.clear()
+
+        # Layer changes come in bursts; rebuild once the event loop is idle again
+        if self._circle_mode == self.RASTER:
+            self._lod_timer.start()
+        elif self._circle_mode == self.TILES:
+            # Only the tiles under the changed layers need repainting, when that area is known
+            if dirty_rect is None:
+                self._tile_item.update()
+            else:
+                self._tile_item.update(dirty_rect)
+        elif self._circle_mode == self.VIRTUAL:
+            self._virtual_timer.start()
+
+    def _reindex_circle_pads(self):
+        self._circle_pads = None
+        self._virtual_stale = True
+        if self._circle_mode == self.VIRTUAL:
+            self._virtual_timer.start()
+
+    def _on_viewport_moved(self):
+        if self._circle_mode == self.VIRTUAL:
+            self._virtual_timer.start()
+
+    def _get_circle_pads(self) -> dict:
+        """
+        A grid index over the pads, the circle item drawing each indexed pad ("pad_items",
+        -1 for none) and the layer and radius of each item. obj_ids is None when the
+        index rows are the obj_ids themselves, see set_pad_index().
+        """
+        if self._pad_index is not None:
+            self._update_pad_item_arrays()
+        elif self._circle_pads is None:
+            self._circle_pads_timer.stop()
+            items, item_layers, centers, obj_ids, pad_items = [], [], [], [], []
+            for layer_name, index in self._layer_index.items():
+                for item in self._layer_groups[layer_name].childItems():
+                    if isinstance(item, BatchedCircleLayerItem):
+                        item_centers, item_obj_ids = item.visible_objects()
+                        centers.append(item_centers)
+                        obj_ids.append(item_obj_ids)
+                        pad_items.append(np.full(len(item_centers), len(items), dtype=np.int64))
+                        items.append(item)
+                        item_layers.append(index)
+
+            centers = np.concatenate(centers) if centers else np.empty((0, 2))
+            self._circle_pads = {
+                "items": items,
+                "item_layers": np.array(item_layers, dtype=np.int64),
+                "item_radii": np.array([item.radius + item.outline_width / 2 for item in items], dtype=np.float64),
+                "obj_ids": np.concatenate(obj_ids) if obj_ids else np.empty(0, dtype=object),
+                "pad_items": np.concatenate(pad_items) if pad_items else np.empty(0, dtype=np.int64),
+                "index": SpatialIndex(centers[:, 0], centers[:, 1]),
+            }
+        return self._circle_pads
+
+    def _update_pad_item_arrays(self):
+        """Per item layer / radius arrays for the pad index; items added since the last call are appended."""
+        pads = self._circle_pads
+        items = self._pad_item_list
+        start = 0 if pads is None else len(pads["item_layers"])
+        if start == len(items):
+            return
+        self._grow_pad_items()
+        # Items removed from the scene point at the extra, hidden layer slot, see _shown_pads()
+        item_layers = np.array([
+            layer if item.scene() is not None else -1 for item, layer in zip(items[start:], self._pad_item_layers[start:])
+        ], dtype=np.int64)
+        item_radii = np.array([item.radius + item.outline_width / 2 for item in items[start:]], dtype=np.float64)
+        if pads is not None:
+            item_layers = np.concatenate([pads["item_layers"], item_layers])
+            item_radii = np.concatenate([pads["item_radii"], item_radii])
+        self._circle_pads = {
+            "items": items,
+            "item_layers": item_layers,
+            "item_radii": item_radii,
+            "obj_ids": None,
+            "pad_items": self._pad_items,
+            "index": self._pad_index,
+        }
+
+    def _grow_pad_items(self):
+        # The index grows in place when the manager appends rows after set_pad_index()
+        if len(self._pad_items) < len(self._pad_index):
+            self._pad_items = np.concatenate([
+                self._pad_items, np.full(len(self._pad_index) - len(self._pad_items), -1, dtype=np.int32)
+            ])
+
+    def _shown_pads(self, pads: dict, candidates: np.ndarray) -> np.ndarray:
+        """The candidate pads drawn by a circle item of a visible layer."""
+        if not len(candidates):
+            return candidates
+        pad_items = pads["pad_items"][candidates]
+        drawn = pad_items >= 0
+        candidates, pad_items = candidates[drawn], pad_items[drawn]
+        layer_visible = np.array(self._layer_visible + [False], dtype=bool)
+        return candidates[layer_visible[pads["item_layers"][pad_items]]]
+
+    @staticmethod
+    def _pad_obj_ids(pads: dict, pad_indexes):
+        return pad_indexes if pads["obj_ids"] is None else pads["obj_ids"][pad_indexes]
+
+    def _update_virtual_items(self):
+        """Materialize the pads of visible layers around the viewport, recycling the items of pads that left it."""
+        self._virtual_timer.stop()
+        if self._circle_mode != self.VIRTUAL:
+            return
+        if self._virtual_stale:
+            self._release_virtual_items()
+            self._virtual_stale = False
+
+        pads = self._get_circle_pads()
+        view_rect = self.mapToScene(self.viewport().rect()).boundingRect()
+        margin_x = view_rect.width() * RenderConfigs.VIRTUAL_MARGIN
+        margin_y = view_rect.height() * RenderConfigs.VIRTUAL_MARGIN
+        view_rect.adjust(-margin_x, -margin_y, margin_x, margin_y)
+        rect = self._board_root.transform().inverted()[0].mapRect(view_rect)
+        needed = self._shown_pads(pads, pads["index"].query_rect(rect.left(), rect.top(), rect.right(), rect.bottom()))
+
+        if len(needed) > RenderConfigs.VIRTUAL_MAX_ITEMS:
+            # Too dense to materialize; the tiles take over until the next zoom
+            self._set_circle_mode(self.TILES if self.tile_cache_enabled else self.VECTOR)
+            return
+
+        current = np.fromiter(self._virtual_items, dtype=np.int64, count=len(self._virtual_items))
+        for pad in np.setdiff1d(current, needed, assume_unique=True).tolist():
+            item = self._virtual_items.pop(pad)
+            item.setVisible(False)
+            self._virtual_pool.append(item)
+
+        if self._virtual_group is None:
+            self._virtual_group = QGraphicsItemGroup()
+            self._virtual_group.setParentItem(self._board_root)
+            self._virtual_group.setZValue(1)
+
+        for pad in np.setdiff1d(needed, current, assume_unique=True).tolist():
+            source = pads["items"][pads["pad_items"][pad]]
+            if self._virtual_pool:
+                item = self._virtual_pool.pop()
+            else:
+                item = CustomEllipseItem(0, 0, 0, 0, None, None)
+                item.setParentItem(self._virtual_group)
+            cx, cy = pads["index"].xs[pad], pads["index"].ys[pad]
+            radius = source.radius
+            item.setRect(cx - radius, cy - radius, 2 * radius, 2 * radius)
+            item.obj_id = self._pad_obj_ids(pads, pad)
+            item.base_color = source.base_color
+            item.highlight = source.highlight
+            item.setPen(QPen(source.color, source.outline_width))
+            item.setBrush(QBrush(source.color))
+            item.setOpacity(source.opacity())
+            item.setZValue(pads["item_layers"][pads["pad_items"][pad]])
+            item.setVisible(True)
+            self._virtual_items[pad] = item
+
+    def _release_virtual_items(self):
+        for item in self._virtual_items.values():
+            item.setVisible(False)
+            self._virtual_pool.append(item)
+        self._virtual_items.clear()
+
+    def _update_layer_bounds(self, layer_name: str):
+        bounds = QRectF()
+        for item in self._layer_groups[layer_name].childItems():
+            if isinstance(item, BatchedCircleLayerItem) and len(item):
+                bounds = bounds.united(item.boundingRect())
+        index = self._layer_index[layer_name]
+        if bounds.isNull():
+            self._layer_bounds[index] = [math.inf, math.inf, -math.inf, -math.inf]
+        else:
+            self._layer_bounds[index] = [bounds.left(), bounds.top(), bounds.right(), bounds.bottom()]
+        self._invalidate_layer_bounds()
+
+    def _invalidate_layer_bounds(self):
+        self._layer_bounds_array = None
+        self._tile_layers.clear()
+        self._tile_states.clear()
+
+    def _get_layer_bounds_array(self) -> np.ndarray:
+        if self._layer_bounds_array is None:
+            self._layer_bounds_array = np.array(self._layer_bounds, dtype=np.float64).reshape(-1, 4)
+        return self._layer_bounds_array
+
+    def _overlapping_layers(self, rect: QRectF) -> np.ndarray:
+        """Indexes of the layers whose circles may intersect a scene rect, in z order."""
+        bounds = self._get_layer_bounds_array()
+        rect = self._board_root.transform().inverted()[0].mapRect(rect)
+        return np.flatnonzero(
+            (bounds[:, 0] < rect.right()) & (bounds[:, 2] > rect.left())
+            & (bounds[:, 1] < rect.bottom()) & (bounds[:, 3] > rect.top())
+        )
+
+    def _tile_overlapping_layers(self, tile: tuple, tile_rect: QRectF) -> np.ndarray:
+        """_overlapping_layers() of a tile (tx, ty, zoom), scanned once per tile and kept for the current zoom."""
+        zoom = tile[2]
+        if zoom != self._tile_layers_zoom:
+            self._tile_layers.clear()
+            self._tile_states.clear()
+            self._tile_layers_zoom = zoom
+        layers = self._tile_layers.get(tile)
+        if layers is None:
+            layers = self._tile_layers[tile] = self._overlapping_layers(tile_rect)
+        return layers
+
+    def _tile_state(self, tile: tuple, tile_rect: QRectF) -> int:
+        state = self._tile_states.get(tile)
+        if state is None:
+            layers = self._tile_overlapping_layers(tile, tile_rect)
+            if self._tile_layer_state is None:
+                self._tile_layer_state = (
+                    np.array(self._layer_visible, dtype=np.uint8) | (np.array(self._layer_highlight, dtype=np.uint8) << 1)
+                )
+            state = self._tile_states[tile] = hash((layers.tobytes(), self._tile_layer_state[layers].tobytes()))
+        return state
+
+    def _circle_layer_draws(self, layer_indexes: Optional[np.ndarray] = None) -> list[CircleLayerDraw]:
+        """Detached copies of what the visible circle items draw, in z order, for the render workers."""
+        layer_groups = self._layer_group_list
+        if layer_indexes is None:
+            layer_indexes = range(len(layer_groups))
+        else:
+            layer_indexes = layer_indexes.tolist()
+
+        draws = []
+        for index in layer_indexes:
+            if not self._layer_visible[index]:
+                continue
+            layer_draws = self._layer_draws.get(index)
+            if layer_draws is None:
+                layer_draws = self._layer_draws[index] = [
+                    CircleLayerDraw(item.visible_centers(), item.radius, item.outline_width, QColor(item.color), item.opacity())
+                    for item in layer_groups[index].childItems()
+                    if isinstance(item, BatchedCircleLayerItem)
+                ]
+            draws.extend(layer_draws)
+        return draws
+
+    def _board_transform(self) -> BoardTransform:
+        transform = self._board_root.transform()
+        return BoardTransform(transform.m11(), transform.dx(), transform.dy())
+
+    def _start_raster_job(self, job_key: tuple, slot, fn, *args):
+        job = RasterJob(job_key, fn, *args)
+        job.signals.finished.connect(slot)
+        self._raster_jobs[job_key] = job
+        self._raster_pool.start(job)
+
+    def _render_tile(self, key: tuple, tile_rect: QRectF, zoom: float) -> None:
+        """Queue a tile on the render workers; it is handed to the tile item in _on_tile_rendered."""
+        job_key = ("tile", self._tile_generation, key)
+        if job_key not in self._raster_jobs:
+            self._start_raster_job(
+                job_key, self._on_tile_rendered, render_circle_tile,
+                self._circle_layer_draws(self._tile_overlapping_layers(key[:3], tile_rect)), self._board_transform(),
+                tile_rect, zoom, self._tile_item.tile_size,
+            )
+        return None
+
+    def _on_tile_rendered(self, job_key: tuple, image: Optional[QImage]):
+        self._raster_jobs.pop(job_key, None)
+        _, generation, key = job_key
+        if image is None or generation != self._tile_generation:
+            return
+        # Layers toggled while the tile was rendered: its state is outdated, a newer request is queued
+        if key[3] != self._tile_state(key[:3], self._tile_item.tile_rect(key)):
+            return
+        self._tile_item.add_tile(key, QPixmap.fromImage(image))
+
+    def _rebuild_lod(self):
+        """Rasterize the visible circle layers at the LOD resolution on a render worker."""
+        self._lod_timer.stop()
+        if self._lod_job_pending:
+            # One raster at a time; _on_lod_rendered starts the next one if still dirty
+            return
+        self._lod_dirty = False
+        if not self.has_canvas:
+            self._lod_item.clear()
+            return
+
+        self._lod_job_pending = True
+
+        lod_scale = min(self.lod_scale_threshold, RenderConfigs.LOD_MAX_RASTER_SIDE / max(self.w, self.h))
+        self._start_raster_job(
+            ("lod", self._lod_generation, self.w, self.h), self._on_lod_rendered, render_lod_raster,
+            self._circle_layer_draws(), self._board_transform(), (self.w, self.h), lod_scale,
+        )
+
+    def _on_lod_rendered(self, job_key: tuple, image: Optional[np.ndarray]):
+        self._raster_jobs.pop(job_key, None)
+        self._lod_job_pending = False
+        _, generation, w, h = job_key
+        if image is not None and generation == self._lod_generation:
+            self._lod_item.set_image(image, QRectF(0, 0, w, h))
+        if self._lod_dirty and self._circle_mode == self.RASTER:
+            self._lod_timer.start()
 
     @property
     def scale_value(self):
@@ -317,6 +994,7 @@ class CustomGraphicsView(QGraphicsView):
             self._scale_value = value
             self.resetTransform()
             self.scale(self._scale_value, self._scale_value)
+            self._update_circle_mode()
             self.update()
 
     def showEvent(self, event):
@@ -331,6 +1009,7 @@ class CustomGraphicsView(QGraphicsView):
         self.adjust_floating_widget()
         if self.pushButtonFitSize.isChecked():
             self.fit_to_view()
+        self._on_viewport_moved()
 
     def _init_floating_controls(self):
         """Initialize floating control widgets."""
@@ -371,11 +1050,16 @@ class CustomGraphicsView(QGraphicsView):
         if hasattr(self, 'floating_widget'):
             self.floating_widget.move(10, 10)
 
+    @property
+    def has_canvas(self) -> bool:
+        """Whether an image or a solid canvas is shown."""
+        return self.w > 0 and self.h > 0
+
     def fit_to_view(self):
         """Fit the image to the view."""
-        if self.image is not None:
+        if self.has_canvas:
             view_rect = self.viewport().rect()
-            img_rect = self.pixmap.rect()
+            img_rect = self.sceneRect()
             width_ratio = view_rect.width() / img_rect.width()
             height_ratio = view_rect.height() / img_rect.height()
             scale_value = min(width_ratio, height_ratio)
@@ -385,6 +1069,7 @@ class CustomGraphicsView(QGraphicsView):
         self, image: Optional[np.ndarray],
     ):
         """Display the image and update ROI annotations."""
+        self._canvas_color = None
         if image is None:
             self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
             self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -395,28 +1080,57 @@ class CustomGraphicsView(QGraphicsView):
             self.h, self.w = 0, 0
             self.image_item.setPixmap(QPixmap())  # Clear the image
             self.setSceneRect(0, 0, 0, 0)
+            self._update_circle_mode()
 
         else:
-            self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-            self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-
-            # Update the image and pixmap
-            self.image = image.copy()
+            # Update the image and pixmap (QPixmap.fromImage copies the pixels)
+            self.image = image
             self.pixmap = self.__numpy_to_pixmap(image)
-            self.h, self.w = image.shape[:2]
             self.image_item.setPixmap(self.pixmap)
+            self._set_canvas_rect(*image.shape[:2])
+
+    def set_canvas(self, width: int, height: int, color: Union[str, QColor]):
+        """
+        Show a solid-color canvas of the given size. It is painted in drawBackground,
+        so no canvas-sized pixel buffer is allocated.
+        """
+        self.image = None
+        self.pixmap = None
+        self.image_item.setPixmap(QPixmap())
+        self._canvas_color = QColor(color)
+        self._set_canvas_rect(height, width)
+        self.resetCachedContent()
+
+    def set_canvas_color(self, color: Union[str, QColor]):
+        """Change the color of the solid canvas; a repaint only."""
+        self._canvas_color = QColor(color)
+        self.resetCachedContent()
+        self.viewport().update()
+
+    def _set_canvas_rect(self, h: int, w: int):
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.h, self.w = h, w
+
+        # Reset the scene rect to match the new canvas size
+        self.setSceneRect(0, 0, self.w, self.h)
+        self._tile_item.set_rect(QRectF(0, 0, self.w, self.h))
+        self._invalidate_rasters(geometry=True)
+        self._update_circle_mode()
+
+        # Fit the canvas to the view
+        if self.pushButtonFitSize.isChecked():
+            self.fit_to_view()
 
-            # Reset the scene rect to match the new image size
-            self.setSceneRect(0, 0, self.w, self.h)
-
-            # Fit the image to the view
-            if self.pushButtonFitSize.isChecked():
-                self.fit_to_view()
+    def drawBackground(self, painter: QPainter, rect: QRectF):
+        super().drawBackground(painter, rect)
+        if self._canvas_color is not None:
+            painter.fillRect(rect.intersected(self.sceneRect()), self._canvas_color)
 
     @staticmethod
     def __numpy_to_pixmap(np_image: np.ndarray) -> QPixmap:
         """Convert a numpy array to a QPixmap."""
-        np_image = np_image.astype(np.uint8)
+        np_image = np.ascontiguousarray(np_image, dtype=np.uint8)
         if np_image.ndim == 2:
             qformat = QImage.Format.Format_Indexed8
         elif np_image.shape[2] == 3:
@@ -487,8 +1201,8 @@ class CustomGraphicsView(QGraphicsView):
 
         act_copy_origin = menu.addAction("Copy Image")
 
-        # Disable actions if self.image is None
-        if self.image is None:
+        # Disable actions if nothing is shown
+        if not self.has_canvas:
             act_copy_origin.setDisabled(True)
 
         # Use event.globalPos() in contextMenuEvent
@@ -496,8 +1210,115 @@ class CustomGraphicsView(QGraphicsView):
         if selected_action:
             self.copy_image_to_clipboard()
 
+    def _init_hover_panel(self):
+        """Floating label showing the hovered pad; its text comes from the pad_hovered_signal receiver."""
+        self.hover_panel = QLabel(self)
+        self.hover_panel.setObjectName("hover_panel")
+        self.hover_panel.setStyleSheet(
+            "#hover_panel {background-color: rgba(255, 255, 255, 230); border: 1px solid rgb(160, 160, 160); padding: 4px;}"
+        )
+        self.hover_panel.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.hover_panel.hide()
+
+    def show_hover_info(self, text: str):
+        """Show `text` next to the mouse for the currently hovered pad."""
+        if self._hover_pos is None:
+            return
+        self.hover_panel.setText(text)
+        self.hover_panel.adjustSize()
+        self._move_hover_panel()
+        self.hover_panel.show()
+        self.hover_panel.raise_()
+
+    def _move_hover_panel(self):
+        pos = self.viewport().mapTo(self, self._hover_pos) + QPoint(16, 16)
+        # Keep the panel inside the view, flipping it to the other side of the cursor near the edges
+        if pos.x() + self.hover_panel.width() > self.width():
+            pos.setX(pos.x() - self.hover_panel.width() - 24)
+        if pos.y() + self.hover_panel.height() > self.height():
+            pos.setY(pos.y() - self.hover_panel.height() - 24)
+        self.hover_panel.move(pos)
+
+    def _update_hover(self):
+        """Find the visible pad nearest to the mouse without touching the scene items."""
+        if self._hover_pos is None or self._panning or not self._layer_index:
+            self._set_hovered(None)
+            return
+
+        pads = self._get_circle_pads()
+        transform, _ = self._board_root.transform().inverted()
+        board_pos = transform.map(self.mapToScene(self._hover_pos))
+        x, y = board_pos.x(), board_pos.y()
+        pixel = transform.m11() / max(self._scale_value, 1e-9)  # Board units per screen pixel
+        tolerance = RenderConfigs.HOVER_TOLERANCE_PX * pixel
+        max_radius = pads["item_radii"].max() if len(pads["items"]) else 0.0
+        nearby = self._shown_pads(pads, pads["index"].query_radius(x, y, max_radius + tolerance))
+        if len(nearby):
+            xs, ys = pads["index"].xs[nearby], pads["index"].ys[nearby]
+            gaps = np.hypot(xs - x, ys - y) - pads["item_radii"][pads["pad_items"][nearby]]
+            nearest = int(np.argmin(gaps))
+            if gaps[nearest] <= tolerance:
+                self._set_hovered(self._pad_obj_ids(pads, nearby[nearest]))
+                self._move_hover_panel()
+                return
+        self._set_hovered(None)
+
+    def _set_hovered(self, obj_id: Any):
+        if obj_id is None:
+            self.hover_panel.hide()
+        if obj_id != self._hover_obj_id:
+            self._hover_obj_id = obj_id
+            self.pad_hovered_signal.emit(obj_id)
+
+    def leaveEvent(self, event):
+        self._hover_pos = None
+        self._hover_timer.stop()
+        self._set_hovered(None)
+        super().leaveEvent(event)
+
+    def region_obj_ids(self, polygon: np.ndarray) -> np.ndarray:
+        """obj_ids of the circles of visible layers inside a polygon ((M, 2) vertices in board units)."""
+        if not self._layer_index:
+            return np.empty(0, dtype=object)
+        pads = self._get_circle_pads()
+        return self._pad_obj_ids(pads, self._shown_pads(pads, pads["index"].query_polygon(polygon)))
+
+    def _region_polygon(self) -> np.ndarray:
+        """The region being drawn, in board units."""
+        if self._region_mode == "rect":
+            rect = QRectF(self._region_points[0], self._region_points[-1]).normalized()
+            points = [rect.topLeft(), rect.topRight(), rect.bottomRight(), rect.bottomLeft()]
+        else:
+            points = self._region_points
+        transform, _ = self._board_root.transform().inverted()
+        return np.array([(p.x(), p.y()) for p in map(transform.map, points)], dtype=np.float64).reshape(-1, 2)
+
+    def _emit_region_selection(self, finished: bool):
+        self._region_timer.stop()
+        if self._region_mode is not None:
+            self.region_selected_signal.emit(self.region_obj_ids(self._region_polygon()), finished)
+
+    def _extend_region(self, pos: QPoint):
+        point = self.mapToScene(pos)
+        if self._region_mode == "rect":
+            self._region_points[1:] = [point]
+        elif (point - self._region_points[-1]).manhattanLength() * self._scale_value >= 3:
+            # Lasso vertices closer than a few pixels add cost without changing the selection
+            self._region_points.append(point)
+        self.viewport().update()
+        if not self._region_timer.isActive():
+            self._region_timer.start()
+
     def mousePressEvent(self, event: QMouseEvent):
-        if event.button() == Qt.MouseButton.LeftButton:
+        modifiers = event.modifiers()
+        if event.button() == Qt.MouseButton.LeftButton and modifiers & (
+            Qt.KeyboardModifier.ShiftModifier | Qt.KeyboardModifier.AltModifier
+        ):
+            self._region_mode = "rect" if modifiers & Qt.KeyboardModifier.ShiftModifier else "lasso"
+            self._region_points = [self.mapToScene(event.pos())]
+            self._set_hovered(None)
+            event.accept()
+        elif event.button() == Qt.MouseButton.LeftButton:
             self._panning = True
             self._pan_start = event.pos()
             self.setCursor(Qt.CursorShape.ClosedHandCursor)
@@ -506,6 +1327,10 @@ class CustomGraphicsView(QGraphicsView):
             super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event: QMouseEvent):
+        if self._region_mode is not None:
+            self._extend_region(event.pos())
+            event.accept()
+            return
         if self._panning:
             delta = event.pos() - self._pan_start
             self._pan_start = event.pos()
@@ -514,9 +1339,19 @@ class CustomGraphicsView(QGraphicsView):
             event.accept()
         else:
             super().mouseMoveEvent(event)
+        self._hover_pos = event.pos()
+        if not self._hover_timer.isActive():
+            self._hover_timer.start()
 
     def mouseReleaseEvent(self, event: QMouseEvent):
-        if event.button() == Qt.MouseButton.LeftButton and self._panning:
+        if event.button() == Qt.MouseButton.LeftButton and self._region_mode is not None:
+            self._extend_region(event.pos())
+            self._emit_region_selection(finished=True)
+            self._region_mode = None
+            self._region_points = []
+            self.viewport().update()
+            event.accept()
+        elif event.button() == Qt.MouseButton.LeftButton and self._panning:
             self._panning = False
             self.setCursor(Qt.CursorShape.ArrowCursor)
             event.accept()
@@ -536,6 +1371,17 @@ class CustomGraphicsView(QGraphicsView):
         painter.fillRect(rect.adjusted(-2, -2, 2, 2), Qt.GlobalColor.white)
         painter.drawText(rect, Qt.AlignmentFlag.AlignRight, text)
 
+        # Region being selected
+        if self._region_mode is not None and len(self._region_points) > 1:
+            painter.setPen(QPen(QColor(0, 120, 215), 1, Qt.PenStyle.DashLine))
+            painter.setBrush(QColor(0, 120, 215, 40))
+            if self._region_mode == "rect":
+                painter.drawRect(QRectF(
+                    self.mapFromScene(self._region_points[0]).toPointF(), self.mapFromScene(self._region_points[-1]).toPointF()
+                ).normalized())
+            else:
+                painter.drawPolygon(self.mapFromScene(QPolygonF(self._region_points)))
+
         # 如果控件被禁用，繪製遮罩層
         if not self.isEnabled():
             # 創建半透明灰色遮罩
@@ -567,18 +1413,20 @@ class CustomGraphicsView(QGraphicsView):
         return new_group
 
     def copy_image_to_clipboard(self) -> None:
-        if self.image is None:
+        if not self.has_canvas:
             return
 
-        # Get the bounding rectangle of the base image
-        rect = self.image_item.boundingRect()
-        if rect.isNull():
-            return
+        # The canvas area of the scene
+        rect = self.sceneRect()
 
-        # Create a transparent QImage
+        # Create a QImage, filled with the solid canvas color (the scene does not paint it) or transparent
         img_w, img_h = int(rect.width()), int(rect.height())
         image = QImage(img_w, img_h, QImage.Format.Format_ARGB32)
-        image.fill(Qt.GlobalColor.transparent)
+        image.fill(self._canvas_color if self._canvas_color is not None else QColor(Qt.GlobalColor.transparent))
+
+        # Render the vector layers at full resolution even when the view shows the raster
+        circle_mode = self._circle_mode
+        self._set_circle_mode(self.VECTOR)
 
         # Use scene.render to draw all visible items (including the base image and all visible layers) into the image
         painter = QPainter(image)
@@ -587,5 +1435,6 @@ class CustomGraphicsView(QGraphicsView):
         # Target: the entire image, Source: the `rect` area in the scene
         self.scene().render(painter, QRectF(0, 0, img_w, img_h), rect)
         painter.end()
+        self._set_circle_mode(circle_mode)
 
         QApplication.clipboard().setImage(image)
\ No newline at end of file
@@ -1,7 +1,7 @@
 # Built-in Imports
 import hashlib
 import math
-from typing import Union, Literal, Dict, List, Tuple, Optional, Any
+from typing import Union, Literal, Dict, List, Tuple, Optional, Any, Callable, Hashable
 
 # Data Science and Third Party Imports
 import numpy as np
@@ -13,9 +13,14 @@ from PyQt6.QtCore import Qt, QPoint, pyqtSignal, QRectF
 from PyQt6.QtWidgets import (
     QGraphicsView, QMenu, QApplication, QGraphicsPixmapItem, QGraphicsScene, QGraphicsItemGroup,
     QGraphicsRectItem, QGraphicsLineItem, QGraphicsEllipseItem, QGraphicsTextItem, QWidget, QHBoxLayout, QPushButton,
-    QGraphicsPathItem
+    QGraphicsPathItem, QGraphicsItem
 )
-from PyQt6.QtGui import QImage, QPixmap, QWheelEvent, QPainter, QPen, QMouseEvent, QColor, QBrush, QIcon, QPainterPath, QFont
+from PyQt6.QtGui import QImage, QPixmap, QWheelEvent, QPainter, QPen, QMouseEvent, QColor, QBrush, QIcon, QPainterPath, QFont, \
+    QPolygonF
+
+# User Imports
+from src.Configs import RenderConfigs
+from src.Views.CustomWidgets.TileCache import TileCache
 
 
 class CustomGraphicsItemMixin:
@@ -29,7 +34,7 @@ class CustomGraphicsItemMixin:
         color = QColor("white") if highlight else self.base_color
 
         if isinstance(self, (QGraphicsRectItem, QGraphicsEllipseItem, QGraphicsPathItem, QGraphicsLineItem)):
-            self.setPen(QPen(color, self.pen().width()))
+            self.setPen(QPen(color, self.pen().widthF()))
             if hasattr(self, "setBrush"):
                 self.setBrush(QBrush(color))
         elif isinstance(self, QGraphicsTextItem):
@@ -59,3 +64,261 @@ class CustomTextItem(QGraphicsTextItem, CustomGraphicsItemMixin):
     def __init__(self, text, base_color, obj_id):
         super().__init__(text)
         self.init_custom(base_color, obj_id)
+
+
+def numpy_to_polygon(points: np.ndarray) -> QPolygonF:
+    """Copy an (N, 2) array of x, y coordinates into a QPolygonF without per-point Python calls."""
+    points = np.ascontiguousarray(points, dtype=np.float64)
+    polygon = QPolygonF()
+    polygon.resize(len(points))
+    if len(points):
+        buffer = polygon.data()
+        buffer.setsize(points.nbytes)
+        np.frombuffer(buffer, dtype=np.float64).reshape(-1, 2)[:] = points
+    return polygon
+
+
+def circle_pen(color: QColor, radius: float, width: float) -> QPen:
+    """A point drawn with this round-capped pen is the filled circle plus its outline."""
+    pen = QPen(color, 2 * radius + width)
+    pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+    return pen
+
+
+def cull_centers(centers: np.ndarray, rect: QRectF, margin: float) -> np.ndarray:
+    """The centers whose circle, `margin` around the center, can touch `rect`."""
+    xs, ys = centers[:, 0], centers[:, 1]
+    mask = (
+        (xs >= rect.left() - margin) & (xs <= rect.right() + margin)
+        & (ys >= rect.top() - margin) & (ys <= rect.bottom() + margin)
+    )
+    return centers[mask]
+
+
+class PointCloudItem(QGraphicsItem):
+    """Draws many points with one cosmetic pen in a single drawPoints call (used for previews)."""
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray, color: QColor, point_size: float = 3):
+        super().__init__()
+        self._polygon = numpy_to_polygon(np.column_stack([xs, ys]))
+        self._bounding_rect = self._polygon.boundingRect()
+        self._pen = QPen(color, point_size)
+        self._pen.setCosmetic(True)
+        self._pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+
+    def boundingRect(self) -> QRectF:
+        return self._bounding_rect
+
+    def paint(self, painter: QPainter, option, widget=None):
+        painter.setPen(self._pen)
+        painter.drawPoints(self._polygon)
+
+
+class BatchedCircleLayerItem(QGraphicsItem, CustomGraphicsItemMixin):
+    """
+    All circles of one layer in a single item.
+
+    Centers are kept in a NumPy array and painted with one drawPoints call, using a
+    round-capped pen as wide as the circle, after culling against the exposed rect.
+    Visibility, opacity, color and highlight apply to the whole layer, like they do
+    to a layer group; single circles can still be hidden or removed by obj_id.
+    """
+
+    def __init__(self, centers: np.ndarray, radius: float, base_color: QColor, obj_ids, width: float = 2):
+        super().__init__()
+        self.init_custom(base_color, obj_id=None)
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+        self._centers = np.ascontiguousarray(centers, dtype=np.float64).reshape(-1, 2)
+        self._obj_ids = np.asarray(obj_ids)
+        self._visible = np.ones(len(self._centers), dtype=bool)
+        self._radius = radius
+        self._width = width
+        self._pen = QPen()
+        self._polygon: Optional[QPolygonF] = None  # All visible centers, built on first full paint
+        self._bounding_rect = QRectF()
+        self._update_pen(base_color)
+        self._update_geometry()
+
+    def __len__(self):
+        return len(self._centers)
+
+    @property
+    def obj_ids(self) -> np.ndarray:
+        return self._obj_ids
+
+    @property
+    def radius(self) -> float:
+        return self._radius
+
+    @property
+    def outline_width(self) -> float:
+        return self._width
+
+    @property
+    def color(self) -> QColor:
+        """Current paint color, white while highlighted."""
+        return self._pen.color()
+
+    def visible_objects(self) -> tuple[np.ndarray, np.ndarray]:
+        """Centers and obj_ids of the circles that are not hidden by set_object_visibility."""
+        return self._centers[self._visible], self._obj_ids[self._visible]
+
+    def visible_centers(self) -> np.ndarray:
+        # The array is never modified in place, so it can be handed to render workers
+        return self._centers if self._visible.all() else self._centers[self._visible]
+
+    def set_radius(self, radius: float, width: float):
+        self._radius = radius
+        self._width = width
+        self._update_pen(self._pen.color())
+        self._update_geometry()
+
+    def set_highlight(self, highlight: bool):
+        self.highlight = highlight
+        self._update_pen(QColor("white") if highlight else self.base_color)
+        self.update()
+
+    def set_object_visibility(self, obj_id, visible: bool):
+        mask = self._obj_ids == obj_id
+        if mask.any():
+            self._visible[mask] = visible
+            self._polygon = None
+            self.update()
+
+    def remove_objects(self, obj_ids) -> None:
+        if isinstance(obj_ids, (set, frozenset)):
+            obj_ids = list(obj_ids)
+        keep = ~np.isin(self._obj_ids, obj_ids)
+        if not keep.all():
+            self._centers = self._centers[keep]
+            self._obj_ids = self._obj_ids[keep]
+            self._visible = self._visible[keep]
+            self._update_geometry()
+
+    def _update_pen(self, color: QColor):
+        self._pen = circle_pen(color, self._radius, self._width)
+
+    def _update_geometry(self):
+        self.prepareGeometryChange()
+        self._polygon = None
+        if len(self._centers):
+            margin = self._radius + self._width
+            (x_min, y_min), (x_max, y_max) = self._centers.min(axis=0), self._centers.max(axis=0)
+            self._bounding_rect = QRectF(x_min, y_min, x_max - x_min, y_max - y_min).adjusted(-margin, -margin, margin, margin)
+        else:
+            self._bounding_rect = QRectF()
+
+    def boundingRect(self) -> QRectF:
+        return self._bounding_rect
+
+    def paint(self, painter: QPainter, option, widget=None):
+        exposed = option.exposedRect
+        if exposed.contains(self._bounding_rect):
+            if self._polygon is None:
+                self._polygon = numpy_to_polygon(self._centers[self._visible])
+            polygon = self._polygon
+        else:
+            # Only the centers whose circle can touch the exposed rect
+            polygon = numpy_to_polygon(cull_centers(self.visible_centers(), exposed, self._radius + self._width))
+
+        painter.setPen(self._pen)
+        painter.drawPoints(polygon)
+
+
+class LodRasterItem(QGraphicsItem):
+    """
+    Pre-rendered image of the component layers, stretched over the canvas rect.
+    Shown instead of the vector layers when the view is zoomed out far enough that
+    every circle is only a few pixels wide.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._pixmap = QPixmap()
+        self._rect = QRectF()
+
+    def set_image(self, image: np.ndarray, canvas_rect: QRectF):
+        """`image` is an (H, W, 4) RGBA array covering `canvas_rect`."""
+        image = np.ascontiguousarray(image, dtype=np.uint8)
+        qimage = QImage(image.data, image.shape[1], image.shape[0], image.strides[0], QImage.Format.Format_RGBA8888)
+        self.prepareGeometryChange()
+        self._pixmap = QPixmap.fromImage(qimage)
+        self._rect = QRectF(canvas_rect)
+        self.update()
+
+    def clear(self):
+        self.prepareGeometryChange()
+        self._pixmap = QPixmap()
+        self._rect = QRectF()
+
+    def boundingRect(self) -> QRectF:
+        return self._rect
+
+    def paint(self, painter: QPainter, option, widget=None):
+        if not self._pixmap.isNull():
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            painter.drawPixmap(self._rect, self._pixmap, QRectF(self._pixmap.rect()))
+
+
+class TiledLayerItem(QGraphicsItem):
+    """
+    Draws content through a TileCache. The exposed area is split into tiles of a
+    fixed device-pixel size per zoom level; cached tiles are blitted and only the
+    missing ones are requested with render_tile(key, tile_rect, zoom). It returns the
+    tile, or None when the tile is rendered in the background and handed in later
+    through add_tile(); until then the previous content of that tile is shown.
+    tile_state((tx, ty, zoom), tile_rect) returns a hash of everything the tile content
+    depends on; it is called for every exposed tile on every paint, so it should be cached.
+    """
+
+    def __init__(
+        self,
+        cache: TileCache,
+        render_tile: Callable[[tuple, QRectF, float], Optional[QPixmap]],
+        tile_state: Callable[[tuple, QRectF], Hashable],
+        tile_size: int = RenderConfigs.TILE_SIZE,
+    ):
+        super().__init__()
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+        self.cache = cache
+        self.tile_size = tile_size
+        self._render_tile = render_tile
+        self._tile_state = tile_state
+        self._rect = QRectF()
+
+    def set_rect(self, rect: QRectF):
+        self.prepareGeometryChange()
+        self._rect = QRectF(rect)
+
+    def tile_rect(self, key: tuple) -> QRectF:
+        tx, ty, zoom = key[:3]
+        span = self.tile_size / zoom
+        return QRectF(tx * span, ty * span, span, span)
+
+    def add_tile(self, key: tuple, pixmap: QPixmap):
+        self.cache.put(key, pixmap)
+        self.update(self.tile_rect(key))
+
+    def boundingRect(self) -> QRectF:
+        return self._rect
+
+    def paint(self, painter: QPainter, option, widget=None):
+        zoom = round(painter.worldTransform().m11(), 4)
+        exposed = option.exposedRect.intersected(self._rect)
+        if zoom <= 0 or exposed.isEmpty():
+            return
+
+        span = self.tile_size / zoom  # Scene units per tile
+        for ty in range(math.floor(exposed.top() / span), math.ceil(exposed.bottom() / span)):
+            for tx in range(math.floor(exposed.left() / span), math.ceil(exposed.right() / span)):
+                tile_rect = QRectF(tx * span, ty * span, span, span)
+                key = (tx, ty, zoom, self._tile_state((tx, ty, zoom), tile_rect))
+                pixmap = self.cache.get(key)
+                if pixmap is None:
+                    pixmap = self._render_tile(key, tile_rect, zoom)
+                    if pixmap is None:
+                        pixmap = self.cache.get_previous(key)
+                    else:
+                        self.cache.put(key, pixmap)
+                if pixmap is not None:
+                    painter.drawPixmap(tile_rect, pixmap, QRectF(pixmap.rect()))
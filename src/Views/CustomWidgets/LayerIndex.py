@@ -0,0 +1,84 @@
+# Built-in Imports
+from typing import Any, Hashable, Iterable, Mapping, Optional
+
+# Data Science and Third Party Imports
+import numpy as np
+
+
+class LayerIndex:
+    """
+    Inverted index over layer attributes.
+
+    Layers get consecutive ids in the order they are added. Every (attribute, value)
+    pair maps to the sorted ids of the layers carrying it, so a conjunctive query is
+    an intersection of a few posting lists, smallest first, instead of one boolean
+    mask per condition over all layers. Attributes that are None are not indexed.
+    """
+
+    def __init__(self, attributes: Iterable[str]):
+        self._attributes = tuple(attributes)
+        self._names: list[str] = []
+        self._postings: dict[str, dict[Hashable, list[int]]] = {name: {} for name in self._attributes}
+        self._arrays: dict[tuple[str, Hashable], np.ndarray] = {}  # Posting lists as arrays, until the next add
+
+    def __len__(self):
+        return len(self._names)
+
+    @property
+    def names(self) -> list[str]:
+        """Layer names by id."""
+        return self._names
+
+    def add(self, name: str, info: Mapping[str, Any]) -> int:
+        """Index a layer's attributes; returns its id."""
+        layer_id = len(self._names)
+        self._names.append(name)
+        for attribute in self._attributes:
+            value = info.get(attribute)
+            if value is not None:
+                self._postings[attribute].setdefault(value, []).append(layer_id)
+                self._arrays.pop((attribute, value), None)
+                self._arrays.pop((attribute, None), None)
+        return layer_id
+
+    def clear(self):
+        self._names.clear()
+        for postings in self._postings.values():
+            postings.clear()
+        self._arrays.clear()
+
+    def query(self, **conditions: Optional[Hashable]) -> np.ndarray:
+        """Ids of the layers matching every condition, in ascending order; None means any value."""
+        postings = [self._posting(attribute, value) for attribute, value in conditions.items() if value is not None]
+        if not postings:
+            return np.arange(len(self._names), dtype=np.int64)
+
+        postings.sort(key=len)
+        result = postings[0]
+        for posting in postings[1:]:
+            if not len(result):
+                break
+            result = np.intersect1d(result, posting, assume_unique=True)
+        return result
+
+    def query_many(self, conditions_list: Iterable[Mapping[str, Optional[Hashable]]]) -> list[np.ndarray]:
+        """Answer several conjunctive queries in one call; posting lists are shared between them."""
+        return [self.query(**conditions) for conditions in conditions_list]
+
+    def with_attribute(self, attribute: str) -> np.ndarray:
+        """Ids of the layers that have any value for `attribute`, in ascending order."""
+        key = (attribute, None)
+        if key not in self._arrays:
+            postings = list(self._postings[attribute].values())
+            self._arrays[key] = (
+                np.unique(np.concatenate(postings)) if postings else np.empty(0, dtype=np.int64)
+            )
+        return self._arrays[key]
+
+    def _posting(self, attribute: str, value: Hashable) -> np.ndarray:
+        key = (attribute, value)
+        posting = self._arrays.get(key)
+        if posting is None:
+            # Ids are appended in increasing order, so the list is already sorted
+            posting = self._arrays[key] = np.array(self._postings[attribute].get(value, ()), dtype=np.int64)
+        return posting
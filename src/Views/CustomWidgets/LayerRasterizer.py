@@ -0,0 +1,122 @@
+# Built-in Imports
+import math
+from collections import defaultdict
+from typing import Any, Callable, Hashable, NamedTuple
+
+# Data Science and Third Party Imports
+import numpy as np
+
+# PyQt Imports
+from PyQt6.QtCore import QObject, QRectF, QRunnable, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QImage, QPainter
+
+# User Imports
+from src.Utils.RasterUtils import rasterize_circles
+from src.Views.CustomWidgets.CustomGraphicsViewItems import circle_pen, cull_centers, numpy_to_polygon
+
+# Logger
+import logging
+logger = logging.getLogger(__name__)
+
+
+class CircleLayerDraw(NamedTuple):
+    """What a worker needs to draw one circle item, detached from the QGraphicsItem."""
+    centers: np.ndarray     # (N, 2) board units
+    radius: float
+    width: float
+    color: QColor
+    opacity: float
+
+
+class BoardTransform(NamedTuple):
+    """canvas = board * scale + (dx, dy)"""
+    scale: float
+    dx: float
+    dy: float
+
+
+def render_circle_tile(
+    layers: list[CircleLayerDraw], board_transform: BoardTransform, tile_rect: QRectF, zoom: float, size: int
+) -> QImage:
+    """Paint circle layers, in order, into a `size` x `size` tile showing `tile_rect` (canvas units) at `zoom`."""
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+
+    # The tile in board units, for culling
+    scale, dx, dy = board_transform
+    exposed = QRectF(
+        (tile_rect.left() - dx) / scale, (tile_rect.top() - dy) / scale,
+        tile_rect.width() / scale, tile_rect.height() / scale,
+    )
+
+    painter = QPainter(image)
+    painter.scale(zoom, zoom)
+    painter.translate(-tile_rect.left() + dx, -tile_rect.top() + dy)
+    painter.scale(scale, scale)
+    for layer in layers:
+        centers = cull_centers(layer.centers, exposed, layer.radius + layer.width)
+        if len(centers):
+            painter.setOpacity(layer.opacity)
+            painter.setPen(circle_pen(layer.color, layer.radius, layer.width))
+            painter.drawPoints(numpy_to_polygon(centers))
+    painter.end()
+    return image
+
+
+def render_lod_raster(
+    layers: list[CircleLayerDraw], board_transform: BoardTransform, canvas_size: tuple[int, int], lod_scale: float
+) -> np.ndarray:
+    """Splat circle layers, in order, into an RGBA image of the canvas at `lod_scale` pixels per canvas unit."""
+    width, height = canvas_size
+    image = np.zeros((max(math.ceil(height * lod_scale), 1), max(math.ceil(width * lod_scale), 1), 4), dtype=np.uint8)
+
+    # Board units -> raster pixels
+    scale = board_transform.scale * lod_scale
+    offset = np.array([board_transform.dx, board_transform.dy]) * lod_scale
+
+    # A circle is painted as a point with a pen of width 2 * radius + outline
+    circles = defaultdict(lambda: ([], []))  # radius -> (centers, colors)
+    for layer in layers:
+        if not len(layer.centers):
+            continue
+        centers_list, colors_list = circles[layer.radius + layer.width / 2]
+        centers_list.append(layer.centers)
+        colors_list.append(np.broadcast_to(
+            np.array(layer.color.getRgb(), dtype=np.uint8), (len(layer.centers), 4)
+        ))
+
+    for radius, (centers_list, colors_list) in circles.items():
+        rasterize_circles(
+            image, np.concatenate(centers_list) * scale + offset, radius * scale, np.concatenate(colors_list)
+        )
+    return image
+
+
+class RasterJobSignals(QObject):
+    finished = pyqtSignal(object, object)  # job key, result (None on failure)
+
+
+class RasterJob(QRunnable):
+    """
+    Runs a render function on a QThreadPool. The result comes back to the GUI thread
+    through signals.finished; the owner keeps the job referenced until then.
+    """
+
+    def __init__(self, key: Hashable, fn: Callable[..., Any], *args):
+        super().__init__()
+        self.key = key
+        self.signals = RasterJobSignals()
+        self._fn = fn
+        self._args = args
+
+    def run(self):
+        try:
+            result = self._fn(*self._args)
+        except Exception as e:
+            logger.error(f"Rasterization failed: {e}", exc_info=True)
+            result = None
+        try:
+            self.signals.finished.emit(self.key, result)
+        except RuntimeError:
+            # The view was destroyed while the job ran (e.g. on exit); nobody is waiting for it
+            pass
@@ -0,0 +1,73 @@
+# Built-in Imports
+from collections import OrderedDict
+from typing import Hashable
+
+# PyQt Imports
+from PyQt6.QtGui import QPixmap
+
+# User Imports
+from src.Configs import RenderConfigs
+
+# Type Hints
+TILE_KEY_HINT = tuple[int, int, float, Hashable]  # tx, ty, zoom, state hash
+
+
+class TileCache:
+    """
+    LRU cache of rendered tiles under a memory budget.
+
+    Tiles are keyed by (tx, ty, zoom, state hash), where the state hash covers
+    whatever the tile content depends on. Each tile position keeps at most one
+    entry: storing a tile with a new state drops the old one, so a visibility or
+    highlight change only replaces the tiles it actually touched.
+    """
+
+    def __init__(self, budget: int = RenderConfigs.TILE_CACHE_BUDGET):
+        self.budget = budget
+        self._tiles: OrderedDict[TILE_KEY_HINT, QPixmap] = OrderedDict()
+        self._slots: dict[tuple[int, int, float], TILE_KEY_HINT] = {}
+        self._bytes = 0
+
+    def __len__(self):
+        return len(self._tiles)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: TILE_KEY_HINT) -> QPixmap | None:
+        pixmap = self._tiles.get(key)
+        if pixmap is not None:
+            self._tiles.move_to_end(key)
+        return pixmap
+
+    def get_previous(self, key: TILE_KEY_HINT) -> QPixmap | None:
+        """The tile cached at the same position and zoom, whatever state it was rendered for."""
+        previous = self._slots.get(key[:3])
+        return None if previous is None else self._tiles[previous]
+
+    def put(self, key: TILE_KEY_HINT, pixmap: QPixmap):
+        previous = self._slots.get(key[:3])
+        if previous is not None:
+            self._remove(previous)
+        self._tiles[key] = pixmap
+        self._slots[key[:3]] = key
+        self._bytes += self._size_of(pixmap)
+        while self._bytes > self.budget and len(self._tiles) > 1:
+            self._remove(next(iter(self._tiles)))
+
+    def clear(self):
+        self._tiles.clear()
+        self._slots.clear()
+        self._bytes = 0
+
+    def _remove(self, key: TILE_KEY_HINT):
+        pixmap = self._tiles.pop(key, None)
+        if pixmap is not None:
+            self._bytes -= self._size_of(pixmap)
+            if self._slots.get(key[:3]) == key:
+                del self._slots[key[:3]]
+
+    @staticmethod
+    def _size_of(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
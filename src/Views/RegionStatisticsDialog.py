@@ -0,0 +1,76 @@
+# Built-in Imports
+from typing import TYPE_CHECKING, Optional
+
+# Data Science and Third Party Imports
+import pandas as pd
+
+# PyQt Imports
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QPushButton, QFileDialog,
+    QHeaderView,
+)
+
+# User Imports
+if TYPE_CHECKING:
+    from src.Models.Components.SpiComponentView import SpiComponentView
+
+# Logger
+import logging
+logger = logging.getLogger(__name__)
+
+
+class RegionStatisticsDialog(QDialog):
+    """Per component type statistics of the pads inside a region drawn on the canvas."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Region Statistics")
+        self.resize(640, 320)
+
+        self._pads: Optional["SpiComponentView"] = None
+
+        self.labelSummary = QLabel()
+        self.tableWidgetStatistics = QTableWidget()
+        self.tableWidgetStatistics.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.tableWidgetStatistics.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.pushButtonExport = QPushButton("Export Pads...")
+        self.pushButtonExport.clicked.connect(self.on_export_clicked)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        buttons.addWidget(self.pushButtonExport)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.labelSummary)
+        layout.addWidget(self.tableWidgetStatistics)
+        layout.addLayout(buttons)
+
+    def show_statistics(self, statistics: pd.DataFrame, pads: "SpiComponentView"):
+        """Fill the table from SpiComponentManager.get_statistics() and keep the pads for exporting."""
+        self._pads = pads
+        self.labelSummary.setText(f"{len(pads):,} pads selected")
+        self.pushButtonExport.setEnabled(len(pads) > 0)
+
+        table = self.tableWidgetStatistics
+        table.setRowCount(len(statistics))
+        table.setColumnCount(len(statistics.columns))
+        table.setHorizontalHeaderLabels([str(col) for col in statistics.columns])
+        table.setVerticalHeaderLabels([str(index) for index in statistics.index])
+        for row, values in enumerate(statistics.itertuples(index=False)):
+            for col, value in enumerate(values):
+                # The first column is the pad count
+                text = f"{int(value):,}" if col == 0 else f"{value:.3f}"
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                table.setItem(row, col, item)
+
+        self.show()
+        self.raise_()
+
+    def on_export_clicked(self):
+        if self._pads is None:
+            return
+        file_url, _ = QFileDialog.getSaveFileName(self, "Export Pads", "region_pads.csv", "Csv Files (*.csv)")
+        if file_url:
+            self._pads.to_frame().to_csv(file_url, index=False)
+            logger.info(f"Exported {len(self._pads):,} pads to {file_url}")
@@ -12,11 +12,12 @@ import numpy as np
 from PyQt6.QtCore import QTimer
 from PyQt6.QtGui import QMovie, QPixmap, QDragEnterEvent, QDragLeaveEvent, QAction
 from PyQt6.QtWidgets import QGridLayout, QFrame, QPushButton, QLabel, QStackedWidget, QComboBox, QLineEdit, QTreeWidget, \
-    QButtonGroup, QWidget, QFileDialog, QStatusBar
+    QButtonGroup, QWidget, QFileDialog, QStatusBar, QProgressBar
 
 from src.Utils.SystemVariable import SystemVariable
 from src.Views.CustomWidgets.CheckableTreeWidget import CheckableTreeWidget
 from src.Views.CustomWidgets.CustomGraphicsView import CustomGraphicsView
+from src.Views.RegionStatisticsDialog import RegionStatisticsDialog
 # User Imports
 from src.Views.QtDesigner.MainWindow import Ui_MainWindow
 
@@ -32,6 +33,12 @@ class SpiVisualizationSubView:
         self.system_variable: SystemVariable = SystemVariable()
 
         self.statusBar: QStatusBar = ui.statusBar
+        self.labelTaskState = QLabel()
+        self.statusBar.addPermanentWidget(self.labelTaskState)
+        self.progressBar = QProgressBar()
+        self.progressBar.setMaximumWidth(200)
+        self.progressBar.setVisible(False)
+        self.statusBar.addPermanentWidget(self.progressBar)
         self.actionSetCanvas: QAction = ui.actionSetCanvas
 
         self.frameWindow: QFrame = ui.frameWindow
@@ -59,6 +66,7 @@ class SpiVisualizationSubView:
         self.treeWidgetSelectId: CheckableTreeWidget = ui.treeWidgetSelectId
 
         self.graphicsView: CustomGraphicsView = ui.graphicsView
+        self.regionStatisticsDialog = RegionStatisticsDialog(self.graphicsView)
 
         ...
 